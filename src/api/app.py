@@ -1,16 +1,29 @@
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
-from fastapi.responses import FileResponse, HTMLResponse 
-from typing import List, Optional, Dict
-import tempfile
-import os
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, PlainTextResponse, Response
+from typing import List, Optional, Dict, Tuple
+from urllib.parse import quote
+import asyncio
+import json
+import re
+import time
+import unicodedata
 from pathlib import Path
-import shutil
 
 # Import our modules
 from src.parsers.parser_factory import get_parser
-from src.processors.skill_matcher import SkillMatcher
-from src.processors.resume_transformer import transform_parsed_resume
-from src.formatters.dynamic_resume_formatter import DynamicResumeFormatter
+from src.parsers.base_parser import BaseParser, DocumentTooLargeError, UnsupportedFormatError
+from src.parsers.parse_cache import ParseCache
+from src.pipeline import run_pipeline, run_screening, split_terms
+from src.processors.job_profile import JobProfile, JobProfileRegistry
+from src.api.executor import PipelineExecutor, PoolSaturatedError, WorkerCrashedError
+from src.jobs.job_queue import JobQueue
+from src.jobs.job_worker import JobWorkerPool
+from src.storage.blob_store import BlobStore
+from src.storage.corpus import CandidateCorpus
+from src.storage.near_duplicates import NearDuplicateIndex
+from src.storage.skill_matrix import SkillMatrix
+from src.api.metrics import MetricsRegistry, server_timing
+from src import config
 
 app = FastAPI(title="Resume Inspector AI")
 
@@ -19,6 +32,369 @@ data_dir = Path(__file__).parent.parent.parent / "data"
 output_dir = data_dir / "output"
 output_dir.mkdir(exist_ok=True, parents=True)
 
+# Repeat uploads of the same file are served from the parse cache
+parse_cache = ParseCache(
+    config.PARSE_CACHE_DIR,
+    max_entries=config.PARSE_CACHE_MEMORY_ENTRIES,
+    max_disk_bytes=config.PARSE_CACHE_DISK_BYTES
+)
+
+# Pipeline instrumentation, exposed at /metrics
+metrics_registry = MetricsRegistry()
+stage_duration = metrics_registry.histogram(
+    "resume_stage_duration_seconds",
+    "Time spent per pipeline stage (parse, dedupe, match, transform, render, screen, total)",
+    ("stage", "file_type")
+)
+upload_bytes = metrics_registry.counter("resume_upload_bytes_total", "Bytes of resumes uploaded", ("file_type",))
+parsed_pages = metrics_registry.counter("resume_pages_total", "Pages parsed", ("file_type",))
+pipeline_errors = metrics_registry.counter("resume_errors_total", "Uploads that failed to process", ("file_type",))
+parse_peak_memory = metrics_registry.histogram(
+    "resume_parse_peak_memory_bytes",
+    "Peak traced memory per parse (only with RESUME_PDF_TRACK_MEMORY=1)",
+    ("file_type",),
+    buckets=tuple(mib * 1024 * 1024 for mib in (1, 2, 5, 10, 25, 50, 100, 250, 500))
+)
+rejected_requests = metrics_registry.counter("resume_rejected_total", "Uploads rejected because the pool was saturated", ("file_type",))
+
+# Rendered documents that are not written to data/output live here
+blob_store = BlobStore(
+    config.BLOB_STORE_DIR or None,
+    ttl_seconds=config.BLOB_TTL_SECONDS,
+    max_bytes=config.BLOB_STORE_MAX_BYTES
+)
+
+# Parsed resumes kept for search when uploads opt in with store_in_corpus
+corpus = CandidateCorpus(config.CORPUS_DB_PATH, max_ngram=config.CORPUS_MAX_NGRAM)
+# Per-term hit bitsets over the corpus, for ranking it against a job spec
+skill_matrix = SkillMatrix(corpus)
+
+# MinHash/LSH index of every upload's text, to flag near-duplicate resumes
+near_duplicates = NearDuplicateIndex(
+    config.NEAR_DUPLICATE_DB_PATH,
+    threshold=config.NEAR_DUPLICATE_THRESHOLD,
+    num_perm=config.NEAR_DUPLICATE_NUM_PERM,
+    result_ttl_seconds=config.NEAR_DUPLICATE_RESULT_TTL_SECONDS
+) if config.NEAR_DUPLICATES else None
+
+# How the formatted resume is handed back:
+# "file" saves it under data/output, "blob" keeps it in the short-lived
+# blob store, "stream" returns the .docx itself as the response body
+DELIVERY_FILE = "file"
+DELIVERY_BLOB = "blob"
+DELIVERY_STREAM = "stream"
+DELIVERY_MODES = (DELIVERY_FILE, DELIVERY_BLOB, DELIVERY_STREAM)
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# Job specs registered once and referenced by id from /process-resume
+job_profiles = JobProfileRegistry(
+    max_entries=config.JOB_PROFILE_MAX_ENTRIES,
+    db_path=config.JOB_PROFILE_DB_PATH,
+    max_stored=config.JOB_PROFILE_MAX_STORED
+)
+
+# CPU-bound pipeline work runs here rather than on the event loop
+executor = PipelineExecutor(
+    mode=config.PIPELINE_EXECUTOR,
+    max_workers=config.PIPELINE_WORKERS,
+    max_in_flight=config.PIPELINE_MAX_IN_FLIGHT
+)
+
+def build_job_profile(must_have_skills: Optional[str],
+                      nice_to_have_skills: Optional[str],
+                      industry_experience: Optional[str]) -> JobProfile:
+    """Build an unregistered job profile from comma-separated form fields."""
+    return JobProfile(
+        split_terms(must_have_skills),
+        split_terms(nice_to_have_skills),
+        split_terms(industry_experience)
+    )
+
+async def resolve_job_profile(job_profile_id: Optional[str],
+                        must_have_skills: Optional[str],
+                        nice_to_have_skills: Optional[str],
+                        industry_experience: Optional[str]) -> JobProfile:
+    """
+    Return the registered profile for job_profile_id, or build one from the raw fields.
+    
+    Raises:
+        HTTPException: 400 if both are given, 404 if the profile is unknown
+    """
+    if not job_profile_id:
+        return build_job_profile(must_have_skills, nice_to_have_skills, industry_experience)
+    if must_have_skills or nice_to_have_skills or industry_experience:
+        raise HTTPException(status_code=400, detail="Pass either job_profile_id or skill lists, not both")
+    
+    job_profile = await asyncio.to_thread(job_profiles.get, job_profile_id)
+    if job_profile is None:
+        raise HTTPException(status_code=404, detail="Job profile not found, register it with POST /job-profiles")
+    return job_profile
+
+def lookup_parse_cache(content: bytes, parser: BaseParser) -> Tuple[str, Optional[Dict]]:
+    """
+    Hash an upload and look up its cached parse.
+    
+    Hashing and the disk read block, so callers run this in a thread.
+    
+    Returns:
+        Tuple of (cache key, cached parse result or None)
+    """
+    cache_key = ParseCache.make_key(content, parser)
+    return cache_key, parse_cache.get(cache_key)
+
+async def process_upload(content: bytes,
+                         job_profile: Optional[JobProfile] = None,
+                         delivery: str = DELIVERY_FILE,
+                         ranked_profiles: Optional[List[JobProfile]] = None,
+                         render: bool = True,
+                         store_in_corpus: bool = False,
+                         filename: Optional[str] = None,
+                         reuse_duplicates: bool = False) -> Tuple[Dict, Optional[bytes], Dict[str, float]]:
+    """
+    Run the full pipeline for one upload, shared by the API and job workers.
+    
+    With ranked_profiles the resume is scored against every profile and
+    the response carries a ranked list instead of a single assessment.
+    With store_in_corpus the parsed resume is also saved to the searchable
+    corpus and the response carries its corpus_id. When near-duplicate
+    detection is enabled, near-duplicates of earlier uploads are flagged,
+    and with reuse_duplicates their earlier candidate data and score are
+    reused.
+    
+    Returns:
+        Tuple of (response dict, document bytes when delivery is "stream",
+        per-stage timings in seconds)
+    
+    Raises:
+        PoolSaturatedError: If the executor has no free capacity
+        WorkerCrashedError: If the worker process died mid-pipeline
+    """
+    start = time.perf_counter()
+    file_type = "unknown"
+    try:
+        parser = get_parser(content)
+        file_type = parser.file_type
+        upload_bytes.inc(len(content), file_type=file_type)
+        
+        # Reuse the cached parse result for previously seen uploads
+        cache_key, cached_resume = await asyncio.to_thread(lookup_parse_cache, content, parser)
+        
+        # Parse, match, transform and render off the event loop
+        parsed_resume, response, document, stage_info = await executor.run(
+            run_pipeline,
+            content,
+            cached_resume,
+            job_profile,
+            output_dir if delivery == DELIVERY_FILE else None,
+            ranked_profiles,
+            render,
+            near_duplicates,
+            reuse_duplicates
+        )
+        
+        if cached_resume is None:
+            await asyncio.to_thread(parse_cache.put, cache_key, parsed_resume)
+        
+        if store_in_corpus:
+            response["corpus_id"] = await asyncio.to_thread(
+                corpus.add,
+                CandidateCorpus.content_hash(content),
+                parsed_resume,
+                response["candidate_name"],
+                filename
+            )
+        
+        if delivery == DELIVERY_BLOB and document is not None:
+            digest = await asyncio.to_thread(blob_store.put, document, response["filename"])
+            response["download_url"] = f"/blobs/{digest}"
+            document = None
+    except PoolSaturatedError:
+        rejected_requests.inc(file_type=file_type)
+        raise
+    except Exception:
+        pipeline_errors.inc(file_type=file_type)
+        raise
+    
+    timings = dict(stage_info['timings'])
+    timings['total'] = time.perf_counter() - start
+    for stage, seconds in timings.items():
+        stage_duration.observe(seconds, stage=stage, file_type=file_type)
+    if stage_info['pages']:
+        parsed_pages.inc(stage_info['pages'], file_type=file_type)
+    if stage_info['peak_memory_bytes'] is not None:
+        parse_peak_memory.observe(stage_info['peak_memory_bytes'], file_type=file_type)
+    
+    return response, document, timings
+
+async def screen_upload(content: bytes,
+                        job_profile: JobProfile,
+                        min_score: Optional[float] = None) -> Tuple[Dict, Dict[str, float]]:
+    """
+    Screen one upload, extracting only as much text as the answer needs.
+    
+    A cached parse is screened from its text; screening never fills the
+    parse cache, since it usually stops before the whole text is extracted.
+    
+    Returns:
+        Tuple of (response dict, per-stage timings in seconds)
+    
+    Raises:
+        PoolSaturatedError: If the executor has no free capacity
+        WorkerCrashedError: If the worker process died mid-pipeline
+    """
+    start = time.perf_counter()
+    file_type = "unknown"
+    try:
+        parser = get_parser(content)
+        file_type = parser.file_type
+        upload_bytes.inc(len(content), file_type=file_type)
+        
+        _, cached_resume = await asyncio.to_thread(lookup_parse_cache, content, parser)
+        response, stage_info = await executor.run(
+            run_screening,
+            content,
+            cached_resume['raw_text'] if cached_resume is not None else None,
+            job_profile,
+            min_score
+        )
+    except PoolSaturatedError:
+        rejected_requests.inc(file_type=file_type)
+        raise
+    except Exception:
+        pipeline_errors.inc(file_type=file_type)
+        raise
+    
+    timings = dict(stage_info['timings'])
+    timings['total'] = time.perf_counter() - start
+    for stage, seconds in timings.items():
+        stage_duration.observe(seconds, stage=stage, file_type=file_type)
+    if stage_info['pages']:
+        parsed_pages.inc(stage_info['pages'], file_type=file_type)
+    
+    return response, timings
+
+def content_disposition(filename: str) -> str:
+    """
+    Content-Disposition value that downloads as filename, whatever it contains.
+    
+    Headers must be Latin-1, so non-ASCII names go in the RFC 5987
+    filename* parameter, with an ASCII-only filename for older clients.
+    """
+    fallback = unicodedata.normalize('NFKD', filename).encode('ascii', 'ignore').decode('ascii')
+    fallback = re.sub(r'[^A-Za-z0-9._-]+', '_', fallback).strip('_') or 'resume.docx'
+    return f"attachment; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+def pipeline_response(response: Dict, document: Optional[bytes], timings: Dict[str, float], delivery: str) -> Response:
+    """Wrap a pipeline result as JSON, or as the .docx itself for delivery="stream"."""
+    if delivery == DELIVERY_STREAM and document is not None:
+        return Response(
+            content=document,
+            media_type=DOCX_MEDIA_TYPE,
+            headers={
+                "Content-Disposition": content_disposition(response["filename"]),
+                "X-Resume-Result": json.dumps(response),
+                "Server-Timing": server_timing(timings)
+            }
+        )
+    return JSONResponse(response, headers={"Server-Timing": server_timing(timings)})
+
+async def collect_ranked_profiles(job_profile_ids: Optional[str], job_specs: Optional[str]) -> List[JobProfile]:
+    """
+    Gather the profiles to rank: registered ids first, then inline specs.
+    
+    Raises:
+        HTTPException: 400 for malformed or too many specs, 404 for unknown ids
+    """
+    profiles = []
+    for job_profile_id in split_terms(job_profile_ids):
+        job_profile = await asyncio.to_thread(job_profiles.get, job_profile_id)
+        if job_profile is None:
+            raise HTTPException(status_code=404, detail=f"Job profile not found: {job_profile_id}")
+        profiles.append(job_profile)
+    
+    if job_specs:
+        try:
+            specs = json.loads(job_specs)
+            if not isinstance(specs, list):
+                raise ValueError("expected a list")
+            for spec in specs:
+                # Each field may be a comma-separated string or a list of terms
+                fields = [spec.get(key) or [] for key in ("must_have_skills", "nice_to_have_skills", "industry_experience")]
+                profiles.append(JobProfile(*[
+                    split_terms(value) if isinstance(value, str) else [str(term).strip() for term in value if str(term).strip()]
+                    for value in fields
+                ]))
+        except (ValueError, AttributeError, TypeError) as e:
+            raise HTTPException(status_code=400, detail=f"job_specs must be a JSON list of job spec objects: {e}")
+    
+    if not profiles:
+        raise HTTPException(status_code=400, detail="Pass job_profile_ids and/or job_specs")
+    if len(profiles) > config.RANK_MAX_PROFILES:
+        raise HTTPException(status_code=400, detail=f"At most {config.RANK_MAX_PROFILES} job specs can be ranked at once")
+    return profiles
+
+async def process_job(content: bytes,
+                      must_have_skills: Optional[str] = None,
+                      nice_to_have_skills: Optional[str] = None,
+                      industry_experience: Optional[str] = None,
+                      delivery: str = DELIVERY_FILE) -> Dict:
+    """Process a queued job; jobs never stream their document."""
+    job_profile = build_job_profile(must_have_skills, nice_to_have_skills, industry_experience)
+    response, _, _ = await process_upload(content, job_profile, delivery)
+    return response
+
+# Durable queue for POST /jobs, drained by background workers
+job_queue = JobQueue(config.JOB_DB_PATH)
+job_workers = JobWorkerPool(
+    job_queue,
+    process_job,
+    workers=config.JOB_WORKERS,
+    poll_interval=config.JOB_POLL_INTERVAL_SECONDS,
+    lease_seconds=config.JOB_LEASE_SECONDS
+)
+
+# How often expired files are deleted from data/output
+OUTPUT_PRUNE_INTERVAL_SECONDS = 10 * 60
+_output_pruner = None
+
+def prune_output_dir() -> int:
+    """
+    Delete rendered resumes older than OUTPUT_RETENTION_SECONDS.
+    
+    Returns:
+        Number of files deleted
+    """
+    cutoff = time.time() - config.OUTPUT_RETENTION_SECONDS
+    deleted = 0
+    for path in output_dir.glob('*.docx'):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                deleted += 1
+        except FileNotFoundError:
+            # Pruned by another server process
+            continue
+    return deleted
+
+async def prune_output_periodically():
+    while True:
+        await asyncio.to_thread(prune_output_dir)
+        await asyncio.sleep(OUTPUT_PRUNE_INTERVAL_SECONDS)
+
+@app.on_event("startup")
+async def start_job_workers():
+    global _output_pruner
+    job_workers.start()
+    if config.OUTPUT_RETENTION_SECONDS:
+        _output_pruner = asyncio.create_task(prune_output_periodically())
+
+@app.on_event("shutdown")
+async def shutdown_workers():
+    if _output_pruner is not None:
+        _output_pruner.cancel()
+    await job_workers.stop()
+    executor.shutdown()
+
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """
@@ -41,7 +417,41 @@ async def root():
             
             <div class="endpoint">
                 <strong>POST /process-resume</strong>
-                <p>Upload and process a resume file against specified skills.</p>
+                <p>Upload and process a resume file against specified skills.
+                Set <code>delivery</code> to <code>stream</code> to get the .docx back directly,
+                or <code>blob</code> to download it from a short-lived link.
+                With <code>RESUME_NEAR_DUPLICATES=1</code>, near-duplicates of earlier uploads are flagged; set <code>reuse_duplicates</code>
+                to reuse their earlier score instead of recomputing it (only when the server
+                keeps results, see <code>RESUME_NEAR_DUPLICATE_RESULT_TTL_SECONDS</code>).</p>
+            </div>
+            
+            <div class="endpoint">
+                <strong>POST /screen-resume</strong>
+                <p>Check a resume for all must-have skills, or against a <code>min_score</code>,
+                reading pages or paragraphs only until the answer is known.</p>
+            </div>
+            
+            <div class="endpoint">
+                <strong>POST /job-profiles</strong>
+                <p>Register a job spec once; pass the returned <code>job_profile_id</code> to
+                <code>/process-resume</code> instead of the skill lists.
+                <code>PUT /job-profiles/{id}</code> edits a spec and re-ranks stored candidates,
+                evaluating only the terms it adds.</p>
+            </div>
+            
+            <div class="endpoint">
+                <strong>POST /rank-resume</strong>
+                <p>Score one resume against many job specs in a single pass and get them ranked.</p>
+            </div>
+            
+            <div class="endpoint">
+                <strong>GET /corpus/search?q=Apex AND CPQ AND NOT NetSuite</strong>
+                <p>Search resumes stored with <code>store_in_corpus</code> using AND, OR and NOT.</p>
+            </div>
+            
+            <div class="endpoint">
+                <strong>POST /corpus/rank</strong>
+                <p>Top-k stored candidates for a job spec, with an optional minimum score.</p>
             </div>
             
             <div class="endpoint">
@@ -49,6 +459,26 @@ async def root():
                 <p>Download a processed resume file.</p>
             </div>
             
+            <div class="endpoint">
+                <strong>POST /jobs</strong>
+                <p>Queue a resume for background processing; poll <code>GET /jobs/{job_id}</code> for the result.</p>
+            </div>
+            
+            <div class="endpoint">
+                <strong>GET /metrics</strong>
+                <p>Per-stage latency and throughput metrics in Prometheus format.</p>
+            </div>
+            
+            <div class="endpoint">
+                <strong>GET /parse-cache/stats</strong>
+                <p>Parse cache hit/miss counters.</p>
+            </div>
+            
+            <div class="endpoint">
+                <strong>GET /blob-store/stats</strong>
+                <p>Number and total size of rendered documents in the blob store.</p>
+            </div>
+            
             <p>For API documentation, visit <a href="/docs">/docs</a></p>
         </body>
     </html>
@@ -58,7 +488,11 @@ async def process_resume(
     resume_file: UploadFile = File(...),
     must_have_skills: str = Form(None),
     nice_to_have_skills: Optional[str] = Form(None),
-    industry_experience: Optional[str] = Form(None)
+    industry_experience: Optional[str] = Form(None),
+    job_profile_id: Optional[str] = Form(None),
+    delivery: str = Form(DELIVERY_FILE),
+    store_in_corpus: bool = Form(False),
+    reuse_duplicates: bool = Form(False)
 ):
     """
     Process a resume file and evaluate against required skills.
@@ -68,82 +502,406 @@ async def process_resume(
         must_have_skills: Comma-separated list of required skills
         nice_to_have_skills: Comma-separated list of nice-to-have skills
         industry_experience: Comma-separated list of required industry experience
+        job_profile_id: Id from POST /job-profiles, instead of the skill lists
+        delivery: "file" (default), "blob" or "stream"
+        store_in_corpus: Also keep the parsed resume for GET /corpus/search
+        reuse_duplicates: If the resume nearly duplicates an earlier upload
+            scored against the same spec, reuse that candidate data and score
+            (kept for RESUME_NEAR_DUPLICATE_RESULT_TTL_SECONDS, default none)
         
     Returns:
         JSON response with scoring results and a link to the formatted resume
+        (plus "near_duplicate" with the earlier upload's content_hash and
+        similarity when detection is enabled and the resume nearly
+        duplicates one),
+        or with delivery="stream" the formatted .docx itself, with the JSON
+        result in the X-Resume-Result header
     """
-    # Save uploaded file to a temporary location
-    with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(resume_file.filename)[1]) as temp_file:
-        temp_file_path = temp_file.name
-        shutil.copyfileobj(resume_file.file, temp_file)
+    if delivery not in DELIVERY_MODES:
+        raise HTTPException(status_code=400, detail=f"delivery must be one of {', '.join(DELIVERY_MODES)}")
+    job_profile = await resolve_job_profile(job_profile_id, must_have_skills, nice_to_have_skills, industry_experience)
+    content = await resume_file.read()
     
     try:
-        # Parse resume
-        parser = get_parser(temp_file_path)
-        parsed_resume = parser.parse()
-        
-        # Process skills if provided
-        skill_matches = None
-        if must_have_skills:
-            # Convert comma-separated strings to lists
-            must_have_list = [s.strip() for s in must_have_skills.split(',') if s.strip()]
-            nice_to_have_list = [s.strip() for s in (nice_to_have_skills or "").split(',') if s.strip()]
-            industry_list = [s.strip() for s in (industry_experience or "").split(',') if s.strip()]
-            
-            # Match skills
-            matcher = SkillMatcher()
-            skill_matches = matcher.match_skills(
-                parsed_resume['raw_text'], 
-                must_have_list,
-                nice_to_have_list,
-                industry_list
-            )
-        
-        # Transform parsed resume into candidate data format
-        candidate_data = transform_parsed_resume(parsed_resume, skill_matches)
-        
-        # Format resume
-        formatter = DynamicResumeFormatter()
+        response, document, timings = await process_upload(
+            content,
+            job_profile,
+            delivery,
+            store_in_corpus=store_in_corpus,
+            filename=resume_file.filename,
+            reuse_duplicates=reuse_duplicates
+        )
+        return pipeline_response(response, document, timings, delivery)
+    except DocumentTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except UnsupportedFormatError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    except PoolSaturatedError:
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy processing other resumes, please retry",
+            headers={"Retry-After": str(config.PIPELINE_RETRY_AFTER_SECONDS)}
+        )
+    except WorkerCrashedError:
+        raise HTTPException(
+            status_code=503,
+            detail="The worker processing this resume crashed, please retry",
+            headers={"Retry-After": str(config.PIPELINE_RETRY_AFTER_SECONDS)}
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/rank-resume")
+async def rank_resume(
+    resume_file: UploadFile = File(...),
+    job_profile_ids: Optional[str] = Form(None),
+    job_specs: Optional[str] = Form(None),
+    render: bool = Form(False),
+    delivery: str = Form(DELIVERY_FILE),
+    reuse_duplicates: bool = Form(False)
+):
+    """
+    Score one resume against many job specs and rank them.
+    
+    The resume is parsed once and its text scanned once for the terms of
+    every spec. Specs are ranked by total score; ties keep request order.
+    
+    Args:
+        resume_file: The resume file (.pdf, .docx)
+        job_profile_ids: Comma-separated ids from POST /job-profiles
+        job_specs: JSON list of objects with must_have_skills,
+            nice_to_have_skills and industry_experience (strings or lists)
+        render: Also render the formatted resume against the best match
+        delivery: "file" (default), "blob" or "stream"; used when render is set
+        reuse_duplicates: If the resume nearly duplicates an earlier upload
+            ranked against the same specs, reuse those rankings
         
-        # Create output file
-        name_part = candidate_data['name'].replace(' ', '_') if candidate_data['name'] else 'formatted'
-        output_filename = f"{name_part}_resume.docx"
-        output_path = output_dir / output_filename
+    Returns:
+        JSON with the candidate name and "rankings": one score breakdown per
+        spec, with its rank, its index in the request (ids first, then
+        job_specs) and its job_profile_id
+    """
+    if delivery not in DELIVERY_MODES:
+        raise HTTPException(status_code=400, detail=f"delivery must be one of {', '.join(DELIVERY_MODES)}")
+    ranked_profiles = await collect_ranked_profiles(job_profile_ids, job_specs)
+    content = await resume_file.read()
+    
+    try:
+        response, document, timings = await process_upload(
+            content,
+            delivery=delivery,
+            ranked_profiles=ranked_profiles,
+            render=render,
+            reuse_duplicates=reuse_duplicates
+        )
+        return pipeline_response(response, document, timings, delivery)
+    except DocumentTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except UnsupportedFormatError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    except PoolSaturatedError:
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy processing other resumes, please retry",
+            headers={"Retry-After": str(config.PIPELINE_RETRY_AFTER_SECONDS)}
+        )
+    except WorkerCrashedError:
+        raise HTTPException(
+            status_code=503,
+            detail="The worker processing this resume crashed, please retry",
+            headers={"Retry-After": str(config.PIPELINE_RETRY_AFTER_SECONDS)}
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/screen-resume")
+async def screen_resume(
+    resume_file: UploadFile = File(...),
+    must_have_skills: Optional[str] = Form(None),
+    nice_to_have_skills: Optional[str] = Form(None),
+    industry_experience: Optional[str] = Form(None),
+    job_profile_id: Optional[str] = Form(None),
+    min_score: Optional[float] = Form(None)
+):
+    """
+    Screen a resume without parsing more of it than the answer needs.
+    
+    Text is matched page by page (PDF) or paragraph by paragraph (DOCX)
+    as it is extracted. Without min_score the resume passes once every
+    must-have skill has been found; with it, once the total score reaches
+    min_score. Extraction stops as soon as the resume passes; a resume
+    that fails is read to the end, unless the spec cannot reach min_score
+    at all.
+    
+    Args:
+        resume_file: The resume file (.pdf, .docx)
+        must_have_skills: Comma-separated list of required skills
+        nice_to_have_skills: Comma-separated list of nice-to-have skills
+        industry_experience: Comma-separated list of required industry experience
+        job_profile_id: Id from POST /job-profiles, instead of the skill lists
+        min_score: Total score (0-100) to screen against instead of the
+            must-have skills
         
-        # Format and save the resume
-        formatter.format_resume(candidate_data, str(output_path))
+    Returns:
+        JSON with "passed", the "mode" and what "decided_by" it,
+        "stopped_at" with the unit ("page" or "paragraph"), how many were
+        read and the total when known, "stopped_early", and the
+        "skill_assessment" of the text read so far
+    """
+    job_profile = await resolve_job_profile(job_profile_id, must_have_skills, nice_to_have_skills, industry_experience)
+    if min_score is None and not job_profile.must_have_skills:
+        raise HTTPException(status_code=400, detail="Pass must_have_skills or a min_score to screen against")
+    content = await resume_file.read()
+    
+    try:
+        response, timings = await screen_upload(content, job_profile, min_score)
+        return JSONResponse(response, headers={"Server-Timing": server_timing(timings)})
+    except DocumentTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except UnsupportedFormatError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    except PoolSaturatedError:
+        raise HTTPException(
+            status_code=503,
+            detail="Server is busy processing other resumes, please retry",
+            headers={"Retry-After": str(config.PIPELINE_RETRY_AFTER_SECONDS)}
+        )
+    except WorkerCrashedError:
+        raise HTTPException(
+            status_code=503,
+            detail="The worker processing this resume crashed, please retry",
+            headers={"Retry-After": str(config.PIPELINE_RETRY_AFTER_SECONDS)}
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/jobs")
+async def create_job(
+    resume_file: UploadFile = File(...),
+    must_have_skills: str = Form(None),
+    nice_to_have_skills: Optional[str] = Form(None),
+    industry_experience: Optional[str] = Form(None),
+    job_profile_id: Optional[str] = Form(None),
+    delivery: str = Form(DELIVERY_FILE)
+):
+    """
+    Queue a resume for background processing.
+    
+    Accepts the same fields as /process-resume and returns immediately.
+    Jobs support the "file" and "blob" delivery modes.
+    
+    Returns:
+        JSON with the job id and a URL to poll for its status
+    """
+    if delivery not in (DELIVERY_FILE, DELIVERY_BLOB):
+        raise HTTPException(status_code=400, detail="delivery must be file or blob for jobs")
+    job_profile = await resolve_job_profile(job_profile_id, must_have_skills, nice_to_have_skills, industry_experience)
+    content = await resume_file.read()
+    # Reject what no worker could parse before it is queued
+    try:
+        get_parser(content)
+    except UnsupportedFormatError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    
+    # Store the terms themselves, so the job survives profile eviction
+    params = {
+        "must_have_skills": ', '.join(job_profile.must_have_skills),
+        "nice_to_have_skills": ', '.join(job_profile.nice_to_have_skills),
+        "industry_experience": ', '.join(job_profile.industry_experience),
+        "delivery": delivery
+    }
+    job_id = await asyncio.to_thread(job_queue.enqueue, content, resume_file.filename, params)
+    job_workers.notify()
+    
+    return {
+        "job_id": job_id,
+        "status": JobQueue.PENDING,
+        "status_url": f"/jobs/{job_id}"
+    }
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    Report the status of a queued job.
+    
+    Args:
+        job_id: Id returned by POST /jobs
         
-        # Prepare response
-        response = {
-            "filename": output_filename,
-            "download_url": f"/download/{output_filename}",
-            "candidate_name": candidate_data['name']
-        }
+    Returns:
+        JSON with the job status and, once done, the same result
+        /process-resume returns (including download_url)
+    """
+    job = await asyncio.to_thread(job_queue.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@app.post("/job-profiles")
+async def create_job_profile(
+    must_have_skills: str = Form(...),
+    nice_to_have_skills: Optional[str] = Form(None),
+    industry_experience: Optional[str] = Form(None)
+):
+    """
+    Register a job spec once and reference it by id from /process-resume.
+    
+    Registering the same spec again returns the same id. Profiles are
+    stored, so every server process and later restarts see them; past
+    JOB_PROFILE_MAX_STORED the least recently registered are dropped, so
+    clients should re-register on a 404.
+    
+    Args:
+        must_have_skills: Comma-separated list of required skills
+        nice_to_have_skills: Comma-separated list of nice-to-have skills
+        industry_experience: Comma-separated list of required industry experience
         
-        if skill_matches:
-            response["skill_assessment"] = {
-                "total_score": skill_matches["total_score"],
-                "must_have_score": skill_matches["must_have"]["score"],
-                "nice_to_have_score": skill_matches["nice_to_have"]["score"],
-                "industry_score": skill_matches["industry"]["score"],
-                "education_score": skill_matches["education"]["score"],
-                "missing_must_have": skill_matches["must_have"]["missing"]
-            }
+    Returns:
+        JSON with the job_profile_id and the parsed term lists
+    """
+    job_profile = build_job_profile(must_have_skills, nice_to_have_skills, industry_experience)
+    if not job_profile.must_have_skills:
+        raise HTTPException(status_code=400, detail="must_have_skills must list at least one skill")
+    await asyncio.to_thread(job_profiles.register, job_profile)
+    return job_profile.to_dict()
+
+@app.get("/job-profiles/{job_profile_id}")
+async def get_job_profile(job_profile_id: str):
+    """
+    Return a registered job profile.
+    
+    Args:
+        job_profile_id: Id returned by POST /job-profiles
+    """
+    job_profile = await asyncio.to_thread(job_profiles.get, job_profile_id)
+    if job_profile is None:
+        raise HTTPException(status_code=404, detail="Job profile not found")
+    return job_profile.to_dict()
+
+@app.put("/job-profiles/{job_profile_id}")
+async def edit_job_profile(
+    job_profile_id: str,
+    must_have_skills: str = Form(...),
+    nice_to_have_skills: Optional[str] = Form(None),
+    industry_experience: Optional[str] = Form(None),
+    k: int = Form(50),
+    min_score: Optional[float] = Form(None)
+):
+    """
+    Edit a registered job spec and re-rank the stored corpus against it.
+
+    Profile ids are derived from their terms, so the edited spec gets a new
+    id; the old one stays registered. Term hits are cached per stored
+    resume, so only terms the corpus has never been ranked on are scanned
+    for and every other score is recomputed from the cache.
+
+    Args:
+        job_profile_id: Id of the spec being edited
+        must_have_skills: Comma-separated list of required skills
+        nice_to_have_skills: Comma-separated list of nice-to-have skills
+        industry_experience: Comma-separated list of required industry experience
+        k: Number of candidates to return (at most 1000)
+        min_score: Leave out candidates scoring below this
+
+    Returns:
+        JSON with the new job_profile, the previous_job_profile_id, the
+        added, removed and scanned terms, how many candidates' scores
+        changed, and the re-ranked candidates
+    """
+    if not 1 <= k <= 1000:
+        raise HTTPException(status_code=400, detail="k must be between 1 and 1000")
+    previous = await asyncio.to_thread(job_profiles.get, job_profile_id)
+    if previous is None:
+        raise HTTPException(status_code=404, detail="Job profile not found")
+    job_profile = build_job_profile(must_have_skills, nice_to_have_skills, industry_experience)
+    if not job_profile.must_have_skills:
+        raise HTTPException(status_code=400, detail="must_have_skills must list at least one skill")
+
+    await asyncio.to_thread(job_profiles.register, job_profile)
+    rescored = await asyncio.to_thread(skill_matrix.rescore, previous, job_profile, k, min_score)
+    return {
+        "job_profile": job_profile.to_dict(),
+        "previous_job_profile_id": previous.profile_id,
+        **rescored
+    }
+
+@app.get("/corpus/search")
+async def search_corpus(q: str, limit: int = 50, offset: int = 0):
+    """
+    Search stored resumes with a boolean skill query.
+    
+    Args:
+        q: Query such as 'Apex AND CPQ AND NOT NetSuite'; AND, OR and NOT
+            are upper-case, parentheses group and quotes mark phrases
+        limit: Maximum results to return (at most 1000)
+        offset: Results to skip, for paging
         
-        return response
+    Returns:
+        JSON with the total match count and the matching resumes
+    """
+    if not 1 <= limit <= 1000 or offset < 0:
+        raise HTTPException(status_code=400, detail="limit must be 1-1000 and offset non-negative")
+    try:
+        return await asyncio.to_thread(corpus.search, q, limit, offset)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid query: {e}")
+
+@app.post("/corpus/rank")
+async def rank_corpus(
+    must_have_skills: Optional[str] = Form(None),
+    nice_to_have_skills: Optional[str] = Form(None),
+    industry_experience: Optional[str] = Form(None),
+    job_profile_id: Optional[str] = Form(None),
+    k: int = Form(50),
+    min_score: Optional[float] = Form(None)
+):
+    """
+    Rank every stored resume against a job spec and return the best k.
+    
+    Scores use the same weighting as /process-resume. The first ranking
+    with a new term scans the corpus once for it; later rankings are
+    vectorized over stored hit bitsets.
+    
+    Args:
+        must_have_skills: Comma-separated list of required skills
+        nice_to_have_skills: Comma-separated list of nice-to-have skills
+        industry_experience: Comma-separated list of required industry experience
+        job_profile_id: Id from POST /job-profiles, instead of the skill lists
+        k: Number of candidates to return (at most 1000)
+        min_score: Leave out candidates scoring below this
         
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        # Clean up the temporary file
-        if os.path.exists(temp_file_path):
-            os.unlink(temp_file_path)
+    Returns:
+        JSON with the ranked candidates and their score breakdowns
+    """
+    if not 1 <= k <= 1000:
+        raise HTTPException(status_code=400, detail="k must be between 1 and 1000")
+    job_profile = await resolve_job_profile(job_profile_id, must_have_skills, nice_to_have_skills, industry_experience)
+    if not job_profile.must_have_skills:
+        raise HTTPException(status_code=400, detail="must_have_skills must list at least one skill")
+    
+    candidates = await asyncio.to_thread(skill_matrix.top_k, job_profile, k, min_score)
+    return {"candidates": candidates}
+
+@app.get("/corpus/{resume_id}")
+async def get_corpus_resume(resume_id: int):
+    """
+    Return a stored resume with its raw text and sections.
+    
+    Args:
+        resume_id: corpus_id from /process-resume or an id from /corpus/search
+    """
+    resume = await asyncio.to_thread(corpus.get, resume_id)
+    if resume is None:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    return resume
 
 @app.get("/download/{filename}")
 async def download_file(filename: str):
     """
     Download a processed resume file.
     
+    Files are deleted RESUME_OUTPUT_RETENTION_SECONDS after they are
+    rendered (a day by default).
+    
     Args:
         filename: Name of the file to download
         
@@ -153,4 +911,56 @@ async def download_file(filename: str):
     file_path = output_dir / filename
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="File not found")
-    return FileResponse(str(file_path), filename=filename)
\ No newline at end of file
+    return FileResponse(str(file_path), filename=filename)
+
+@app.get("/blobs/{digest}")
+async def download_blob(digest: str):
+    """
+    Download a resume rendered with delivery="blob".
+    
+    Args:
+        digest: Content digest from the download_url
+        
+    Returns:
+        The formatted .docx, until its TTL expires
+    """
+    blob = await asyncio.to_thread(blob_store.get, digest)
+    if blob is None:
+        raise HTTPException(status_code=404, detail="File not found or expired")
+    data, filename = blob
+    return Response(
+        content=data,
+        media_type=DOCX_MEDIA_TYPE,
+        headers={"Content-Disposition": content_disposition(filename)}
+    )
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Expose pipeline metrics in Prometheus text format.
+    
+    Returns:
+        Per-stage latency histograms and byte/page/error counters by file type
+    """
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/parse-cache/stats")
+async def parse_cache_stats():
+    """
+    Report parse cache hit/miss counters and sizes.
+    
+    Returns:
+        JSON with memory/disk hits, misses, evictions and current usage
+    """
+    return parse_cache.stats()
+
+@app.get("/blob-store/stats")
+async def blob_store_stats():
+    """
+    Report how many rendered documents the blob store holds.
+    
+    Returns:
+        JSON with the number of blobs and their total size, as tracked by
+        this server process
+    """
+    return blob_store.stats()
\ No newline at end of file
@@ -0,0 +1,76 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+import asyncio
+
+class PoolSaturatedError(Exception):
+    """Raised when the executor already has its maximum number of jobs in flight."""
+    pass
+
+class WorkerCrashedError(Exception):
+    """Raised when a pool worker died while running a job; the pool has been replaced."""
+    pass
+
+class PipelineExecutor:
+    """
+    Runs blocking pipeline work off the event loop with a bounded in-flight limit.
+    
+    Work is handed to a process pool (or a thread pool) so slow parses and
+    renders never stall other requests on the same worker. Submissions beyond
+    max_in_flight are rejected immediately instead of queueing without limit.
+    
+    A process pool whose worker dies (killed for memory, or crashed in a
+    native library) is broken for good, so it is replaced and only the
+    jobs that were running in it fail.
+    """
+    
+    def __init__(self, mode: str = "process", max_workers: int = 1, max_in_flight: int = 2):
+        if mode not in ("process", "thread"):
+            raise ValueError(f"Unsupported executor mode: {mode}")
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+        self._pool: Optional[Executor] = None
+    
+    def _get_pool(self) -> Executor:
+        # Created lazily so importing the app never forks worker processes
+        if self._pool is None:
+            if self.mode == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+        return self._pool
+    
+    async def run(self, func: Callable[..., Any], *args) -> Any:
+        """
+        Run func(*args) in the pool and await its result.
+        
+        Raises:
+            PoolSaturatedError: If max_in_flight jobs are already running
+            WorkerCrashedError: If the worker running func died
+        """
+        # Only touched from the event loop thread, so no lock is needed
+        if self.in_flight >= self.max_in_flight:
+            raise PoolSaturatedError(f"{self.in_flight} jobs already in flight")
+        
+        self.in_flight += 1
+        pool = self._get_pool()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(pool, func, *args)
+        except BrokenProcessPool as e:
+            # Jobs that shared the broken pool land here too; only the
+            # first replaces it
+            if self._pool is pool:
+                self._pool = None
+                pool.shutdown(wait=False)
+            raise WorkerCrashedError("A pipeline worker process died") from e
+        finally:
+            self.in_flight -= 1
+    
+    def shutdown(self):
+        """Stop the pool, waiting for running jobs to finish."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
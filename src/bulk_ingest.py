@@ -0,0 +1,294 @@
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Set
+import argparse
+import json
+import multiprocessing
+import os
+import re
+import sys
+import zipfile
+
+from tqdm import tqdm
+
+from src.parsers.parser_factory import get_parser
+from src.processors.job_profile import JobProfile
+from src.processors.resume_transformer import transform_parsed_resume
+from src.formatters.dynamic_resume_formatter import DynamicResumeFormatter
+from src.pipeline import split_terms
+from src.storage.corpus import CandidateCorpus
+
+RESUME_EXTENSIONS = ('.pdf', '.docx')
+
+# Resumes stored in the corpus per transaction
+CORPUS_BATCH_SIZE = 64
+
+# Separates an archive path from a member name in item ids
+ZIP_MEMBER_SEPARATOR = '::'
+
+# Per-process state, set up once by _init_worker
+_job_profile = None
+_render_dir = None
+_keep_parsed = False
+_open_archives = {}
+
+def discover_items(source: Path) -> List[str]:
+    """
+    List the resumes to ingest.
+
+    Args:
+        source: A directory (searched recursively) or a .zip archive
+
+    Returns:
+        Sorted item ids: file paths, or "archive.zip::member" for zip members
+    """
+    if source.is_dir():
+        return sorted(
+            str(path) for path in source.rglob('*')
+            if path.is_file() and path.suffix.lower() in RESUME_EXTENSIONS
+        )
+
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            return sorted(
+                f"{source}{ZIP_MEMBER_SEPARATOR}{name}" for name in archive.namelist()
+                if not name.endswith('/') and Path(name).suffix.lower() in RESUME_EXTENSIONS
+            )
+
+    raise ValueError(f"Expected a directory or a .zip archive: {source}")
+
+def load_checkpoint(output_path: Path, retry_errors: bool = False) -> Set[str]:
+    """
+    Read the ids already recorded in the results file.
+
+    The JSONL output doubles as the checkpoint, so an interrupted run picks
+    up where it stopped. A partially written last line is ignored;
+    truncate_partial_line removes it before the file is appended to.
+
+    Args:
+        output_path: JSONL results file
+        retry_errors: Whether items that failed previously should be redone
+
+    Returns:
+        Set of item ids that do not need processing again
+    """
+    done = set()
+    if not output_path.exists():
+        return done
+
+    with open(output_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get('status') == 'ok' or not retry_errors:
+                done.add(record['id'])
+    return done
+
+def truncate_partial_line(output_path: Path, block_size: int = 65536):
+    """
+    Cut a results file back to its last complete line.
+
+    An interrupted run can leave a record without its trailing newline;
+    appending to it would glue the next record onto the same line and
+    lose both.
+    """
+    if not output_path.exists():
+        return
+
+    with open(output_path, 'rb+') as f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - block_size)
+            f.seek(start)
+            newline = f.read(position - start).rfind(b'\n')
+            if newline != -1:
+                keep = start + newline + 1
+                break
+            position = start
+        else:
+            keep = 0
+        if keep < end:
+            f.truncate(keep)
+
+def _read_item(item_id: str) -> bytes:
+    """Read the bytes of a file or zip member, keeping archives open per process."""
+    if ZIP_MEMBER_SEPARATOR in item_id:
+        archive_path, member = item_id.split(ZIP_MEMBER_SEPARATOR, 1)
+        archive = _open_archives.get(archive_path)
+        if archive is None:
+            archive = zipfile.ZipFile(archive_path)
+            _open_archives[archive_path] = archive
+        return archive.read(member)
+
+    with open(item_id, 'rb') as f:
+        return f.read()
+
+def _init_worker(job_profile: Optional[JobProfile], render_dir: Optional[str], keep_parsed: bool = False):
+    global _job_profile, _render_dir, _keep_parsed
+    _job_profile = job_profile
+    _render_dir = Path(render_dir) if render_dir else None
+    _keep_parsed = keep_parsed
+
+def process_item(item_id: str) -> Dict[str, Any]:
+    """
+    Parse, score, transform and optionally render one resume.
+
+    Args:
+        item_id: File path or "archive.zip::member"
+
+    Returns:
+        JSON-serializable result record; failures are reported, not raised.
+        When the corpus is enabled it also carries '_content_hash' and
+        '_parsed' for the main process, which strips them before writing.
+    """
+    try:
+        content = _read_item(item_id)
+        # Pool workers are daemonic and cannot start page workers of their own
+        parsed_resume = get_parser(content, page_workers=1).parse()
+
+        skill_matches = None
+        if _job_profile is not None:
+            skill_matches = _job_profile.match(parsed_resume['raw_text'])
+
+        candidate_data = transform_parsed_resume(parsed_resume, skill_matches)
+
+        record = {
+            'id': item_id,
+            'status': 'ok',
+            'candidate': candidate_data
+        }
+
+        if _render_dir is not None:
+            # Name outputs after the item id so same-name candidates never collide
+            safe_name = re.sub(r'[^A-Za-z0-9._-]+', '_', item_id).strip('_')
+            output_path = _render_dir / f"{safe_name}_resume.docx"
+            DynamicResumeFormatter().format_resume(candidate_data, str(output_path))
+            record['output_path'] = str(output_path)
+        
+        if _keep_parsed:
+            record['_content_hash'] = CandidateCorpus.content_hash(content)
+            record['_parsed'] = parsed_resume
+
+        return record
+    except Exception as e:
+        return {'id': item_id, 'status': 'error', 'error': f"{type(e).__name__}: {e}"}
+
+def _write_batch(records: List[Dict[str, Any]], out, corpus: Optional[CandidateCorpus]):
+    """Store a batch in the corpus, then append it to the results file."""
+    if corpus is not None:
+        stored = [record for record in records if record['status'] == 'ok']
+        # Single writer: only this process touches the corpus
+        corpus_ids = corpus.add_many(
+            (record.pop('_content_hash'), record.pop('_parsed'), record['candidate']['name'], record['id'])
+            for record in stored
+        )
+        for record, corpus_id in zip(stored, corpus_ids):
+            record['corpus_id'] = corpus_id
+    
+    # One flushed line per resume: this is the checkpoint. Lines are only
+    # written once the batch is in the corpus, so nothing is skipped on resume
+    for record in records:
+        out.write(json.dumps(record) + '\n')
+    out.flush()
+
+def run(source: Path,
+        output_path: Path,
+        job_profile: Optional[JobProfile] = None,
+        render_dir: Optional[Path] = None,
+        workers: Optional[int] = None,
+        chunksize: int = 4,
+        retry_errors: bool = False,
+        corpus_path: Optional[Path] = None) -> Dict[str, int]:
+    """
+    Ingest every resume under source, appending results to output_path.
+
+    Args:
+        source: Directory or .zip archive of resumes
+        output_path: JSONL file to append one record per resume to
+        job_profile: Optional job spec to score every resume against
+        render_dir: Directory to render formatted resumes into, or None to skip
+        workers: Number of worker processes (defaults to the CPU count)
+        chunksize: Items handed to a worker at a time
+        retry_errors: Whether to redo items recorded as failed
+        corpus_path: SQLite corpus to store every parsed resume in, or None
+
+    Returns:
+        Counts of processed, failed and skipped items
+    """
+    items = discover_items(source)
+    done = load_checkpoint(output_path, retry_errors)
+    pending = [item for item in items if item not in done]
+
+    if render_dir is not None:
+        render_dir.mkdir(exist_ok=True, parents=True)
+    output_path.parent.mkdir(exist_ok=True, parents=True)
+    truncate_partial_line(output_path)
+
+    counts = {'processed': 0, 'failed': 0, 'skipped': len(items) - len(pending)}
+    if not pending:
+        return counts
+    
+    corpus = CandidateCorpus(corpus_path) if corpus_path is not None else None
+
+    with multiprocessing.Pool(
+        processes=workers,
+        initializer=_init_worker,
+        initargs=(job_profile, str(render_dir) if render_dir else None, corpus is not None)
+    ) as pool, open(output_path, 'a', encoding='utf-8') as out:
+        results = pool.imap_unordered(process_item, pending, chunksize=chunksize)
+        batch = []
+        for record in tqdm(results, total=len(pending), unit='resume'):
+            if record['status'] == 'ok':
+                counts['processed'] += 1
+            else:
+                counts['failed'] += 1
+            
+            batch.append(record)
+            if corpus is None or len(batch) >= CORPUS_BATCH_SIZE:
+                _write_batch(batch, out, corpus)
+                batch = []
+        _write_batch(batch, out, corpus)
+
+    return counts
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Parse and score a directory or zip archive of resumes in parallel."
+    )
+    parser.add_argument('source', type=Path, help="Directory or .zip archive of .pdf/.docx resumes")
+    parser.add_argument('-o', '--output', type=Path, required=True, help="JSONL results file (appended to, used as checkpoint)")
+    parser.add_argument('--must-have', default='', help="Comma-separated list of required skills")
+    parser.add_argument('--nice-to-have', default='', help="Comma-separated list of nice-to-have skills")
+    parser.add_argument('--industry', default='', help="Comma-separated list of required industry experience")
+    parser.add_argument('--render-dir', type=Path, help="Also render formatted resumes into this directory")
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count(), help="Worker processes")
+    parser.add_argument('--chunksize', type=int, default=4, help="Resumes handed to a worker at a time")
+    parser.add_argument('--corpus', type=Path, help="Also store parsed resumes in this searchable SQLite corpus")
+    parser.add_argument('--retry-errors', action='store_true', help="Redo resumes that failed in a previous run")
+    args = parser.parse_args(argv)
+
+    job_profile = None
+    if args.must_have:
+        job_profile = JobProfile(
+            split_terms(args.must_have),
+            split_terms(args.nice_to_have),
+            split_terms(args.industry)
+        )
+
+    counts = run(
+        args.source,
+        args.output,
+        job_profile=job_profile,
+        render_dir=args.render_dir,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        retry_errors=args.retry_errors,
+        corpus_path=args.corpus
+    )
+    print(f"Processed {counts['processed']}, failed {counts['failed']}, "
+          f"skipped {counts['skipped']} already done", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import os
+from pathlib import Path
+
+# Runtime settings, overridable through environment variables
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DATA_DIR = Path(os.environ.get("RESUME_DATA_DIR", PROJECT_ROOT / "data"))
+
+# Parse cache: in-process LRU entries and on-disk size budget
+PARSE_CACHE_DIR = Path(os.environ.get("RESUME_PARSE_CACHE_DIR", DATA_DIR / "cache" / "parsed"))
+PARSE_CACHE_MEMORY_ENTRIES = int(os.environ.get("RESUME_PARSE_CACHE_MEMORY_ENTRIES", 256))
+PARSE_CACHE_DISK_BYTES = int(os.environ.get("RESUME_PARSE_CACHE_DISK_BYTES", 256 * 1024 * 1024))
+
+# PDF text extraction backend: "pdfplumber" (layout-aware) or "pypdfium2"
+# (much faster plain text, needs the pypdfium2 package; see
+# requirements-optional.txt)
+PDF_BACKEND = os.environ.get("RESUME_PDF_BACKEND", "pdfplumber")
+
+# PDF text extraction: processes per document (1 = sequential) and the
+# smallest page count worth spreading across them
+PDF_PAGE_WORKERS = int(os.environ.get("RESUME_PDF_PAGE_WORKERS", 1))
+PDF_PARALLEL_MIN_PAGES = int(os.environ.get("RESUME_PDF_PARALLEL_MIN_PAGES", 8))
+# Bounded-memory PDF parsing: release each page's layout once its text is
+# extracted, and reject documents over these limits (0 disables a limit)
+PDF_BOUNDED_MEMORY = os.environ.get("RESUME_PDF_BOUNDED_MEMORY", "1") == "1"
+PDF_MAX_PAGES = int(os.environ.get("RESUME_PDF_MAX_PAGES", 500))
+PDF_MAX_BYTES = int(os.environ.get("RESUME_PDF_MAX_BYTES", 64 * 1024 * 1024))
+# Measure peak Python memory of every PDF parse with tracemalloc (slow)
+PDF_TRACK_MEMORY = os.environ.get("RESUME_PDF_TRACK_MEMORY", "0") == "1"
+
+# DOCX backend: "python-docx" builds the full object model, "streaming"
+# reads word/document.xml incrementally and also extracts table cells
+DOCX_BACKEND = os.environ.get("RESUME_DOCX_BACKEND", "python-docx")
+
+# Pipeline executor: "process" for CPU-bound work, "thread" to share memory
+PIPELINE_EXECUTOR = os.environ.get("RESUME_PIPELINE_EXECUTOR", "process")
+PIPELINE_WORKERS = int(os.environ.get("RESUME_PIPELINE_WORKERS", os.cpu_count() or 1))
+# Requests allowed in flight before the API answers 503
+PIPELINE_MAX_IN_FLIGHT = int(os.environ.get("RESUME_PIPELINE_MAX_IN_FLIGHT", 2 * PIPELINE_WORKERS))
+PIPELINE_RETRY_AFTER_SECONDS = int(os.environ.get("RESUME_PIPELINE_RETRY_AFTER_SECONDS", 5))
+
+# Registered job profiles: stored in SQLite so every server process shares
+# them, with the most recently used kept in memory per process
+JOB_PROFILE_DB_PATH = Path(os.environ.get("RESUME_JOB_PROFILE_DB_PATH", DATA_DIR / "job_profiles.sqlite3"))
+JOB_PROFILE_MAX_ENTRIES = int(os.environ.get("RESUME_JOB_PROFILE_MAX_ENTRIES", 256))
+# Profiles kept in the database, least recently registered dropped first (0 = no limit)
+JOB_PROFILE_MAX_STORED = int(os.environ.get("RESUME_JOB_PROFILE_MAX_STORED", 10000))
+# Job specs a single /rank-resume request may score against
+RANK_MAX_PROFILES = int(os.environ.get("RESUME_RANK_MAX_PROFILES", 100))
+
+# Compiled skill taxonomy (tools/compile_taxonomy.py); when present, job
+# terms and resume text are matched through each skill's aliases
+SKILL_TAXONOMY_PATH = Path(os.environ.get("RESUME_SKILL_TAXONOMY_PATH", DATA_DIR / "skill_taxonomy.bin"))
+
+# Background job queue
+JOB_DB_PATH = Path(os.environ.get("RESUME_JOB_DB_PATH", DATA_DIR / "jobs.sqlite3"))
+JOB_WORKERS = int(os.environ.get("RESUME_JOB_WORKERS", 2))
+JOB_POLL_INTERVAL_SECONDS = float(os.environ.get("RESUME_JOB_POLL_INTERVAL_SECONDS", 2.0))
+# How long a claimed job stays with its worker without a renewal; running
+# jobs whose worker died are picked up again after this
+JOB_LEASE_SECONDS = float(os.environ.get("RESUME_JOB_LEASE_SECONDS", 60.0))
+
+# Opt-in persistent corpus of parsed resumes, searchable by skill
+CORPUS_DB_PATH = Path(os.environ.get("RESUME_CORPUS_DB_PATH", DATA_DIR / "corpus.sqlite3"))
+# Longest word sequence indexed; longer phrases are matched piecewise
+CORPUS_MAX_NGRAM = int(os.environ.get("RESUME_CORPUS_MAX_NGRAM", 2))
+
+# Opt-in near-duplicate detection: MinHash signatures of every upload's
+# text in an LSH index; uploads at least this similar to an earlier one are
+# flagged. Signatures are kept without a limit once enabled
+NEAR_DUPLICATES = os.environ.get("RESUME_NEAR_DUPLICATES", "0") == "1"
+NEAR_DUPLICATE_DB_PATH = Path(os.environ.get("RESUME_NEAR_DUPLICATE_DB_PATH", DATA_DIR / "near_duplicates.sqlite3"))
+NEAR_DUPLICATE_THRESHOLD = float(os.environ.get("RESUME_NEAR_DUPLICATE_THRESHOLD", 0.9))
+NEAR_DUPLICATE_NUM_PERM = int(os.environ.get("RESUME_NEAR_DUPLICATE_NUM_PERM", 128))
+# Seconds a processed upload's candidate data and score (personal data) are
+# kept for reuse_duplicates; 0 stores none, so reuse_duplicates never hits.
+# Only the MinHash signatures, not the text, are kept without a limit.
+NEAR_DUPLICATE_RESULT_TTL_SECONDS = int(os.environ.get("RESUME_NEAR_DUPLICATE_RESULT_TTL_SECONDS", 0))
+
+# Seconds a resume rendered with delivery="file" stays downloadable under
+# data/output before it is deleted (0 keeps files forever)
+OUTPUT_RETENTION_SECONDS = int(os.environ.get("RESUME_OUTPUT_RETENTION_SECONDS", 24 * 60 * 60))
+
+# Short-lived store for rendered documents, shared by every server process.
+# An empty dir keeps blobs in process memory instead, which only works with
+# a single server worker: a /blobs link must reach the process that made it
+BLOB_STORE_DIR = os.environ.get("RESUME_BLOB_STORE_DIR", str(DATA_DIR / "blobs"))
+BLOB_TTL_SECONDS = int(os.environ.get("RESUME_BLOB_TTL_SECONDS", 15 * 60))
+BLOB_STORE_MAX_BYTES = int(os.environ.get("RESUME_BLOB_STORE_MAX_BYTES", 128 * 1024 * 1024))
@@ -1,7 +1,111 @@
 from docxtpl import DocxTemplate
+from docx import Document
+from jinja2 import Environment
 from pathlib import Path
+from typing import Any, Dict
+import copy
 import datetime
+import hashlib
+import io
 import os
+import threading
+
+class _CachingEnvironment(Environment):
+    """Jinja environment that compiles each template source only once."""
+    
+    def __init__(self):
+        super().__init__()
+        self._compiled = {}
+    
+    def from_string(self, source, globals=None, template_class=None):
+        if globals is not None or template_class is not None:
+            return super().from_string(source, globals, template_class)
+        template = self._compiled.get(source)
+        if template is None:
+            template = super().from_string(source)
+            self._compiled[source] = template
+        return template
+
+class _CompiledTemplate:
+    """In-memory, pre-parsed state of one version of a template file."""
+    
+    def __init__(self, blob: bytes, digest: str, signature):
+        self.blob = blob
+        self.digest = digest
+        self.signature = signature
+        self.document = Document(io.BytesIO(blob))
+        self.jinja_env = _CachingEnvironment()
+        self.patched_xml = {}
+        # lxml trees are not safe to copy from several threads at once
+        self.copy_lock = threading.Lock()
+
+class _CachedDocxTemplate(DocxTemplate):
+    """DocxTemplate that starts from a copy of a pre-parsed template."""
+    
+    def __init__(self, compiled: _CompiledTemplate):
+        super().__init__(io.BytesIO(compiled.blob))
+        self.compiled = compiled
+        with compiled.copy_lock:
+            self.docx = copy.deepcopy(compiled.document)
+    
+    def patch_xml(self, src_xml):
+        # The XML clean-up docxtpl runs before Jinja only depends on the
+        # template, so it is computed once per template version
+        patched = self.compiled.patched_xml.get(src_xml)
+        if patched is None:
+            patched = super().patch_xml(src_xml)
+            self.compiled.patched_xml[src_xml] = patched
+        return patched
+
+_template_cache: Dict[Path, _CompiledTemplate] = {}
+_template_cache_lock = threading.Lock()
+
+def load_template(template_path) -> _CompiledTemplate:
+    """
+    Return the pre-parsed template, reloading it if the file has changed.
+    
+    The file is re-read when its mtime or size changes, and re-parsed only
+    if its content hash differs from the cached version.
+    
+    Raises:
+        FileNotFoundError: If the template file does not exist
+    """
+    template_path = Path(template_path)
+    try:
+        stat = os.stat(template_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Template file not found: {template_path}")
+    signature = (stat.st_mtime_ns, stat.st_size)
+    
+    with _template_cache_lock:
+        compiled = _template_cache.get(template_path)
+        if compiled is not None and compiled.signature == signature:
+            return compiled
+        
+        blob = template_path.read_bytes()
+        digest = hashlib.sha256(blob).hexdigest()
+        if compiled is not None and compiled.digest == digest:
+            # Touched but not modified
+            compiled.signature = signature
+            return compiled
+        
+        compiled = _CompiledTemplate(blob, digest, signature)
+        _template_cache[template_path] = compiled
+        return compiled
+
+def render_template(template_path, context: Dict[str, Any], output):
+    """
+    Render a docx template with the given context.
+    
+    Args:
+        template_path: Path to the .docx template
+        context: Jinja context for the template
+        output: Path or writable file-like object to save the document to
+    """
+    compiled = load_template(template_path)
+    doc = _CachedDocxTemplate(compiled)
+    doc.render(context, jinja_env=compiled.jinja_env)
+    doc.save(output)
 
 class DynamicResumeFormatter:
     """Formats resume data into Buxton's standard format using a docxtpl template."""
@@ -12,8 +116,8 @@ class DynamicResumeFormatter:
             template_path = Path(__file__).parent.parent.parent / "data" / "templates" / "Buxton_Template.docx"
         self.template_path = Path(template_path)
         
-        if not self.template_path.exists():
-            raise FileNotFoundError(f"Template file not found: {self.template_path}")
+        # Loads (or revalidates) the cached template; raises if it is missing
+        load_template(self.template_path)
     
     def format_resume(self, candidate_data, output_path=None):
         """
@@ -26,25 +130,34 @@ class DynamicResumeFormatter:
         Returns:
             Path to the formatted resume file
         """
-        # Create template context
-        context = {
-            'candidate': candidate_data,
-            'current_date': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        }
-        
-        # Load the template
-        doc = DocxTemplate(self.template_path)
-        
-        # Render the template with our context
-        doc.render(context)
-        
         # If no output path provided, create one in the output directory
         if output_path is None:
             output_dir = Path(__file__).parent.parent.parent / "data" / "output"
             output_dir.mkdir(exist_ok=True, parents=True)
             output_path = output_dir / f"{candidate_data['name'].replace(' ', '_')}_Resume.docx"
         
-        # Save the document
-        doc.save(output_path)
+        # Render from the cached template and save the document
+        render_template(self.template_path, self._build_context(candidate_data), output_path)
         
-        return output_path
\ No newline at end of file
+        return output_path
+    
+    def render_to_bytes(self, candidate_data) -> bytes:
+        """
+        Format resume into an in-memory .docx without touching the disk.
+        
+        Args:
+            candidate_data: Dictionary containing candidate information
+            
+        Returns:
+            The formatted resume as .docx bytes
+        """
+        output = io.BytesIO()
+        render_template(self.template_path, self._build_context(candidate_data), output)
+        return output.getvalue()
+    
+    def _build_context(self, candidate_data) -> Dict[str, Any]:
+        """Create template context."""
+        return {
+            'candidate': candidate_data,
+            'current_date': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
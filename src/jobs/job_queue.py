@@ -0,0 +1,210 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional, Union
+import json
+import sqlite3
+import time
+import uuid
+
+class JobQueue:
+    """
+    Durable local queue of resume processing jobs, stored in SQLite.
+    
+    Each job keeps the uploaded bytes and form parameters until it finishes,
+    so pending work survives a restart. Jobs move through the states
+    pending -> running -> done | failed.
+    
+    A claim leases the job to one worker until lease_expires_at; the
+    worker renews the lease while it runs. Several processes can drain the
+    same queue, and a running job whose lease lapsed (its worker died or
+    was restarted) is claimed again like a pending one.
+    """
+    
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(exist_ok=True, parents=True)
+        
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,
+                    filename TEXT NOT NULL,
+                    content BLOB,
+                    params TEXT NOT NULL,
+                    result TEXT,
+                    error TEXT,
+                    worker_id TEXT,
+                    lease_expires_at REAL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            ''')
+            # Queues created before leases existed
+            columns = [row['name'] for row in conn.execute('PRAGMA table_info(jobs)')]
+            if 'worker_id' not in columns:
+                conn.execute('ALTER TABLE jobs ADD COLUMN worker_id TEXT')
+            if 'lease_expires_at' not in columns:
+                conn.execute('ALTER TABLE jobs ADD COLUMN lease_expires_at REAL')
+            conn.execute('CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)')
+    
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # A connection per call keeps the queue safe to use from any thread;
+        # statements autocommit unless a transaction is opened explicitly
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+    
+    def enqueue(self, content: bytes, filename: str, params: Dict[str, Any]) -> str:
+        """
+        Persist a new job.
+        
+        Args:
+            content: Raw bytes of the uploaded resume
+            filename: Original filename of the upload
+            params: Form parameters to process the resume with
+            
+        Returns:
+            The new job id
+        """
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT INTO jobs (id, status, filename, content, params, created_at, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (job_id, self.PENDING, filename, content, json.dumps(params), now, now)
+            )
+        return job_id
+    
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[Dict[str, Any]]:
+        """
+        Atomically take the oldest claimable job and lease it to a worker.
+        
+        A job is claimable when it is pending, or running under a lease
+        that has expired.
+        
+        Args:
+            worker_id: Identifies the claiming worker
+            lease_seconds: How long the job is leased for before it must be renewed
+            
+        Returns:
+            Dict with id, filename, content and params, or None if nothing is claimable
+        """
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                now = time.time()
+                row = conn.execute(
+                    'SELECT id, filename, content, params, status FROM jobs '
+                    'WHERE status = ? OR (status = ? AND (lease_expires_at IS NULL OR lease_expires_at < ?)) '
+                    'ORDER BY created_at LIMIT 1',
+                    (self.PENDING, self.RUNNING, now)
+                ).fetchone()
+                if row is not None:
+                    conn.execute(
+                        'UPDATE jobs SET status = ?, worker_id = ?, lease_expires_at = ?, updated_at = ? WHERE id = ?',
+                        (self.RUNNING, worker_id, now + lease_seconds, now, row['id'])
+                    )
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        
+        if row is None:
+            return None
+        return {
+            'id': row['id'],
+            'filename': row['filename'],
+            'content': row['content'],
+            'params': json.loads(row['params']),
+            'reclaimed': row['status'] == self.RUNNING
+        }
+    
+    def renew(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """
+        Extend a worker's lease on a running job.
+        
+        Returns:
+            False if the worker no longer holds the job
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                'UPDATE jobs SET lease_expires_at = ?, updated_at = ? WHERE id = ? AND status = ? AND worker_id = ?',
+                (now + lease_seconds, now, job_id, self.RUNNING, worker_id)
+            )
+            return cursor.rowcount > 0
+    
+    def complete(self, job_id: str, worker_id: str, result: Dict[str, Any]) -> bool:
+        """
+        Mark a job done, store its result and drop the uploaded bytes.
+        
+        Returns:
+            False if the worker no longer holds the job, which is left as is
+        """
+        return self._finish(job_id, worker_id, self.DONE, result=json.dumps(result))
+    
+    def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        """
+        Mark a job failed with an error message.
+        
+        Returns:
+            False if the worker no longer holds the job, which is left as is
+        """
+        return self._finish(job_id, worker_id, self.FAILED, error=error)
+    
+    def _finish(self, job_id: str, worker_id: str, status: str,
+                result: Optional[str] = None, error: Optional[str] = None) -> bool:
+        with self._connect() as conn:
+            cursor = conn.execute(
+                'UPDATE jobs SET status = ?, result = ?, error = ?, content = NULL, '
+                'worker_id = NULL, lease_expires_at = NULL, updated_at = ? '
+                'WHERE id = ? AND status = ? AND worker_id = ?',
+                (status, result, error, time.time(), job_id, self.RUNNING, worker_id)
+            )
+            return cursor.rowcount > 0
+    
+    def release(self, job_id: str, worker_id: str):
+        """Put a job the worker holds back in the pending state."""
+        with self._connect() as conn:
+            conn.execute(
+                'UPDATE jobs SET status = ?, worker_id = NULL, lease_expires_at = NULL, updated_at = ? '
+                'WHERE id = ? AND status = ? AND worker_id = ?',
+                (self.PENDING, time.time(), job_id, self.RUNNING, worker_id)
+            )
+    
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a job's status and result.
+        
+        Returns:
+            Dict describing the job, or None if the id is unknown
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT id, status, filename, result, error, created_at, updated_at FROM jobs WHERE id = ?',
+                (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        
+        return {
+            'job_id': row['id'],
+            'status': row['status'],
+            'filename': row['filename'],
+            'result': json.loads(row['result']) if row['result'] else None,
+            'error': row['error'],
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at']
+        }
@@ -0,0 +1,108 @@
+from typing import Any, Awaitable, Callable, Dict, List
+import asyncio
+import logging
+import os
+import socket
+import uuid
+
+from src.api.executor import PoolSaturatedError
+from .job_queue import JobQueue
+
+logger = logging.getLogger(__name__)
+
+class JobWorkerPool:
+    """
+    Background asyncio workers that drain a JobQueue.
+    
+    Each worker claims the oldest pending job, hands its upload bytes and
+    parameters to the process callable and records the result. Workers
+    sleep when the queue is empty and are woken early by notify().
+    
+    Every pool claims under its own worker id and renews the lease on each
+    job it runs, so pools in sibling server processes share one queue
+    without taking each other's jobs; a job is only picked up again once
+    its lease has lapsed.
+    """
+    
+    def __init__(self,
+                 queue: JobQueue,
+                 process: Callable[..., Awaitable[Dict[str, Any]]],
+                 workers: int = 2,
+                 poll_interval: float = 2.0,
+                 lease_seconds: float = 60.0):
+        self.queue = queue
+        self.process = process
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._wakeup = None
+        self._tasks: List[asyncio.Task] = []
+    
+    def start(self):
+        """Start the workers."""
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self.workers)]
+    
+    def notify(self):
+        """Wake idle workers after a job is enqueued."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+    
+    async def stop(self):
+        """Cancel the workers, putting the jobs they were running back in the queue."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+    
+    async def _run(self):
+        while True:
+            job = await asyncio.to_thread(self.queue.claim, self.worker_id, self.lease_seconds)
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            await self._run_job(job)
+    
+    async def _run_job(self, job: Dict[str, Any]):
+        if job['reclaimed']:
+            logger.info("Reclaimed job %s after its lease expired", job['id'])
+        heartbeat = asyncio.create_task(self._heartbeat(job['id']))
+        try:
+            while True:
+                try:
+                    result = await self.process(job['content'], **job['params'])
+                except PoolSaturatedError:
+                    # Interactive requests hold the pool; try again shortly
+                    await asyncio.sleep(self.poll_interval)
+                    continue
+                except asyncio.CancelledError:
+                    # Shutting down: hand the job straight back instead of
+                    # leaving it until the lease lapses
+                    self.queue.release(job['id'], self.worker_id)
+                    raise
+                except Exception as e:
+                    logger.exception("Job %s failed", job['id'])
+                    finished = await asyncio.to_thread(self.queue.fail, job['id'], self.worker_id, str(e))
+                    break
+                
+                finished = await asyncio.to_thread(self.queue.complete, job['id'], self.worker_id, result)
+                break
+        finally:
+            heartbeat.cancel()
+        if not finished:
+            logger.warning("Job %s was reclaimed by another worker; its result was discarded", job['id'])
+    
+    async def _heartbeat(self, job_id: str):
+        """Renew the lease on a running job until cancelled."""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            held = await asyncio.to_thread(self.queue.renew, job_id, self.worker_id, self.lease_seconds)
+            if not held:
+                logger.warning("Lost the lease on job %s", job_id)
+                return
@@ -1,9 +1,79 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from pathlib import Path
+from typing import Dict, Any, Iterator, BinaryIO, Optional, Union
+import io
+
+from .section_segmenter import SectionSegmenter, DEFAULT_SEGMENTER
+
+# A resume can be given as a path, raw bytes or a seekable binary stream
+ParserSource = Union[str, Path, bytes, bytearray, memoryview, BinaryIO]
+
+class DocumentTooLargeError(ValueError):
+    """Raised when a document exceeds a parser's size or page limits."""
+
+class UnsupportedFormatError(ValueError):
+    """Raised when a document is not in a format any parser reads."""
 
 class BaseParser(ABC):
     """Base interface for document parsers."""
     
+    # Bump whenever a change alters the parser's output, so cached
+    # results from older versions are no longer served
+    version = "2"
+    
+    # Short format name used in metrics, e.g. "pdf"
+    file_type = None
+    
+    # What iter_text() yields one of, e.g. "page"
+    text_unit = "document"
+    
+    def __init__(self, source: ParserSource, segmenter: Optional[SectionSegmenter] = None):
+        if isinstance(source, (str, Path)):
+            self.file_path = Path(source)
+            self._stream = None
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            self.file_path = None
+            self._stream = io.BytesIO(source)
+        else:
+            self.file_path = None
+            self._stream = source
+        
+        # Set by parsers that know their document's page count
+        self.page_count = None
+        
+        # Splits extracted lines into sections
+        self.segmenter = segmenter or DEFAULT_SEGMENTER
+    
+    @property
+    def cache_id(self) -> str:
+        """Identifies this parser's output format in parse cache keys."""
+        return f"{type(self).__name__}|{self.version}"
+    
+    def _open_source(self) -> Union[Path, BinaryIO]:
+        """
+        Return the document as a path or a stream rewound to the start.
+        
+        Raises:
+            FileNotFoundError: If the source is a path that does not exist
+        """
+        if self._stream is None:
+            if not self.file_path.exists():
+                raise FileNotFoundError(f"File not found: {self.file_path}")
+            return self.file_path
+        
+        self._stream.seek(0)
+        return self._stream
+    
+    def iter_text(self) -> Iterator[str]:
+        """
+        Yield the document's text one text_unit at a time, as it is extracted.
+        
+        Joined with newlines the units are parse()['raw_text'], so callers
+        that stop iterating early skip extracting the rest. Parsers that
+        cannot extract incrementally yield the whole text at once.
+        """
+        yield self.parse()['raw_text']
+    
     @abstractmethod
     def parse(self) -> Dict[str, Any]:
         """
@@ -12,4 +82,4 @@ class BaseParser(ABC):
         Returns:
             Dict with normalized resume sections
         """
-        pass
\ No newline at end of file
+        pass
@@ -0,0 +1,156 @@
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional, Union
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from .base_parser import BaseParser
+
+class ParseCache:
+    """
+    Content-addressed cache for parser results.
+
+    Results are keyed by a hash of the uploaded bytes plus the parser class
+    and version, so re-uploads of the same file skip parsing entirely. Hot
+    entries live in an in-process LRU; every entry is also written to an
+    on-disk store whose total size is bounded, evicting the least recently
+    used files first.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], max_entries: int = 256, max_disk_bytes: int = 256 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'memory_evictions': 0,
+            'disk_evictions': 0
+        }
+
+        self.cache_dir.mkdir(exist_ok=True, parents=True)
+        self._disk_bytes = sum(path.stat().st_size for path in self.cache_dir.glob('*/*.json'))
+
+    @staticmethod
+    def make_key(content: bytes, parser: BaseParser) -> str:
+        """
+        Build the cache key for an upload.
+
+        Args:
+            content: Raw bytes of the uploaded file
+            parser: Parser that would handle the file
+
+        Returns:
+            Hex digest identifying the content and parser version
+        """
+        digest = hashlib.sha256(content)
+        digest.update(f"|{parser.cache_id}".encode())
+        return digest.hexdigest()
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached parse result for a key, or None."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._counters['memory_hits'] += 1
+                return self._memory[key]
+
+        path = self._disk_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                parsed = json.load(f)
+            # Refresh the access time used for disk eviction
+            os.utime(path)
+        except (OSError, ValueError):
+            with self._lock:
+                self._counters['misses'] += 1
+            return None
+
+        with self._lock:
+            self._counters['disk_hits'] += 1
+            self._remember(key, parsed)
+        return parsed
+
+    def put(self, key: str, parsed: Dict[str, Any]):
+        """Store a parse result in memory and on disk."""
+        with self._lock:
+            self._remember(key, parsed)
+
+        path = self._disk_path(key)
+        path.parent.mkdir(exist_ok=True)
+        payload = json.dumps(parsed).encode('utf-8')
+
+        # Write atomically so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            previous_size = path.stat().st_size if path.exists() else 0
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return
+
+        with self._lock:
+            self._disk_bytes += len(payload) - previous_size
+            over_budget = self._disk_bytes > self.max_disk_bytes
+        if over_budget:
+            self._evict_disk()
+
+    def _remember(self, key: str, parsed: Dict[str, Any]):
+        """Insert into the in-memory LRU. Caller must hold the lock."""
+        self._memory[key] = parsed
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._counters['memory_evictions'] += 1
+
+    def _evict_disk(self):
+        """Delete least recently used files until the store fits its budget."""
+        files = []
+        for path in self.cache_dir.glob('*/*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+
+        total = sum(size for _, size, _ in files)
+        # Evict down to 90% of the budget so we don't rescan on every put
+        target = self.max_disk_bytes * 0.9
+        evicted = 0
+        for _, size, path in files:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+
+        with self._lock:
+            self._disk_bytes = total
+            self._counters['disk_evictions'] += evicted
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current sizes."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats['memory_entries'] = len(self._memory)
+            stats['disk_bytes'] = self._disk_bytes
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = (stats['memory_hits'] + stats['disk_hits']) / lookups if lookups else 0.0
+        return stats
@@ -1,31 +1,99 @@
 from pathlib import Path
-from typing import Union
+from typing import Optional
 
-from .base_parser import BaseParser
+from .base_parser import BaseParser, ParserSource, UnsupportedFormatError
+from .section_segmenter import SectionSegmenter
 from .pdf_parser import PDFParser
 from .docx_parser import DocxParser
+from .streaming_docx_parser import StreamingDocxParser
+from .. import config
 
-def get_parser(file_path: Union[str, Path]) -> BaseParser:
+# Parser classes for each DOCX backend name
+DOCX_BACKENDS = {
+    'python-docx': DocxParser,
+    'streaming': StreamingDocxParser
+}
+
+# Bytes read from the start of a document to detect its format
+SNIFF_BYTES = 1024
+
+def detect_format(header: bytes) -> Optional[str]:
+    """
+    Detect a document format from its leading bytes.
+    
+    Args:
+        header: The first SNIFF_BYTES of the document
+        
+    Returns:
+        'pdf', 'docx', 'doc' (legacy Word), or None if unrecognized
     """
-    Factory function to get appropriate parser based on file extension.
+    # PDF readers accept the header anywhere in the first 1024 bytes
+    if b'%PDF-' in header[:SNIFF_BYTES]:
+        return 'pdf'
+    if header.startswith(b'PK\x03\x04'):
+        return 'docx'
+    if header.startswith(b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'):
+        return 'doc'
+    return None
+
+def _read_header(source: ParserSource) -> Optional[bytes]:
+    """Read the leading bytes of a source without consuming a stream."""
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source[:SNIFF_BYTES])
+    if isinstance(source, memoryview):
+        return source[:SNIFF_BYTES].tobytes()
+    if isinstance(source, (str, Path)):
+        try:
+            with open(source, 'rb') as f:
+                return f.read(SNIFF_BYTES)
+        except FileNotFoundError:
+            return None
+    
+    position = source.tell()
+    header = source.read(SNIFF_BYTES)
+    source.seek(position)
+    return header
+
+def get_parser(source: ParserSource,
+               segmenter: Optional[SectionSegmenter] = None,
+               docx_backend: Optional[str] = None,
+               page_workers: Optional[int] = None) -> BaseParser:
+    """
+    Factory function to get appropriate parser based on the document's content.
     
     Args:
-        file_path: Path to the resume file
+        source: Path to the resume file, its raw bytes, or a seekable binary stream
+        segmenter: Optional SectionSegmenter with a custom header vocabulary
+        docx_backend: One of DOCX_BACKENDS; defaults to config.DOCX_BACKEND
+        page_workers: Processes a PDF's pages are extracted across; defaults
+            to config.PDF_PAGE_WORKERS
         
     Returns:
         Appropriate parser instance for the file type
         
     Raises:
-        ValueError: If file type is not supported
+        UnsupportedFormatError: If the document is not a PDF or DOCX
+        ValueError: If the DOCX backend is not supported
     """
-    if isinstance(file_path, str):
-        file_path = Path(file_path)
-        
-    extension = file_path.suffix.lower()
+    if isinstance(source, str):
+        source = Path(source)
+    
+    header = _read_header(source)
+    if header is not None:
+        file_format = detect_format(header)
+    else:
+        # Missing file: fall back to the extension, parse() reports the error
+        file_format = source.suffix.lower().lstrip('.')
     
-    if extension == '.pdf':
-        return PDFParser(file_path)
-    elif extension in ['.docx', '.doc']:
-        return DocxParser(file_path)
+    if file_format == 'pdf':
+        return PDFParser(source, segmenter, page_workers=page_workers)
+    elif file_format == 'docx':
+        backend = docx_backend or config.DOCX_BACKEND
+        if backend not in DOCX_BACKENDS:
+            raise ValueError(f"Unknown DOCX backend: {backend}; expected one of {', '.join(DOCX_BACKENDS)}")
+        return DOCX_BACKENDS[backend](source, segmenter)
+    elif file_format == 'doc':
+        raise UnsupportedFormatError("Unsupported file type: legacy .doc, please upload a .docx or .pdf")
     else:
-        raise ValueError(f"Unsupported file type: {extension}")
\ No newline at end of file
+        found = source.suffix.lower() if isinstance(source, Path) else 'unrecognized content'
+        raise UnsupportedFormatError(f"Unsupported file type: {found}, please upload a .docx or .pdf")
@@ -0,0 +1,130 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO, Dict, Type, Union
+import threading
+
+import pdfplumber
+
+try:
+    import pypdfium2
+except ImportError:  # Optional backend
+    pypdfium2 = None
+
+class PDFBackend(ABC):
+    """
+    An open PDF document that can return the plain text of each page.
+    
+    Backends are used as context managers; PDFParser opens one per parse.
+    """
+    
+    # Name used in config and in parse cache keys
+    name = None
+    
+    def __init__(self, source: Union[Path, BinaryIO], bounded_memory: bool = True):
+        """
+        Args:
+            source: Path to the PDF or a binary stream positioned at its start
+            bounded_memory: Free per-page data as soon as its text is read
+        """
+        self.bounded_memory = bounded_memory
+    
+    @property
+    @abstractmethod
+    def page_count(self) -> int:
+        pass
+    
+    @abstractmethod
+    def page_text(self, index: int) -> str:
+        """Return the text of one page, '' if it has no text layer."""
+        pass
+    
+    @abstractmethod
+    def close(self):
+        pass
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+class PdfplumberBackend(PDFBackend):
+    """Layout-aware extraction through pdfplumber (the default)."""
+    
+    name = "pdfplumber"
+    
+    def __init__(self, source: Union[Path, BinaryIO], bounded_memory: bool = True):
+        super().__init__(source, bounded_memory)
+        self._pdf = pdfplumber.open(source)
+    
+    @property
+    def page_count(self) -> int:
+        return len(self._pdf.pages)
+    
+    def page_text(self, index: int) -> str:
+        page = self._pdf.pages[index]
+        text = page.extract_text() or ''
+        if self.bounded_memory:
+            # Drop the page's cached layout objects
+            page.flush_cache()
+            page.get_textmap.cache_clear()
+        return text
+    
+    def close(self):
+        self._pdf.close()
+
+class PdfiumBackend(PDFBackend):
+    """
+    Low-level text extraction through PDFium (pypdfium2), without layout
+    analysis.
+    
+    PDFium is not thread-safe, so all calls are serialized on a lock.
+    """
+    
+    name = "pypdfium2"
+    
+    _lock = threading.Lock()
+    
+    def __init__(self, source: Union[Path, BinaryIO], bounded_memory: bool = True):
+        if pypdfium2 is None:
+            raise ImportError("The pypdfium2 PDF backend requires the pypdfium2 package")
+        super().__init__(source, bounded_memory)
+        with self._lock:
+            self._pdf = pypdfium2.PdfDocument(str(source) if isinstance(source, Path) else source)
+    
+    @property
+    def page_count(self) -> int:
+        return len(self._pdf)
+    
+    def page_text(self, index: int) -> str:
+        with self._lock:
+            page = self._pdf[index]
+            textpage = page.get_textpage()
+            try:
+                text = textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+        # PDFium ends lines with \r\n; pdfplumber and the segmenter use \n
+        return text.replace('\r\n', '\n').replace('\r', '\n')
+    
+    def close(self):
+        with self._lock:
+            self._pdf.close()
+
+PDF_BACKENDS: Dict[str, Type[PDFBackend]] = {
+    PdfplumberBackend.name: PdfplumberBackend,
+    PdfiumBackend.name: PdfiumBackend
+}
+
+def get_pdf_backend(name: str) -> Type[PDFBackend]:
+    """
+    Look up a PDF backend class by name.
+    
+    Raises:
+        ValueError: If no backend has that name
+    """
+    try:
+        return PDF_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown PDF backend: {name}; expected one of {', '.join(PDF_BACKENDS)}")
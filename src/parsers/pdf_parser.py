@@ -1,21 +1,108 @@
-import pdfplumber
+import io
+import multiprocessing
+import os
+import threading
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import re
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 
-from .base_parser import BaseParser
+from .base_parser import BaseParser, DocumentTooLargeError, ParserSource
+from .pdf_backends import PDFBackend, get_pdf_backend
+from .section_segmenter import SectionSegmenter
+from .. import config
+
+def _extract_page_range(backend: str,
+                        source: Union[Path, bytes],
+                        start: int,
+                        stop: int,
+                        bounded_memory: bool) -> List[str]:
+    """Extract the text of pages [start, stop) in a worker process."""
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    with get_pdf_backend(backend)(source, bounded_memory) as pdf:
+        return [pdf.page_text(i) for i in range(start, stop)]
+
+# Page extraction pools, one per worker count, shared by every parse in
+# the process instead of starting fresh workers for each document
+_page_pools: Dict[int, ProcessPoolExecutor] = {}
+_page_pools_lock = threading.Lock()
+
+def _page_pool(workers: int) -> ProcessPoolExecutor:
+    with _page_pools_lock:
+        pool = _page_pools.get(workers)
+        if pool is None:
+            pool = _page_pools[workers] = ProcessPoolExecutor(max_workers=workers)
+        return pool
 
 class PDFParser(BaseParser):
     """Parser for PDF resume documents."""
     
-    def __init__(self, file_path):
-        self.file_path = Path(file_path)
+    file_type = "pdf"
+    text_unit = "page"
+    
+    def __init__(self,
+                 source: ParserSource,
+                 segmenter: Optional[SectionSegmenter] = None,
+                 backend: Optional[str] = None,
+                 page_workers: Optional[int] = None,
+                 bounded_memory: Optional[bool] = None,
+                 max_pages: Optional[int] = None,
+                 max_bytes: Optional[int] = None,
+                 track_memory: Optional[bool] = None):
+        """
+        Args:
+            source: Path, bytes or binary stream of the PDF
+            segmenter: Section segmenter to use instead of the default
+            backend: Name of the text extraction backend in PDF_BACKENDS.
+                Defaults to PDF_BACKEND.
+            page_workers: Processes to spread page ranges across; 1 extracts
+                sequentially. Defaults to PDF_PAGE_WORKERS. Always 1 inside a
+                daemonic pool worker, which cannot start processes.
+            bounded_memory: Release each page's data as soon as its text is
+                extracted. Defaults to PDF_BOUNDED_MEMORY.
+            max_pages: Reject documents with more pages; 0 for no limit.
+                Defaults to PDF_MAX_PAGES.
+            max_bytes: Reject files larger than this; 0 for no limit.
+                Defaults to PDF_MAX_BYTES.
+            track_memory: Record peak traced memory of parse() in
+                peak_memory_bytes. Defaults to PDF_TRACK_MEMORY.
+        """
+        super().__init__(source, segmenter)
+        self.backend = backend or config.PDF_BACKEND
+        self._backend_class = get_pdf_backend(self.backend)
+        self.page_workers = config.PDF_PAGE_WORKERS if page_workers is None else page_workers
+        if multiprocessing.current_process().daemon:
+            self.page_workers = 1
+        self.bounded_memory = config.PDF_BOUNDED_MEMORY if bounded_memory is None else bounded_memory
+        self.max_pages = config.PDF_MAX_PAGES if max_pages is None else max_pages
+        self.max_bytes = config.PDF_MAX_BYTES if max_bytes is None else max_bytes
+        self.track_memory = config.PDF_TRACK_MEMORY if track_memory is None else track_memory
         
+        # Peak bytes allocated during the last parse(), when tracked
+        self.peak_memory_bytes = None
+    
     def parse(self) -> Dict[str, Any]:
         """Parse PDF resume and extract structured content."""
-        if not self.file_path.exists():
-            raise FileNotFoundError(f"File not found: {self.file_path}")
-            
+        if not self.track_memory:
+            return self._parse()
+        
+        # Measure this parse alone, even if something else is already tracing
+        already_tracing = tracemalloc.is_tracing()
+        if already_tracing:
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        else:
+            baseline = 0
+            tracemalloc.start()
+        try:
+            return self._parse()
+        finally:
+            self.peak_memory_bytes = tracemalloc.get_traced_memory()[1] - baseline
+            if not already_tracing:
+                tracemalloc.stop()
+    
+    def _parse(self) -> Dict[str, Any]:
         # Extract text from PDF
         text = self._extract_text()
         
@@ -27,52 +114,90 @@ class PDFParser(BaseParser):
             'sections': sections
         }
     
+    def iter_pages(self) -> Iterator[str]:
+        """
+        Yield the text of each page as soon as it is extracted.
+        
+        Pages without a text layer (e.g. scanned images) yield ''.
+        
+        Raises:
+            DocumentTooLargeError: If the file exceeds max_bytes or max_pages
+        """
+        with self._open_pdf() as pdf:
+            for index in range(pdf.page_count):
+                yield pdf.page_text(index)
+    
+    def iter_text(self) -> Iterator[str]:
+        return self.iter_pages()
+    
+    @property
+    def cache_id(self) -> str:
+        # Backends extract slightly different text, so cache them apart
+        return f"{super().cache_id}|{self.backend}"
+    
+    def _open_pdf(self) -> PDFBackend:
+        """Open the document after enforcing the byte and page limits."""
+        source = self._open_source()
+        if self.max_bytes:
+            if isinstance(source, Path):
+                size = source.stat().st_size
+            else:
+                size = source.seek(0, os.SEEK_END)
+                source.seek(0)
+            if size > self.max_bytes:
+                raise DocumentTooLargeError(f"PDF is {size} bytes; the limit is {self.max_bytes}")
+        
+        pdf = self._backend_class(source, self.bounded_memory)
+        self.page_count = pdf.page_count
+        if self.max_pages and self.page_count > self.max_pages:
+            pdf.close()
+            raise DocumentTooLargeError(f"PDF has {self.page_count} pages; the limit is {self.max_pages}")
+        return pdf
+    
     def _extract_text(self) -> str:
         """Extract text from PDF document."""
-        with pdfplumber.open(self.file_path) as pdf:
-            return "\n".join(page.extract_text() for page in pdf.pages)
+        if self.page_workers > 1:
+            return "\n".join(self._extract_pages_parallel())
+        return "\n".join(self.iter_pages())
     
-    def _identify_sections(self, text: str) -> Dict[str, str]:
-        """Identify common resume sections."""
-        # Common section headers in resumes
-        section_patterns = {
-            'summary': r'(?i)(SUMMARY|PROFESSIONAL\s+SUMMARY|PROFILE|OBJECTIVE)',
-            'experience': r'(?i)(EXPERIENCE|WORK\s+EXPERIENCE|PROFESSIONAL\s+EXPERIENCE|EMPLOYMENT)',
-            'education': r'(?i)(EDUCATION|ACADEMIC|QUALIFICATIONS)',
-            'skills': r'(?i)(SKILLS|TECHNICAL\s+SKILLS|CORE\s+COMPETENCIES|COMPETENCIES)',
-            'certifications': r'(?i)(CERTIFICATIONS|CERTIFICATES|ACCREDITATIONS)',
-            'projects': r'(?i)(PROJECTS|KEY\s+PROJECTS)',
-            'references': r'(?i)(REFERENCES)',
-            'languages': r'(?i)(LANGUAGES|LANGUAGE\s+PROFICIENCY)',
-            'awards': r'(?i)(AWARDS|HONORS|ACHIEVEMENTS)'
-        }
+    def _page_ranges(self, page_count: int) -> List[Tuple[int, int]]:
+        """Split pages into one contiguous range per worker."""
+        workers = min(self.page_workers, page_count)
+        size, extra = divmod(page_count, workers)
+        ranges = []
+        start = 0
+        for i in range(workers):
+            stop = start + size + (1 if i < extra else 0)
+            ranges.append((start, stop))
+            start = stop
+        return ranges
+    
+    def _extract_pages_parallel(self) -> List[str]:
+        """
+        Extract page ranges in a process pool, returning pages in order.
         
-        # Split text by common section headers
-        sections = {}
-        current_section = 'header'  # Default section
-        section_text = []
+        Documents shorter than PDF_PARALLEL_MIN_PAGES are extracted
+        sequentially, since handing them to workers would cost more than it
+        saves. The pool is started on first use and kept for later parses.
+        """
+        with self._open_pdf():
+            pass
+        if self.page_count < config.PDF_PARALLEL_MIN_PAGES:
+            return list(self.iter_pages())
         
-        lines = text.split('\n')
-        for line in lines:
-            # Check if line matches any section pattern
-            matched_section = None
-            for section, pattern in section_patterns.items():
-                if re.search(pattern, line):
-                    matched_section = section
-                    break
-                    
-            if matched_section:
-                # Save previous section
-                if section_text:
-                    sections[current_section] = '\n'.join(section_text)
-                # Start new section
-                current_section = matched_section
-                section_text = []
-            else:
-                section_text.append(line)
-                
-        # Save the last section
-        if section_text:
-            sections[current_section] = '\n'.join(section_text)
-            
-        return sections
\ No newline at end of file
+        # Workers reopen the document themselves; streams are sent as bytes
+        source = self._open_source()
+        if not isinstance(source, Path):
+            source = source.read()
+        
+        ranges = self._page_ranges(self.page_count)
+        pool = _page_pool(self.page_workers)
+        futures = [
+            pool.submit(_extract_page_range, self.backend, source, start, stop, self.bounded_memory)
+            for start, stop in ranges
+        ]
+        return [text for future in futures for text in future.result()]
+    
+    def _identify_sections(self, text: str) -> Dict[str, str]:
+        """Identify common resume sections."""
+        return self.segmenter.segment(text.split('\n'))
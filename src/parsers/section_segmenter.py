@@ -0,0 +1,127 @@
+from typing import Dict, Iterable, List, Optional
+import re
+
+# Header phrases per section; words may be run together or spaced out,
+# since PDF extraction often drops the spaces in headings
+DEFAULT_SECTION_HEADERS = {
+    'summary': ['professional summary', 'executive summary', 'career summary', 'summary',
+                'professional profile', 'profile', 'career objective', 'objective'],
+    'experience': ['work experience', 'professional experience', 'relevant experience', 'experience',
+                   'employment history', 'employment', 'work history'],
+    'education': ['education', 'academic background', 'academic qualifications', 'academics', 'qualifications'],
+    'skills': ['technical skills', 'key skills', 'skills', 'core competencies', 'competencies'],
+    'certifications': ['certifications', 'certificates', 'accreditations'],
+    'projects': ['key projects', 'other projects', 'projects'],
+    'references': ['references'],
+    'languages': ['languages', 'language proficiency'],
+    'awards': ['awards', 'honors', 'achievements']
+}
+
+# Words that only appear in headings after a section's own phrase, as in
+# "Education and Training"; any vocabulary phrase may also follow one
+COMBINED_HEADER_WORDS = ['training', 'courses', 'coursework', 'tools', 'technologies', 'interests',
+                         'activities', 'publications', 'affiliations', 'memberships', 'volunteering']
+
+# Longest line that can still be a section header; longer lines skip the regex
+MAX_HEADER_LENGTH = 80
+
+class SectionSegmenter:
+    """
+    Splits resume lines into sections using one precompiled header regex.
+
+    A line is a header only if the whole line is a header phrase, optionally
+    joined by "&", "and", "/" or "," to further heading words (any phrase
+    in the vocabulary, or COMBINED_HEADER_WORDS) as in "Education &
+    Certifications", and optionally followed by a colon. Body text that
+    merely mentions "experience", such as "Skills and experience with
+    Java", never starts a new section. Each line is classified with a
+    single regex call.
+    """
+
+    def __init__(self, vocabulary: Optional[Dict[str, List[str]]] = None):
+        """
+        Args:
+            vocabulary: Section name -> header phrases, checked in order.
+                Defaults to DEFAULT_SECTION_HEADERS.
+        """
+        self.vocabulary = vocabulary or DEFAULT_SECTION_HEADERS
+
+        # Group names must be identifiers, so sections map to s0, s1, ...
+        self._group_sections = {}
+        groups = []
+        for index, (section, phrases) in enumerate(self.vocabulary.items()):
+            group = f"s{index}"
+            self._group_sections[group] = section
+            groups.append(f"(?P<{group}>{self._alternatives(phrases)})")
+        heading_words = self._alternatives(
+            [phrase for phrases in self.vocabulary.values() for phrase in phrases] + COMBINED_HEADER_WORDS
+        )
+
+        self._pattern = re.compile(
+            r'\s*(?:' + '|'.join(groups) + r')'
+            r'(?:\s*(?:&|and|/|,)\s*(?:' + heading_words + r'))*'
+            r'\s*[:\-–]?\s*',
+            re.IGNORECASE
+        )
+
+    @staticmethod
+    def _alternatives(phrases: List[str]) -> str:
+        """Regex alternation of phrases, longest first, words spaced or run together."""
+        return '|'.join(
+            r'\s*'.join(re.escape(word) for word in phrase.split())
+            for phrase in sorted(set(phrases), key=len, reverse=True)
+        )
+
+    def classify(self, line: str) -> Optional[str]:
+        """
+        Return the section a header line starts, or None for body text.
+        """
+        if len(line) > MAX_HEADER_LENGTH:
+            return None
+        match = self._pattern.fullmatch(line)
+        if match is None:
+            return None
+        return self._group_sections[match.lastgroup]
+
+    def segment(self, lines: Iterable[str], strip_lines: bool = False) -> Dict[str, str]:
+        """
+        Group lines under the section header that precedes them.
+
+        Args:
+            lines: Lines of resume text in reading order
+            strip_lines: Strip each line and drop empty ones
+
+        Returns:
+            Dict mapping section name to its text; text before the first
+            header is stored under 'header'
+        """
+        sections = {}
+        current_section = 'header'  # Default section
+        section_content = []
+        classify = self.classify
+
+        for line in lines:
+            if strip_lines:
+                line = line.strip()
+                if not line:
+                    continue
+
+            matched_section = classify(line)
+            if matched_section:
+                # Save previous section content
+                if section_content:
+                    sections[current_section] = '\n'.join(section_content)
+                # Start new section
+                current_section = matched_section
+                section_content = []
+            else:
+                section_content.append(line)
+
+        # Save the last section
+        if section_content:
+            sections[current_section] = '\n'.join(section_content)
+
+        return sections
+
+# Shared instance used by parsers that are not given a custom vocabulary
+DEFAULT_SEGMENTER = SectionSegmenter()
@@ -0,0 +1,101 @@
+from typing import Dict, Any, Iterator
+import xml.etree.ElementTree as ET
+import zipfile
+
+from .base_parser import BaseParser
+
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+MARKUP_COMPATIBILITY_NAMESPACE = '{http://schemas.openxmlformats.org/markup-compatibility/2006}'
+
+PARAGRAPH = WORD_NAMESPACE + 'p'
+RUN = WORD_NAMESPACE + 'r'
+TEXT = WORD_NAMESPACE + 't'
+TAB = WORD_NAMESPACE + 'tab'
+BREAKS = (WORD_NAMESPACE + 'br', WORD_NAMESPACE + 'cr')
+TABLE = WORD_NAMESPACE + 'tbl'
+# Legacy copy of content already present in mc:Choice, e.g. text boxes
+FALLBACK = MARKUP_COMPATIBILITY_NAMESPACE + 'Fallback'
+
+class StreamingDocxParser(BaseParser):
+    """
+    Parser for DOCX resume documents that streams word/document.xml.
+    
+    Paragraph text is read with an incremental XML parser straight out of
+    the zip archive, without building the python-docx object model. Unlike
+    DocxParser it also returns the paragraphs inside tables and hyperlinks.
+    """
+    
+    file_type = "docx"
+    text_unit = "paragraph"
+    
+    def parse(self) -> Dict[str, Any]:
+        """Parse DOCX resume and extract structured content."""
+        paragraphs = list(self.iter_paragraphs())
+        
+        return {
+            'raw_text': "\n".join(paragraphs),
+            'sections': self._identify_sections(paragraphs)
+        }
+    
+    def iter_paragraphs(self) -> Iterator[str]:
+        """
+        Yield the text of each paragraph in document order.
+        
+        Runs are converted the way python-docx does: tabs become '\\t' and
+        line breaks '\\n'. Table cells yield one entry per paragraph.
+        
+        Raises:
+            ValueError: If the archive has no word/document.xml
+        """
+        with zipfile.ZipFile(self._open_source()) as archive:
+            try:
+                document_xml = archive.open('word/document.xml')
+            except KeyError:
+                raise ValueError("Not a Word document: word/document.xml is missing")
+            
+            with document_xml:
+                # Text parts of the paragraphs currently open; text boxes can
+                # nest a paragraph inside another one
+                open_paragraphs = []
+                run_depth = 0
+                fallback_depth = 0
+                
+                for event, elem in ET.iterparse(document_xml, events=('start', 'end')):
+                    tag = elem.tag
+                    if event == 'start':
+                        if tag == FALLBACK:
+                            fallback_depth += 1
+                        elif fallback_depth:
+                            continue
+                        elif tag == PARAGRAPH:
+                            open_paragraphs.append([])
+                        elif tag == RUN:
+                            run_depth += 1
+                        continue
+                    
+                    if tag == FALLBACK:
+                        fallback_depth -= 1
+                        elem.clear()
+                    elif fallback_depth:
+                        continue
+                    elif tag == PARAGRAPH:
+                        yield ''.join(open_paragraphs.pop())
+                        elem.clear()
+                    elif tag == RUN:
+                        run_depth -= 1
+                    elif run_depth and open_paragraphs:
+                        if tag == TEXT:
+                            open_paragraphs[-1].append(elem.text or '')
+                        elif tag == TAB:
+                            open_paragraphs[-1].append('\t')
+                        elif tag in BREAKS:
+                            open_paragraphs[-1].append('\n')
+                    elif tag == TABLE:
+                        elem.clear()
+    
+    def iter_text(self) -> Iterator[str]:
+        return self.iter_paragraphs()
+    
+    def _identify_sections(self, paragraphs) -> Dict[str, str]:
+        """Identify common resume sections by analyzing text."""
+        return self.segmenter.segment(paragraphs, strip_lines=True)
@@ -0,0 +1,266 @@
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+import hashlib
+import re
+import time
+
+from src.parsers.parser_factory import get_parser
+from src.processors.job_profile import JobProfile, match_profiles
+from src.processors.resume_model import SkillAssessment
+from src.processors.resume_transformer import transform_parsed_resume
+from src.processors.screening import ScreeningMatcher
+from src.formatters.dynamic_resume_formatter import DynamicResumeFormatter
+from src.storage.near_duplicates import NearDuplicateIndex
+
+# Module-level functions so they can be shipped to a process pool
+
+def split_terms(value: Optional[str]) -> List[str]:
+    """Convert a comma-separated form field into a list of terms."""
+    return [s.strip() for s in (value or "").split(',') if s.strip()]
+
+def output_filename(candidate_name: str, unique: Optional[str] = None) -> str:
+    """
+    Filename for a candidate's formatted resume.
+    
+    The name comes from the resume itself, so anything but letters, digits
+    and hyphens (path separators and quotes included) becomes '_'. Files
+    saved side by side pass unique, so two candidates of the same name
+    never overwrite each other.
+    """
+    name_part = re.sub(r'[^\w-]+', '_', candidate_name).strip('_') or 'formatted'
+    if unique:
+        name_part = f"{name_part}_{unique}"
+    return f"{name_part}_resume.docx"
+
+def summarize_skill_matches(skill_matches: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a SkillMatcher result to the score breakdown the API returns."""
+    return SkillAssessment.from_matches(skill_matches).summary()
+
+def run_pipeline(content: bytes,
+                 parsed_resume: Optional[Dict[str, Any]],
+                 job_profile: Optional[JobProfile],
+                 output_dir: Optional[Path],
+                 ranked_profiles: Optional[Sequence[JobProfile]] = None,
+                 render: bool = True,
+                 near_duplicates: Optional[NearDuplicateIndex] = None,
+                 reuse_duplicates: bool = False) -> Tuple[Dict[str, Any], Dict[str, Any], Optional[bytes], Dict[str, Any]]:
+    """
+    Run parse -> match -> transform -> render for one resume.
+    
+    Args:
+        content: Raw bytes of the uploaded file
+        parsed_resume: Previously cached parse result, or None to parse content
+        job_profile: Job spec to score against, or None to skip scoring
+        output_dir: Directory the formatted resume is written to, or None to
+            render it in memory and return its bytes
+        ranked_profiles: Job specs to score against in one scan and rank, in
+            place of job_profile; the best match is used for rendering
+        render: Whether to render the formatted resume at all
+        near_duplicates: Index to check the resume's text against and add
+            it to; a near-duplicate of an earlier upload is reported in the
+            response under 'near_duplicate'
+        reuse_duplicates: For a near-duplicate, reuse the earlier upload's
+            candidate data and score for the same job spec(s) instead of
+            matching and transforming again; results are only kept when
+            the index has a result TTL
+        
+    Returns:
+        Tuple of (parsed resume, API response dict, document bytes or None,
+        stage info with per-stage 'timings' in seconds, 'pages' and the
+        parse's 'peak_memory_bytes' when the parser tracks it)
+    """
+    timings = {}
+    pages = None
+    peak_memory_bytes = None
+    
+    if parsed_resume is None:
+        # Parse straight from memory; the format is detected from the bytes
+        start = time.perf_counter()
+        parser = get_parser(content)
+        parsed_resume = parser.parse()
+        pages = parser.page_count
+        peak_memory_bytes = getattr(parser, 'peak_memory_bytes', None)
+        timings['parse'] = time.perf_counter() - start
+    
+    # What the match and transform results depend on besides the resume
+    if ranked_profiles:
+        variant = 'rank:' + ','.join(profile.profile_id for profile in ranked_profiles)
+    elif job_profile is not None and job_profile.must_have_skills:
+        variant = job_profile.profile_id
+    else:
+        variant = ''
+    
+    near_duplicate = None
+    reused = None
+    if near_duplicates is not None:
+        start = time.perf_counter()
+        content_hash = hashlib.sha256(content).hexdigest()
+        signature = near_duplicates.signature(parsed_resume['raw_text'])
+        if signature is not None:
+            near_duplicate = near_duplicates.find(signature)
+            near_duplicates.add(content_hash, signature)
+        if near_duplicate is not None and reuse_duplicates:
+            reused = near_duplicates.get_result(near_duplicate['content_hash'], variant)
+            near_duplicate['reused'] = reused is not None
+        timings['dedupe'] = time.perf_counter() - start
+    
+    # Process skills if provided
+    skill_matches = None
+    rankings = None
+    skill_assessment = None
+    if reused is not None:
+        rankings = reused['rankings']
+        skill_assessment = reused['skill_assessment']
+    elif ranked_profiles:
+        start = time.perf_counter()
+        all_matches = match_profiles(parsed_resume['raw_text'], ranked_profiles)
+        # Stable sort, so ties keep the order the specs were given in
+        order = sorted(range(len(ranked_profiles)), key=lambda i: -all_matches[i]['total_score'])
+        rankings = [
+            {
+                "rank": rank,
+                "index": i,
+                "job_profile_id": ranked_profiles[i].profile_id,
+                **summarize_skill_matches(all_matches[i])
+            }
+            for rank, i in enumerate(order, 1)
+        ]
+        skill_matches = all_matches[order[0]]
+        timings['match'] = time.perf_counter() - start
+    elif job_profile is not None and job_profile.must_have_skills:
+        start = time.perf_counter()
+        skill_matches = job_profile.match(parsed_resume['raw_text'])
+        timings['match'] = time.perf_counter() - start
+    if skill_matches and rankings is None:
+        skill_assessment = summarize_skill_matches(skill_matches)
+    
+    if reused is not None:
+        candidate_data = reused['candidate_data']
+    else:
+        # Transform parsed resume into candidate data format
+        start = time.perf_counter()
+        candidate_data = transform_parsed_resume(parsed_resume, skill_matches)
+        timings['transform'] = time.perf_counter() - start
+    
+    if near_duplicates is not None and near_duplicates.stores_results:
+        # Kept for later near-duplicates of this upload to reuse
+        near_duplicates.put_result(content_hash, variant, {
+            'candidate_data': candidate_data,
+            'rankings': rankings,
+            'skill_assessment': skill_assessment
+        })
+    
+    # Prepare response
+    response = {
+        "candidate_name": candidate_data['name']
+    }
+    
+    document = None
+    if render:
+        # Format resume
+        start = time.perf_counter()
+        formatter = DynamicResumeFormatter()
+        
+        if output_dir is None:
+            filename = output_filename(candidate_data['name'] or '')
+        else:
+            # Same upload and spec, same file; anything else gets its own
+            render_key = hashlib.sha256(content + b'|' + variant.encode()).hexdigest()[:12]
+            filename = output_filename(candidate_data['name'] or '', render_key)
+        response = {"filename": filename, **response}
+        
+        if output_dir is None:
+            # Keep the rendered document in memory for the caller to deliver
+            document = formatter.render_to_bytes(candidate_data)
+        else:
+            # Format and save the resume
+            formatter.format_resume(candidate_data, str(Path(output_dir) / filename))
+            response["download_url"] = f"/download/{filename}"
+        timings['render'] = time.perf_counter() - start
+    
+    if rankings is not None:
+        response["rankings"] = rankings
+    elif skill_assessment:
+        response["skill_assessment"] = skill_assessment
+    if near_duplicate is not None:
+        response["near_duplicate"] = near_duplicate
+    
+    return parsed_resume, response, document, {
+        'timings': timings,
+        'pages': pages,
+        'peak_memory_bytes': peak_memory_bytes
+    }
+
+def run_screening(content: bytes,
+                  cached_text: Optional[str],
+                  job_profile: JobProfile,
+                  min_score: Optional[float] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Screen one resume, extracting its text only until the answer is decided.
+    
+    Pages (PDF) or paragraphs (DOCX) are fed to a ScreeningMatcher as they
+    are extracted, and extraction stops once it decides. Nothing is
+    segmented, transformed or rendered.
+    
+    Args:
+        content: Raw bytes of the uploaded file
+        cached_text: Raw text of a previously cached parse, screened as a
+            single unit instead of extracting content again
+        job_profile: Job spec to screen against
+        min_score: Total score to reach; None to require every must-have skill
+        
+    Returns:
+        Tuple of (API response dict, stage info with the 'screen' timing in
+        seconds under 'timings' and the 'pages' extracted)
+        
+    Raises:
+        ValueError: If min_score is None and the spec has no must-have skills
+    """
+    start = time.perf_counter()
+    screening = ScreeningMatcher(job_profile, min_score)
+    
+    parser = None
+    unit = "document"
+    read_all = False
+    if not screening.decided:
+        if cached_text is not None:
+            screening.feed(cached_text)
+            read_all = True
+        else:
+            parser = get_parser(content)
+            unit = parser.text_unit
+            chunks = parser.iter_text()
+            try:
+                for chunk in chunks:
+                    if screening.feed(chunk):
+                        break
+                else:
+                    read_all = True
+            finally:
+                # Releases the document when extraction stopped early
+                chunks.close()
+        screening.finish()
+    
+    total = parser.page_count if parser is not None and unit == "page" else None
+    if read_all:
+        total = screening.chunks
+    response = {
+        "passed": screening.passed,
+        "mode": "threshold" if min_score is not None else "must_have",
+        "decided_by": screening.reason,
+        "stopped_at": {
+            "unit": unit,
+            "read": screening.chunks,
+            # None when extraction stopped before the document's end was known
+            "total": total
+        },
+        "stopped_early": total is None or screening.chunks < total,
+        "skill_assessment": summarize_skill_matches(screening.result())
+    }
+    if min_score is not None:
+        response["min_score"] = min_score
+    
+    return response, {
+        'timings': {'screen': time.perf_counter() - start},
+        'pages': screening.chunks if unit == "page" else None
+    }
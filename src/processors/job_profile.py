@@ -0,0 +1,191 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from .skill_matcher import SkillMatcher, compile_terms
+
+class JobProfile:
+    """
+    A job spec (must-have, nice-to-have and industry terms) scored as a unit.
+
+    Profiles are small and picklable, so they can be sent to pipeline
+    worker processes; each process compiles a profile's TermMatcher once
+    through the compile_terms cache.
+    """
+
+    def __init__(self,
+                 must_have_skills: Iterable[str],
+                 nice_to_have_skills: Iterable[str] = (),
+                 industry_experience: Iterable[str] = ()):
+        self.must_have_skills = tuple(must_have_skills)
+        self.nice_to_have_skills = tuple(nice_to_have_skills)
+        self.industry_experience = tuple(industry_experience)
+
+    @property
+    def terms(self) -> Tuple[str, ...]:
+        """Every term of the spec, in the order compile_terms expects."""
+        return self.must_have_skills + self.nice_to_have_skills + self.industry_experience
+
+    @property
+    def profile_id(self) -> str:
+        """Content-derived id, so registering the same spec twice gives one id."""
+        spec = [self.must_have_skills, self.nice_to_have_skills, self.industry_experience]
+        return hashlib.sha256(json.dumps(spec).encode()).hexdigest()[:16]
+
+    def match(self, resume_text: str) -> Dict[str, Any]:
+        """
+        Score a resume against this profile.
+
+        Returns:
+            The same result dict as SkillMatcher.match_skills
+        """
+        found = compile_terms(self.terms).find(resume_text.lower())
+        return SkillMatcher().score_matches(
+            found,
+            list(self.must_have_skills),
+            list(self.nice_to_have_skills),
+            list(self.industry_experience)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'job_profile_id': self.profile_id,
+            'must_have_skills': list(self.must_have_skills),
+            'nice_to_have_skills': list(self.nice_to_have_skills),
+            'industry_experience': list(self.industry_experience)
+        }
+
+def match_profiles(resume_text: str, profiles: Sequence[JobProfile]) -> List[Dict[str, Any]]:
+    """
+    Score a resume against many profiles with one scan of its text.
+
+    The union of every profile's terms is compiled into a single
+    TermMatcher; each profile is then scored from the shared set of
+    found terms.
+
+    Returns:
+        SkillMatcher.match_skills result dicts, in the order of profiles
+    """
+    terms = tuple(dict.fromkeys(term for profile in profiles for term in profile.terms))
+    found = compile_terms(terms).find(resume_text.lower())
+    matcher = SkillMatcher()
+    return [
+        matcher.score_matches(
+            found,
+            list(profile.must_have_skills),
+            list(profile.nice_to_have_skills),
+            list(profile.industry_experience)
+        )
+        for profile in profiles
+    ]
+
+class JobProfileRegistry:
+    """
+    Registered job profiles, looked up by id.
+
+    Profiles are kept in an in-process LRU. With a db_path they are also
+    stored in SQLite, so every server process sees profiles registered by
+    the others and they survive a restart; the LRU then only caches
+    profiles this process has used.
+
+    The registry holds specs only. Matchers are compiled by compile_terms
+    in whichever process first scores against a profile, which under the
+    process executor is each pipeline worker, not the API process.
+    get() and register() may touch SQLite, so async callers run them in
+    a thread.
+    """
+
+    def __init__(self,
+                 max_entries: int = 256,
+                 db_path: Optional[Union[str, Path]] = None,
+                 max_stored: int = 0):
+        """
+        Args:
+            max_entries: Profiles kept in memory
+            db_path: SQLite file to store profiles in, or None for memory only
+            max_stored: Profiles kept in the database, the least recently
+                registered dropped first; 0 for no limit
+        """
+        self.max_entries = max_entries
+        self.db_path = Path(db_path) if db_path is not None else None
+        self.max_stored = max_stored
+        self._profiles = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.db_path is not None:
+            self.db_path.parent.mkdir(exist_ok=True, parents=True)
+            with self._connect() as conn:
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS job_profiles (
+                        id TEXT PRIMARY KEY,
+                        spec TEXT NOT NULL,
+                        registered_at REAL NOT NULL
+                    )
+                ''')
+                conn.execute('CREATE INDEX IF NOT EXISTS job_profiles_registered ON job_profiles (registered_at)')
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _remember(self, profile_id: str, profile: JobProfile):
+        with self._lock:
+            self._profiles[profile_id] = profile
+            self._profiles.move_to_end(profile_id)
+            while len(self._profiles) > self.max_entries:
+                self._profiles.popitem(last=False)
+
+    def register(self, profile: JobProfile) -> str:
+        """
+        Register a profile.
+
+        Returns:
+            The profile id to reference it by
+        """
+        profile_id = profile.profile_id
+        if self.db_path is not None:
+            spec = [profile.must_have_skills, profile.nice_to_have_skills, profile.industry_experience]
+            with self._connect() as conn:
+                conn.execute(
+                    'INSERT INTO job_profiles (id, spec, registered_at) VALUES (?, ?, ?) '
+                    'ON CONFLICT (id) DO UPDATE SET registered_at = excluded.registered_at',
+                    (profile_id, json.dumps(spec), time.time())
+                )
+                if self.max_stored:
+                    conn.execute(
+                        'DELETE FROM job_profiles WHERE id IN ('
+                        'SELECT id FROM job_profiles ORDER BY registered_at DESC LIMIT -1 OFFSET ?)',
+                        (self.max_stored,)
+                    )
+        self._remember(profile_id, profile)
+        return profile_id
+
+    def get(self, profile_id: str) -> Optional[JobProfile]:
+        """Return a registered profile, or None if unknown or evicted."""
+        with self._lock:
+            profile = self._profiles.get(profile_id)
+            if profile is not None:
+                self._profiles.move_to_end(profile_id)
+                return profile
+        if self.db_path is None:
+            return None
+
+        # Registered by another process, or before a restart
+        with self._connect() as conn:
+            row = conn.execute('SELECT spec FROM job_profiles WHERE id = ?', (profile_id,)).fetchone()
+        if row is None:
+            return None
+        profile = JobProfile(*json.loads(row[0]))
+        self._remember(profile_id, profile)
+        return profile
@@ -0,0 +1,206 @@
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+class Section:
+    """One named section of a parsed resume."""
+
+    __slots__ = ('name', 'text')
+
+    def __init__(self, name: str, text: str):
+        self.name = name
+        self.text = text
+
+    @property
+    def lines(self) -> List[str]:
+        """Stripped, non-empty lines of the section."""
+        return [line for line in map(str.strip, self.text.split('\n')) if line]
+
+    def __repr__(self) -> str:
+        return f"Section({self.name!r}, {len(self.text)} chars)"
+
+# Section name tuples shared between resumes; most resumes use one of a
+# few layouts, so each holds a reference instead of its own tuple
+_SECTION_NAMES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+_MAX_SHARED_LAYOUTS = 4096
+
+class ParsedResume:
+    """
+    Parser output: the raw text and the section texts, without a dict per resume.
+
+    Section names and texts are kept as two tuples, the names shared with
+    other resumes of the same layout; Section objects and the {name: text}
+    dict are only built when asked for.
+    """
+
+    __slots__ = ('raw_text', '_names', '_texts')
+
+    def __init__(self, raw_text: str, sections: Mapping[str, str]):
+        self.raw_text = raw_text
+        names = tuple(sections)
+        shared = _SECTION_NAMES.get(names)
+        if shared is None and len(_SECTION_NAMES) < _MAX_SHARED_LAYOUTS:
+            shared = _SECTION_NAMES[names] = names
+        self._names = names if shared is None else shared
+        self._texts = tuple(sections.values())
+
+    @classmethod
+    def from_dict(cls, parsed_resume: Mapping[str, Any]) -> 'ParsedResume':
+        """Wrap the dict returned by parser.parse()."""
+        return cls(parsed_resume.get('raw_text', ''), parsed_resume.get('sections', {}))
+
+    @property
+    def section_names(self) -> Tuple[str, ...]:
+        return self._names
+
+    def section_text(self, name: str) -> Optional[str]:
+        """Text of a section, or None if the resume has no such section."""
+        try:
+            return self._texts[self._names.index(name)]
+        except ValueError:
+            return None
+
+    def section(self, name: str) -> Optional[Section]:
+        text = self.section_text(name)
+        return Section(name, text) if text is not None else None
+
+    def __iter__(self) -> Iterator[Section]:
+        for name, text in zip(self._names, self._texts):
+            yield Section(name, text)
+
+    @property
+    def sections(self) -> Dict[str, str]:
+        return dict(zip(self._names, self._texts))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The dict shape parser.parse() returns."""
+        return {'raw_text': self.raw_text, 'sections': self.sections}
+
+class Education:
+    """One education entry: degree, institution and graduation year."""
+
+    __slots__ = ('degree', 'institution', 'year')
+
+    def __init__(self, degree: str = '', institution: str = '', year: str = ''):
+        self.degree = degree
+        self.institution = institution
+        self.year = year
+
+    def to_dict(self) -> Dict[str, str]:
+        return {'degree': self.degree, 'institution': self.institution, 'year': self.year}
+
+    def __repr__(self) -> str:
+        return f"Education({self.degree!r}, {self.institution!r}, {self.year!r})"
+
+class Job:
+    """One experience entry with its bullet points."""
+
+    __slots__ = ('company', 'location', 'dates', 'role', 'bullets')
+
+    def __init__(self,
+                 company: str = '',
+                 location: str = '',
+                 dates: str = '',
+                 role: str = '',
+                 bullets: Sequence[str] = ()):
+        self.company = company
+        self.location = location
+        self.dates = dates
+        self.role = role
+        self.bullets = tuple(bullets)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'company': self.company,
+            'location': self.location,
+            'dates': self.dates,
+            'role': self.role,
+            'bullets': list(self.bullets)
+        }
+
+    def __repr__(self) -> str:
+        return f"Job({self.company!r}, {self.role!r}, {len(self.bullets)} bullets)"
+
+class SkillAssessment:
+    """A SkillMatcher result, flattened into one object."""
+
+    __slots__ = (
+        'total_score',
+        'must_have_score', 'must_have_matches', 'must_have_missing',
+        'nice_to_have_score', 'nice_to_have_matches',
+        'industry_score', 'industry_matches',
+        'education_present', 'education_score'
+    )
+
+    def __init__(self,
+                 total_score: float,
+                 must_have_score: float,
+                 must_have_matches: Sequence[str],
+                 must_have_missing: Sequence[str],
+                 nice_to_have_score: float,
+                 nice_to_have_matches: Sequence[str],
+                 industry_score: float,
+                 industry_matches: Sequence[str],
+                 education_present: bool,
+                 education_score: int):
+        self.total_score = total_score
+        self.must_have_score = must_have_score
+        self.must_have_matches = tuple(must_have_matches)
+        self.must_have_missing = tuple(must_have_missing)
+        self.nice_to_have_score = nice_to_have_score
+        self.nice_to_have_matches = tuple(nice_to_have_matches)
+        self.industry_score = industry_score
+        self.industry_matches = tuple(industry_matches)
+        self.education_present = education_present
+        self.education_score = education_score
+
+    @classmethod
+    def from_matches(cls, skill_matches: Mapping[str, Any]) -> 'SkillAssessment':
+        """Build from a SkillMatcher.match_skills result dict."""
+        return cls(
+            skill_matches['total_score'],
+            skill_matches['must_have']['score'],
+            skill_matches['must_have']['matches'],
+            skill_matches['must_have']['missing'],
+            skill_matches['nice_to_have']['score'],
+            skill_matches['nice_to_have']['matches'],
+            skill_matches['industry']['score'],
+            skill_matches['industry']['matches'],
+            skill_matches['education']['present'],
+            skill_matches['education']['score']
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The nested shape the resume template reads."""
+        return {
+            'total_score': self.total_score,
+            'must_have': {
+                'score': self.must_have_score,
+                'matches': list(self.must_have_matches),
+                'missing': list(self.must_have_missing)
+            },
+            'nice_to_have': {
+                'score': self.nice_to_have_score,
+                'matches': list(self.nice_to_have_matches)
+            },
+            'industry': {
+                'score': self.industry_score,
+                'matches': list(self.industry_matches)
+            },
+            'education': {
+                'present': self.education_present,
+                'score': self.education_score
+            }
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """The flat score breakdown the API returns."""
+        return {
+            'total_score': self.total_score,
+            'must_have_score': self.must_have_score,
+            'nice_to_have_score': self.nice_to_have_score,
+            'industry_score': self.industry_score,
+            'education_score': self.education_score,
+            'missing_must_have': list(self.must_have_missing)
+        }
+
+    def __repr__(self) -> str:
+        return f"SkillAssessment(total_score={self.total_score!r})"
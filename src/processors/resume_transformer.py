@@ -1,228 +1,251 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Mapping, Optional, Tuple, Union
 import re
 
+from .resume_model import Education, Job, ParsedResume, SkillAssessment
+
+# Characters that start a bulleted list item
+BULLET_CHARS = '•-*'
+
+# Summary points and certifications are separated by newlines or bullets
+ITEM_SPLIT_PATTERN = re.compile(r'[\n•\-\*]+')
+# Graduation year written as "(2018)"
+YEAR_PATTERN = re.compile(r'\((\d{4})\)')
+# A job's second line holds its dates if it mentions a year, a mm/yy date or a month
+DATE_PATTERN = re.compile(r'\d{4}|\d{2}/\d{2}|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec')
+
+def _first_line(text: str) -> str:
+    """First line of text once surrounding whitespace is removed."""
+    return text.strip().partition('\n')[0].strip()
+
+def _education_entry(first_line: str) -> Education:
+    """Degree, institution and year from the first line of an education block."""
+    degree, institution, year = '', '', ''
+
+    # Look for year in parentheses
+    year_match = YEAR_PATTERN.search(first_line)
+    if year_match:
+        year = year_match.group(1)
+        first_line = first_line.replace(year_match.group(0), '').strip()
+
+    # If there's a comma, it's likely "degree, institution"
+    if ',' in first_line:
+        degree, institution = first_line.split(',', 1)
+        degree, institution = degree.strip(), institution.strip()
+    else:
+        institution = first_line
+    return Education(degree, institution, year)
+
+def _parse_education(text: str) -> List[Education]:
+    """
+    One entry per education block, from the block's first line.
+
+    Blocks are separated by blank lines, and every line after the first
+    that starts with a bullet also starts one, without its bullet. A bullet
+    line right after a blank line keeps its bullet, since the blank line
+    already separated the blocks.
+    """
+    education = []
+    separated = False  # A blank line since the last text line
+    need_first = True  # The current block has no text yet
+
+    for index, line in enumerate(text.split('\n')):
+        line = line.strip()
+        if not line:
+            separated = separated or index > 0
+            continue
+
+        if separated:
+            separated = False
+        elif index and line[0] in BULLET_CHARS:
+            line = line[1:].strip()
+            if not line:
+                need_first = True
+                continue
+        elif not need_first:
+            continue  # Later lines of a block are ignored
+
+        need_first = False
+        education.append(_education_entry(line))
+    return education
+
+def _parse_experience(text: str) -> List[Job]:
+    """
+    One job per block of lines separated by blank lines.
+
+    A job's lines are, in order: company (and location after a comma),
+    dates or role, role if the line before held the dates, then bullets.
+    """
+    jobs = []  # [company, location, dates, role, bullets] of each job
+    job = None
+    state = 0  # What the next line of the job holds: 1 dates or role, 2 role, 3 bullet
+
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            job = None
+            continue
+
+        if job is None:
+            company, comma, location = line.partition(',')
+            job = [company.strip() if comma else line, location.strip(), '', '', []]
+            jobs.append(job)
+            state = 1
+        elif state == 1:
+            if DATE_PATTERN.search(line):
+                job[2] = line
+                state = 2
+            else:
+                job[3] = line
+                state = 3
+        elif state == 2:
+            job[3] = line
+            state = 3
+        else:
+            job[4].append(line[1:].strip() if line[0] in BULLET_CHARS else line)
+
+    return [Job(*fields) for fields in jobs]
+
+def _parse_skills(text: str) -> Dict[str, List[str]]:
+    skills = {}
+    category = 'Technical Skills'  # Default category
+    items: Optional[List[str]] = None  # The list of the current category
+
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+
+        # If line ends with a colon, it's a category; naming one again starts it over
+        if line.endswith(':'):
+            category = line[:-1].strip()
+            items = skills[category] = []
+            continue
+
+        if line[0] in BULLET_CHARS:
+            line = line[1:].strip()
+        if items is None:
+            items = skills[category] = []
+
+        # Check if line contains multiple skills separated by commas
+        if ',' in line:
+            items.extend(skill.strip() for skill in line.split(','))
+        else:
+            items.append(line)
+    return skills
+
+def _split_items(text: str) -> List[str]:
+    return [item.strip() for item in ITEM_SPLIT_PATTERN.split(text) if item.strip()]
+
+class CandidateRecord:
+    """
+    Template data for one candidate, read from its parsed sections on demand.
+
+    A record only holds the ParsedResume and the SkillAssessment; name,
+    experience, education and the rest are extracted when accessed. Many
+    candidates can be kept in memory for ranking at the cost of their
+    section text, and to_dict() produces the template's dict when one
+    is rendered.
+
+    Records are opt-in: the API and bulk ingestion go through
+    transform_parsed_resume, which builds one per resume and keeps only
+    its dict. Code that holds many candidates at once should keep the
+    records themselves.
+    """
+
+    __slots__ = ('parsed_resume', 'skill_assessment')
+
+    def __init__(self, parsed_resume: ParsedResume, skill_assessment: Optional[SkillAssessment] = None):
+        self.parsed_resume = parsed_resume
+        self.skill_assessment = skill_assessment
+
+    @classmethod
+    def from_parsed(cls,
+                    parsed_resume: Union[ParsedResume, Mapping[str, Any]],
+                    skill_matches: Optional[Mapping[str, Any]] = None) -> 'CandidateRecord':
+        """
+        Args:
+            parsed_resume: ParsedResume or the dict returned by parser.parse()
+            skill_matches: Optional SkillMatcher.match_skills result
+        """
+        if not isinstance(parsed_resume, ParsedResume):
+            parsed_resume = ParsedResume.from_dict(parsed_resume)
+        return cls(parsed_resume, SkillAssessment.from_matches(skill_matches) if skill_matches else None)
+
+    @property
+    def name(self) -> str:
+        # The name is typically the first line of the header
+        header = self.parsed_resume.section_text('header')
+        return _first_line(header) if header is not None else ""
+
+    def _summary(self) -> Tuple[str, List[str]]:
+        """Title (the summary's first line) and the summary points after it."""
+        summary_text = self.parsed_resume.section_text('summary')
+        if summary_text is None:
+            return "", []
+        title = _first_line(summary_text)
+        # Remove the first line if it was used as title
+        if title and summary_text.startswith(title):
+            summary_text = summary_text[len(title):]
+        return title, _split_items(summary_text)
+
+    @property
+    def title(self) -> str:
+        return self._summary()[0]
+
+    @property
+    def summary_points(self) -> List[str]:
+        return self._summary()[1]
+
+    @property
+    def education(self) -> List[Education]:
+        text = self.parsed_resume.section_text('education')
+        return _parse_education(text) if text is not None else []
+
+    @property
+    def certifications(self) -> List[str]:
+        text = self.parsed_resume.section_text('certifications')
+        return _split_items(text) if text is not None else []
+
+    @property
+    def experience(self) -> List[Job]:
+        text = self.parsed_resume.section_text('experience')
+        return _parse_experience(text) if text is not None else []
+
+    @property
+    def skills(self) -> Dict[str, List[str]]:
+        # A skills section with any text always yields at least one category
+        text = self.parsed_resume.section_text('skills')
+        return _parse_skills(text) if text is not None else {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The candidate_data dict the resume template expects."""
+        title, summary_points = self._summary()
+        candidate_data = {
+            'name': self.name,
+            'title': title,
+            'summary_points': summary_points,
+            'education': [entry.to_dict() for entry in self.education],
+            'certifications': self.certifications,
+            'experience': [job.to_dict() for job in self.experience],
+            'skills': self.skills
+        }
+        if self.skill_assessment is not None:
+            candidate_data['skill_assessment'] = self.skill_assessment.to_dict()
+        return candidate_data
+
 def transform_parsed_resume(parsed_resume, skill_matches=None):
     """
     Transform the parsed resume into a format suitable for the template.
-    
+
+    Each section is walked once, classifying lines as blank, bullet,
+    category or text as it goes, with every pattern compiled at import.
+    Use CandidateRecord directly to keep candidates in memory compactly.
+
     Args:
         parsed_resume: The parsed resume from the parser
         skill_matches: Optional skill matching results
-        
+
     Returns:
         Dictionary in the format expected by the template
     """
-    sections = parsed_resume.get('sections', {})
-    
-    # Extract name from header
-    name = ""
-    if 'header' in sections:
-        # Typically the name is on the first line
-        header_lines = sections['header'].strip().split('\n')
-        if header_lines:
-            name = header_lines[0].strip()
-    
-    # Extract title/role
-    title = ""
-    if 'summary' in sections:
-        # Title is often in the first line of summary
-        summary_lines = sections['summary'].strip().split('\n')
-        if summary_lines:
-            title = summary_lines[0].strip()
-    
-    # Extract summary points
-    summary_points = []
-    if 'summary' in sections:
-        # Split summary into bullet points by newlines or bullet characters
-        summary_text = sections['summary']
-        # Remove the first line if it was used as title
-        if title and summary_text.startswith(title):
-            summary_text = summary_text[len(title):].strip()
-        
-        # Split by bullets or newlines
-        bullet_points = re.split(r'[\n•\-\*]+', summary_text)
-        summary_points = [point.strip() for point in bullet_points if point.strip()]
-    
-    # Extract education
-    education = []
-    if 'education' in sections:
-        edu_text = sections['education']
-        # Split by blank lines or bullets
-        edu_blocks = re.split(r'\n\s*\n+|(?:\n[\s]*[•\-\*])', edu_text)
-        
-        for block in edu_blocks:
-            if not block.strip():
-                continue
-                
-            # Try to extract degree, institution and year
-            lines = block.strip().split('\n')
-            if not lines:
-                continue
-                
-            edu_entry = {'degree': '', 'institution': '', 'year': ''}
-            
-            # First line typically has degree and/or institution
-            first_line = lines[0].strip()
-            
-            # Look for year in parentheses
-            year_match = re.search(r'\((\d{4})\)', first_line)
-            if year_match:
-                edu_entry['year'] = year_match.group(1)
-                first_line = first_line.replace(year_match.group(0), '').strip()
-            
-            # If there's a comma, it's likely "degree, institution"
-            if ',' in first_line:
-                degree, institution = first_line.split(',', 1)
-                edu_entry['degree'] = degree.strip()
-                edu_entry['institution'] = institution.strip()
-            else:
-                edu_entry['institution'] = first_line
-            
-            education.append(edu_entry)
-    
-    # Extract certifications
-    certifications = []
-    if 'certifications' in sections:
-        cert_text = sections['certifications']
-        # Split by bullets or newlines
-        cert_lines = re.split(r'[\n•\-\*]+', cert_text)
-        certifications = [cert.strip() for cert in cert_lines if cert.strip()]
-    
-    # Extract experience
-    experience = []
-    if 'experience' in sections:
-        exp_text = sections['experience']
-        # Split by multiple newlines which often indicate different jobs
-        job_blocks = re.split(r'\n\s*\n+', exp_text)
-        
-        for block in job_blocks:
-            if not block.strip():
-                continue
-                
-            lines = block.strip().split('\n')
-            if not lines:
-                continue
-                
-            job = {
-                'company': '',
-                'location': '',
-                'dates': '',
-                'role': '',
-                'bullets': []
-            }
-            
-            # First line typically has company and possibly location
-            if lines:
-                first_line = lines[0].strip()
-                if ',' in first_line:
-                    company, location = first_line.split(',', 1)
-                    job['company'] = company.strip()
-                    job['location'] = location.strip()
-                else:
-                    job['company'] = first_line
-            
-            # Second line might have dates or role
-            if len(lines) > 1:
-                second_line = lines[1].strip()
-                # Check if it looks like a date range
-                if re.search(r'\d{4}|\d{2}/\d{2}|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec', second_line):
-                    job['dates'] = second_line
-                    if len(lines) > 2:
-                        job['role'] = lines[2].strip()
-                else:
-                    job['role'] = second_line
-            
-            # Look for bullets
-            bullet_start = 3 if job['role'] else 2
-            if job['dates']:
-                bullet_start = 3 if job['role'] else 2
-            else:
-                bullet_start = 2 if job['role'] else 1
-            
-            bullets = []
-            for line in lines[bullet_start:]:
-                line = line.strip()
-                if line.startswith('•') or line.startswith('-') or line.startswith('*'):
-                    bullets.append(line[1:].strip())
-                elif line:
-                    bullets.append(line)
-            
-            job['bullets'] = bullets
-            experience.append(job)
-    
-    # Extract skills
-    skills = {}
-    if 'skills' in sections:
-        skills_text = sections['skills']
-        
-        # Try to identify categories
-        skill_lines = skills_text.strip().split('\n')
-        current_category = 'Technical Skills'  # Default category
-        
-        for line in skill_lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            # If line ends with a colon, it's likely a category
-            if line.endswith(':'):
-                current_category = line[:-1].strip()
-                skills[current_category] = []
-            else:
-                # If line starts with bullet, strip it
-                if line.startswith('•') or line.startswith('-') or line.startswith('*'):
-                    line = line[1:].strip()
-                
-                # If category doesn't exist yet, create it
-                if current_category not in skills:
-                    skills[current_category] = []
-                
-                # Check if line contains multiple skills separated by commas
-                if ',' in line:
-                    skill_items = [s.strip() for s in line.split(',')]
-                    skills[current_category].extend(skill_items)
-                else:
-                    skills[current_category].append(line)
-    
-    # If no categories found, use the entire skills section as one list
-    if not skills and 'skills' in sections:
-        skill_items = re.split(r'[\n,•\-\*]+', sections['skills'])
-        clean_skills = [s.strip() for s in skill_items if s.strip()]
-        if clean_skills:
-            skills['Technical Skills'] = clean_skills
-    
-    # Create candidate data structure
-    candidate_data = {
-        'name': name,
-        'title': title,
-        'summary_points': summary_points,
-        'education': education,
-        'certifications': certifications,
-        'experience': experience,
-        'skills': skills
-    }
-    
-    # Add skill assessment if available
-    if skill_matches:
-        candidate_data['skill_assessment'] = {
-            'total_score': skill_matches['total_score'],
-            'must_have': {
-                'score': skill_matches['must_have']['score'],
-                'matches': skill_matches['must_have']['matches'],
-                'missing': skill_matches['must_have']['missing']
-            },
-            'nice_to_have': {
-                'score': skill_matches['nice_to_have']['score'],
-                'matches': skill_matches['nice_to_have']['matches']
-            },
-            'industry': {
-                'score': skill_matches['industry']['score'],
-                'matches': skill_matches['industry']['matches']
-            },
-            'education': {
-                'present': skill_matches['education']['present'],
-                'score': skill_matches['education']['score']
-            }
-        }
-    
-    return candidate_data
\ No newline at end of file
+    return CandidateRecord.from_parsed(parsed_resume, skill_matches).to_dict()
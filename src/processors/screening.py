@@ -0,0 +1,114 @@
+from typing import Dict, Any, Optional, Set
+
+from .job_profile import JobProfile
+from .skill_matcher import EDUCATION_KEYWORDS, SkillMatcher, compile_terms
+
+# Why a screening was decided
+MUST_HAVE_FOUND = "must_have_found"
+THRESHOLD_REACHED = "threshold_reached"
+THRESHOLD_UNREACHABLE = "threshold_unreachable"
+END_OF_DOCUMENT = "end_of_document"
+
+class ScreeningMatcher:
+    """
+    Screens a resume fed in chunks, deciding as soon as the answer is known.
+
+    Without min_score the question is whether every must-have skill is
+    present; with it, whether the total score reaches min_score. Found
+    terms only accumulate, so a screening passes as soon as the text read
+    so far answers yes. It fails up front if the spec cannot score
+    min_score even with every term found, and otherwise only once the
+    whole document has been read, since any later chunk may hold the
+    missing terms.
+
+    Chunks are scanned on their own. Terms never span a newline, so
+    feeding the newline-separated pages or paragraphs of a document finds
+    exactly what match_skills finds in their joined text.
+    """
+
+    def __init__(self, job_profile: JobProfile, min_score: Optional[float] = None):
+        """
+        Args:
+            job_profile: Job spec to screen against
+            min_score: Total score to reach; None to require every
+                must-have skill instead
+
+        Raises:
+            ValueError: If min_score is None and the spec has no must-have skills
+        """
+        if min_score is None and not job_profile.must_have_skills:
+            raise ValueError("Screening needs must-have skills or a minimum score")
+        self.job_profile = job_profile
+        self.min_score = min_score
+        self.found: Set[str] = set()
+        # Chunks fed so far
+        self.chunks = 0
+        # Set once decided: whether the resume passed, and why
+        self.passed: Optional[bool] = None
+        self.reason: Optional[str] = None
+
+        self._matcher = compile_terms(job_profile.terms)
+        self._must_have = frozenset(skill.lower() for skill in job_profile.must_have_skills)
+        if min_score is not None:
+            everything = {term.lower() for term in job_profile.terms} | {EDUCATION_KEYWORDS[0]}
+            if self._score(everything)['total_score'] < min_score:
+                self._decide(False, THRESHOLD_UNREACHABLE)
+            else:
+                self._check()
+
+    @property
+    def decided(self) -> bool:
+        return self.passed is not None
+
+    def _score(self, found: Set[str]) -> Dict[str, Any]:
+        return SkillMatcher().score_matches(
+            found,
+            list(self.job_profile.must_have_skills),
+            list(self.job_profile.nice_to_have_skills),
+            list(self.job_profile.industry_experience)
+        )
+
+    def _decide(self, passed: bool, reason: str):
+        self.passed = passed
+        self.reason = reason
+
+    def _check(self):
+        """Pass if the text read so far already answers the question."""
+        if self.min_score is None:
+            if self._must_have <= self.found:
+                self._decide(True, MUST_HAVE_FOUND)
+        elif self._score(self.found)['total_score'] >= self.min_score:
+            self._decide(True, THRESHOLD_REACHED)
+
+    def feed(self, text: str) -> bool:
+        """
+        Scan the next chunk of the document.
+
+        Returns:
+            True once the screening is decided and no more text is needed
+        """
+        if self.decided:
+            return True
+        self.chunks += 1
+        # In must-have mode the chunk's scan can stop at the last one
+        stop_when = self._must_have - self.found if self.min_score is None else None
+        found = self._matcher.find(text.lower(), stop_when=stop_when)
+        if not found <= self.found:
+            self.found |= found
+            self._check()
+        return self.decided
+
+    def finish(self) -> bool:
+        """
+        Decide on the text read so far, once the document has no more chunks.
+
+        Returns:
+            Whether the resume passed
+        """
+        if not self.decided:
+            self._decide(False, END_OF_DOCUMENT)
+        return self.passed
+
+    def result(self) -> Dict[str, Any]:
+        """The match_skills result for the text read so far."""
+        return self._score(self.found)
@@ -1,5 +1,26 @@
-from typing import List, Dict, Any, Optional
-import re
+from typing import List, Dict, Any, Optional, Set, Tuple
+from functools import lru_cache
+
+from .skill_taxonomy import default_taxonomy
+from .term_matcher import TermMatcher
+
+# Keywords that count as evidence of formal education
+EDUCATION_KEYWORDS = (
+    'bachelor', 'master', 'phd', 'doctorate', 'degree', 'diploma', 'mba',
+    'university', 'college'
+)
+
+@lru_cache(maxsize=256)
+def compile_terms(terms: Tuple[str, ...]) -> TermMatcher:
+    """
+    Compile a term set (plus the education keywords) into a TermMatcher.
+
+    Compiled matchers are cached per process, so scoring many resumes
+    against the same job spec only pays the compile cost once. Terms are
+    matched through the aliases of the default taxonomy, if one has been
+    compiled.
+    """
+    return TermMatcher(terms + EDUCATION_KEYWORDS, default_taxonomy())
 
 class SkillMatcher:
     """Matches and scores resume skills against required skills."""
@@ -26,43 +47,49 @@ class SkillMatcher:
         if industry_experience is None:
             industry_experience = []
             
-        # Normalize text
-        resume_text = resume_text.lower()
+        # Find every term and the education keywords in one pass
+        terms = tuple(must_have_skills) + tuple(nice_to_have_skills) + tuple(industry_experience)
+        found = compile_terms(terms).find(resume_text.lower())
         
+        return self.score_matches(found, must_have_skills, nice_to_have_skills, industry_experience)
+    
+    def score_matches(self,
+                      found: Set[str],
+                      must_have_skills: List[str],
+                      nice_to_have_skills: Optional[List[str]] = None,
+                      industry_experience: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Score a job spec from the set of terms found in a resume.
+        
+        Args:
+            found: Lowercased terms (and education keywords) found in the resume
+            must_have_skills: List of required skills
+            nice_to_have_skills: List of nice to have skills
+            industry_experience: List of required industry experience
+            
+        Returns:
+            Dictionary with match results and scores
+        """
+        if nice_to_have_skills is None:
+            nice_to_have_skills = []
+        if industry_experience is None:
+            industry_experience = []
+            
         # Match skills
         must_have_matches = []
         must_have_missing = []
         
         for skill in must_have_skills:
-            skill_lower = skill.lower()
-            if re.search(r'\b' + re.escape(skill_lower) + r'\b', resume_text):
+            if skill.lower() in found:
                 must_have_matches.append(skill)
             else:
                 must_have_missing.append(skill)
                 
-        nice_to_have_matches = []
-        for skill in nice_to_have_skills:
-            skill_lower = skill.lower()
-            if re.search(r'\b' + re.escape(skill_lower) + r'\b', resume_text):
-                nice_to_have_matches.append(skill)
-                
-        industry_matches = []
-        for exp in industry_experience:
-            exp_lower = exp.lower()
-            if re.search(r'\b' + re.escape(exp_lower) + r'\b', resume_text):
-                industry_matches.append(exp)
+        nice_to_have_matches = [skill for skill in nice_to_have_skills if skill.lower() in found]
+        industry_matches = [exp for exp in industry_experience if exp.lower() in found]
                 
         # Check for education
-        has_education = False
-        education_patterns = [
-            r'\b(bachelor|master|phd|doctorate|degree|diploma|mba)\b',
-            r'\buniversity\b',
-            r'\bcollege\b'
-        ]
-        for pattern in education_patterns:
-            if re.search(pattern, resume_text):
-                has_education = True
-                break
+        has_education = any(keyword in found for keyword in EDUCATION_KEYWORDS)
                 
         # Calculate scores
         must_have_score = 0
@@ -100,4 +127,4 @@ class SkillMatcher:
                 'score': education_score
             },
             'total_score': total_score
-        }
\ No newline at end of file
+        }
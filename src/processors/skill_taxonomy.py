@@ -0,0 +1,181 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
+import hashlib
+import mmap
+import os
+import struct
+
+from .. import config
+
+# Compiled taxonomy layout, all integers little-endian:
+#   header   magic, version, fingerprint, alias count, group count
+#   aliases  (string offset, string length, group) per alias, sorted by
+#            the alias's UTF-8 bytes so a lookup is a binary search
+#   groups   (first member, member count, canonical alias) per group
+#   members  alias indexes of each group, contiguous per group
+#   strings  UTF-8 text every offset points into
+MAGIC = b'RSTX'
+VERSION = 1
+_HEADER = struct.Struct('<4sH16sII')
+_ALIAS = struct.Struct('<III')
+_GROUP = struct.Struct('<III')
+_MEMBER = struct.Struct('<I')
+
+def normalize_term(term: str) -> str:
+    """Lowercase a skill and collapse its whitespace, as aliases are stored."""
+    return ' '.join(term.lower().split())
+
+def compile_taxonomy(groups: Mapping[str, Iterable[str]], path: Union[str, Path]) -> int:
+    """
+    Compile canonical skill -> aliases into the binary file SkillTaxonomy maps.
+
+    The canonical name is an alias of its own group. The file is written
+    next to path and renamed over it, so processes that already mapped the
+    previous file keep reading it until they reopen.
+
+    Args:
+        groups: Canonical skill name -> its aliases
+        path: Output file
+
+    Returns:
+        Number of aliases compiled
+
+    Raises:
+        ValueError: If an alias belongs to more than one canonical skill
+    """
+    owner: Dict[bytes, int] = {}
+    canonical_names: List[bytes] = []
+    for canonical, aliases in groups.items():
+        group = len(canonical_names)
+        canonical_names.append(normalize_term(canonical).encode('utf-8'))
+        for alias in [canonical, *aliases]:
+            key = normalize_term(alias).encode('utf-8')
+            if not key:
+                continue
+            if owner.setdefault(key, group) != group:
+                raise ValueError(
+                    f"Alias {alias!r} of {canonical!r} already belongs to "
+                    f"{canonical_names[owner[key]].decode('utf-8')!r}"
+                )
+
+    aliases = sorted(owner)
+    index = {alias: i for i, alias in enumerate(aliases)}
+    members: List[List[int]] = [[] for _ in canonical_names]
+    for alias in aliases:
+        members[owner[alias]].append(index[alias])
+
+    strings = bytearray()
+    alias_table = bytearray()
+    for alias in aliases:
+        alias_table += _ALIAS.pack(len(strings), len(alias), owner[alias])
+        strings += alias
+    group_table = bytearray()
+    member_table = bytearray()
+    first = 0
+    for group, canonical in enumerate(canonical_names):
+        group_table += _GROUP.pack(first, len(members[group]), index[canonical])
+        member_table += b''.join(_MEMBER.pack(i) for i in members[group])
+        first += len(members[group])
+
+    payload = bytes(alias_table + group_table + member_table + strings)
+    fingerprint = hashlib.sha256(payload).digest()[:16]
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, fingerprint, len(aliases), len(canonical_names)))
+        f.write(payload)
+    os.replace(tmp_path, path)
+    return len(aliases)
+
+class SkillTaxonomy:
+    """
+    Read-only view of a compiled taxonomy through a memory map.
+
+    Nothing is unpacked at open: lookups binary-search the mapped alias
+    table, so every process that opens the file shares its pages through
+    the OS page cache instead of holding its own copy.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"{self.path} is not a compiled skill taxonomy")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, fingerprint, self._alias_count, self._group_count = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{self.path} is not a version {VERSION} skill taxonomy")
+        self.fingerprint = fingerprint.hex()
+        self._groups_at = _HEADER.size + self._alias_count * _ALIAS.size
+        self._members_at = self._groups_at + self._group_count * _GROUP.size
+        self._strings_at = self._members_at + self._alias_count * _MEMBER.size
+
+    def __len__(self) -> int:
+        return self._alias_count
+
+    def close(self):
+        self._map.close()
+
+    def _alias(self, i: int) -> Tuple[bytes, int]:
+        offset, length, group = _ALIAS.unpack_from(self._map, _HEADER.size + i * _ALIAS.size)
+        start = self._strings_at + offset
+        return self._map[start:start + length], group
+
+    def _group_of(self, term: str) -> Optional[int]:
+        key = normalize_term(term).encode('utf-8')
+        low, high = 0, self._alias_count
+        while low < high:
+            middle = (low + high) // 2
+            alias, group = self._alias(middle)
+            if alias < key:
+                low = middle + 1
+            elif alias > key:
+                high = middle
+            else:
+                return group
+        return None
+
+    def canonical(self, term: str) -> Optional[str]:
+        """Canonical name of a skill, or None if the taxonomy does not know it."""
+        group = self._group_of(term)
+        if group is None:
+            return None
+        _, _, canonical = _GROUP.unpack_from(self._map, self._groups_at + group * _GROUP.size)
+        return self._alias(canonical)[0].decode('utf-8')
+
+    def expand(self, term: str) -> Tuple[str, ...]:
+        """
+        Every alias of a skill's canonical group, the canonical name included.
+
+        Returns:
+            The lowercased aliases, or just the lowercased term if the
+            taxonomy does not know it
+        """
+        group = self._group_of(term)
+        if group is None:
+            return (term.lower(),)
+        first, count, _ = _GROUP.unpack_from(self._map, self._groups_at + group * _GROUP.size)
+        members = self._members_at + first * _MEMBER.size
+        return tuple(
+            self._alias(_MEMBER.unpack_from(self._map, members + i * _MEMBER.size)[0])[0].decode('utf-8')
+            for i in range(count)
+        )
+
+@lru_cache(maxsize=1)
+def default_taxonomy() -> Optional[SkillTaxonomy]:
+    """
+    The taxonomy at config.SKILL_TAXONOMY_PATH, mapped once per process.
+
+    Returns None when the file has not been compiled, which leaves
+    skill matching literal. Processes must restart to pick up a
+    recompiled file.
+    """
+    path = config.SKILL_TAXONOMY_PATH
+    if not Path(path).is_file():
+        return None
+    return SkillTaxonomy(path)
@@ -0,0 +1,134 @@
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import re
+
+from .skill_taxonomy import SkillTaxonomy
+
+class TermMatcher:
+    """
+    Finds a fixed set of terms in text with a single regex scan.
+
+    Every term is matched with the same semantics as
+    ``re.search(r'\\b' + re.escape(term) + r'\\b', text)``, but all terms are
+    compiled into one trie-shaped pattern, so the text is walked once
+    regardless of how many terms there are. Terms are compared lowercased;
+    callers are expected to pass lowercased text.
+
+    With a SkillTaxonomy, a term is found when any alias of its canonical
+    skill is: the pattern holds the union of every term's aliases, so
+    listing synonyms in a spec adds no work to the scan.
+    """
+
+    def __init__(self, terms: Iterable[str], taxonomy: Optional[SkillTaxonomy] = None):
+        self.terms = frozenset(term.lower() for term in terms)
+
+        # Term -> the patterns that find it, for callers that prefilter text
+        self.expansions: Dict[str, Tuple[str, ...]] = {term: (term,) for term in self.terms}
+        # Pattern -> the terms it finds; None when every term is its own pattern
+        self._owners: Optional[Dict[str, Set[str]]] = None
+        if taxonomy is not None:
+            expansions = {term: taxonomy.expand(term) if term else (term,) for term in self.terms}
+            if any(aliases != (term,) for term, aliases in expansions.items()):
+                self.expansions = expansions
+                self._owners = {}
+                for term, aliases in expansions.items():
+                    for alias in aliases:
+                        self._owners.setdefault(alias, set()).add(term)
+        patterns = self.terms if self._owners is None else frozenset(self._owners)
+
+        # An empty term has no characters to anchor a trie on, so it keeps
+        # its own standalone pattern
+        self._empty = '' in patterns
+        words = sorted(pattern for pattern in patterns if pattern)
+
+        # Terms that are a prefix of another term can match at the same
+        # position; the scan only reports the longest one, so the shorter
+        # ones are re-checked at that position with their own pattern
+        self._prefix_patterns: Dict[str, List[Tuple[str, re.Pattern]]] = {}
+        for term in words:
+            prefixes = [other for other in words if other != term and term.startswith(other)]
+            if prefixes:
+                self._prefix_patterns[term] = [
+                    (other, re.compile(r'\b' + re.escape(other) + r'\b'))
+                    for other in sorted(prefixes, key=len, reverse=True)
+                ]
+
+        self._pattern = None
+        if words:
+            trie = self._build_trie(words)
+            self._pattern = re.compile(r'(?=\b(' + self._trie_to_regex(trie) + r'))')
+
+    @staticmethod
+    def _build_trie(words: List[str]) -> dict:
+        """Build a character trie; the '' key marks the end of a term."""
+        trie = {}
+        for word in words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[''] = True
+        return trie
+
+    @classmethod
+    def _trie_to_regex(cls, node: dict) -> str:
+        """
+        Convert a trie node into a regex alternation.
+
+        Longer continuations are listed before the terminating ``\\b`` so the
+        scan reports the longest term that matches at a given position.
+        """
+        branches = [
+            re.escape(char) + cls._trie_to_regex(child)
+            for char, child in sorted(node.items()) if char
+        ]
+        if '' in node:
+            branches.append(r'\b')
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
+
+    def find(self, text: str, stop_when: Optional[Set[str]] = None) -> Set[str]:
+        """
+        Find which terms occur in the text.
+
+        Args:
+            text: Lowercased text to scan
+            stop_when: Optional set of terms; the scan stops early once all of
+                them have been found
+
+        Returns:
+            Set of the (lowercased) terms found in the text
+        """
+        found = set()
+        if self._empty and re.search(r'\b\b', text):
+            found.add('')
+        if self._pattern is not None:
+            remaining = set(stop_when) - self._terms_of(found) if stop_when else None
+            if remaining is None or remaining:
+                self._scan(text, found, remaining)
+        return self._terms_of(found)
+
+    def _terms_of(self, found: Set[str]) -> Set[str]:
+        """Terms standing behind the patterns found."""
+        if self._owners is None:
+            return found
+        return set().union(*(self._owners[pattern] for pattern in found))
+
+    def _scan(self, text: str, found: Set[str], remaining: Optional[Set[str]]):
+        """Add the patterns found in text to found, until remaining is empty."""
+        owners = self._owners
+        for match in self._pattern.finditer(text):
+            longest = match.group(1)
+            hits = [longest]
+            found.add(longest)
+            for prefix, pattern in self._prefix_patterns.get(longest, ()):
+                if prefix not in found and pattern.match(text, match.start()):
+                    found.add(prefix)
+                    hits.append(prefix)
+            if remaining is not None:
+                for hit in hits:
+                    if owners is None:
+                        remaining.discard(hit)
+                    else:
+                        remaining -= owners[hit]
+                if not remaining:
+                    break
@@ -0,0 +1,163 @@
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Optional, Tuple, Union
+import hashlib
+import json
+import os
+import threading
+import time
+
+class BlobStore:
+    """
+    Short-lived, content-addressed store for rendered documents.
+    
+    Blobs are keyed by the SHA-256 of their bytes, so identical renders are
+    stored once. Each blob expires after a TTL, and the oldest blobs are
+    evicted when the total size exceeds max_bytes. Blobs are kept in memory,
+    or on disk when a directory is given.
+    
+    On disk each blob file starts with a JSON line holding its filename and
+    expiry, so the directory can be shared: a store indexes the unexpired
+    blobs already there when it starts, and serves blobs other processes
+    (uvicorn workers) wrote. max_bytes is enforced per process, over the
+    blobs that process has indexed.
+    """
+    
+    def __init__(self, directory: Optional[Union[str, Path]] = None, ttl_seconds: int = 900, max_bytes: int = 128 * 1024 * 1024):
+        self.directory = Path(directory) if directory else None
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        
+        # digest -> (size, expires_at, filename, data or None when on disk)
+        self._index = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        
+        if self.directory is not None:
+            self.directory.mkdir(exist_ok=True, parents=True)
+            # Pick up blobs written before a restart or by other workers,
+            # in expiry order
+            found = []
+            for path in self.directory.glob('*.blob'):
+                entry = self._read_header(path.stem)
+                if entry is not None:
+                    found.append((path.stem, entry))
+            with self._lock:
+                for digest, entry in sorted(found, key=lambda item: item[1][1]):
+                    self._index[digest] = entry
+                    self._total_bytes += entry[0]
+                self._evict()
+    
+    def _path(self, digest: str) -> Path:
+        return self.directory / f"{digest}.blob"
+    
+    def _write(self, digest: str, data: bytes, expires_at: float, filename: str):
+        """Write a blob file atomically: a JSON header line, then the data."""
+        header = json.dumps({'filename': filename, 'expires_at': expires_at}).encode('utf-8')
+        tmp_path = self.directory / f"{digest}.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp_path.write_bytes(header + b'\n' + data)
+        os.replace(tmp_path, self._path(digest))
+    
+    def _read_header(self, digest: str) -> Optional[Tuple[int, float, str, None]]:
+        """Index entry for a blob file on disk, or None if missing or unreadable."""
+        try:
+            with open(self._path(digest), 'rb') as f:
+                header = json.loads(f.readline())
+                size = os.fstat(f.fileno()).st_size - f.tell()
+        except (OSError, ValueError):
+            return None
+        return size, header['expires_at'], header['filename'], None
+    
+    def put(self, data: bytes, filename: str) -> str:
+        """
+        Store a blob.
+        
+        Args:
+            data: Document bytes
+            filename: Filename to serve the blob under
+            
+        Returns:
+            The blob's digest
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        expires_at = time.time() + self.ttl_seconds
+        
+        with self._lock:
+            if digest in self._index:
+                size, _, _, stored = self._index.pop(digest)
+                if self.directory is not None:
+                    # Rewritten so other processes see the new expiry
+                    self._write(digest, data, expires_at, filename)
+                self._index[digest] = (size, expires_at, filename, stored)
+                return digest
+            
+            if self.directory is not None:
+                self._write(digest, data, expires_at, filename)
+                stored = None
+            else:
+                stored = data
+            self._index[digest] = (len(data), expires_at, filename, stored)
+            self._total_bytes += len(data)
+            self._evict()
+        return digest
+    
+    def get(self, digest: str) -> Optional[Tuple[bytes, str]]:
+        """
+        Fetch a blob.
+        
+        Returns:
+            Tuple of (data, filename), or None if unknown or expired
+        """
+        with self._lock:
+            self._evict()
+            entry = self._index.get(digest)
+            if entry is None and self.directory is not None:
+                # Possibly written by another process
+                entry = self._read_header(digest)
+                if entry is not None and entry[1] > time.time():
+                    self._index[digest] = entry
+                    self._total_bytes += entry[0]
+                    self._evict()
+                    entry = self._index.get(digest)
+            if entry is None or entry[1] <= time.time():
+                return None
+            _, _, filename, data = entry
+            if data is None:
+                try:
+                    data = self._path(digest).read_bytes().split(b'\n', 1)[1]
+                except (OSError, IndexError):
+                    return None
+        return data, filename
+    
+    def _evict(self):
+        """Drop expired blobs, then the oldest until under budget. Caller holds the lock."""
+        # Entries are kept in expiry order, so expired ones are at the front
+        now = time.time()
+        while self._index:
+            digest, entry = next(iter(self._index.items()))
+            if entry[1] > now:
+                break
+            if self.directory is not None:
+                # Another process may have stored the same blob again since
+                on_disk = self._read_header(digest)
+                if on_disk is not None and on_disk[1] > now:
+                    self._index.pop(digest)
+                    self._index[digest] = on_disk
+                    continue
+            self._remove(digest)
+        while self._total_bytes > self.max_bytes and self._index:
+            self._remove(next(iter(self._index)))
+    
+    def _remove(self, digest: str):
+        size, _, _, _ = self._index.pop(digest)
+        self._total_bytes -= size
+        if self.directory is not None:
+            try:
+                self._path(digest).unlink()
+            except OSError:
+                pass
+    
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of blobs and their total size."""
+        with self._lock:
+            return {'blobs': len(self._index), 'total_bytes': self._total_bytes}
@@ -0,0 +1,295 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Set, Tuple, Union
+import hashlib
+import json
+import re
+import sqlite3
+import time
+
+# Words are runs of letters and digits; "+", "#" and inner dots stay part
+# of the token so "C++", "C#" and "Node.js" are indexed as written
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9+#]+)*")
+
+# Query syntax: parentheses, quoted phrases and bare words
+QUERY_TOKEN_PATTERN = re.compile(r'\(|\)|"[^"]*"|[^\s()"]+')
+OPERATORS = ('AND', 'OR', 'NOT')
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercased index tokens."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+def index_grams(text: str, max_ngram: int = 2) -> Set[str]:
+    """
+    Every 1..max_ngram word sequence in text.
+
+    Grams never span a line break, so a multi-word skill only matches
+    where it is written on one line.
+    """
+    grams = set()
+    for line in text.split('\n'):
+        tokens = tokenize(line)
+        for n in range(1, max_ngram + 1):
+            for i in range(len(tokens) - n + 1):
+                grams.add(' '.join(tokens[i:i + n]))
+    return grams
+
+def term_grams(term: str, max_ngram: int = 2) -> List[str]:
+    """
+    The grams a document must contain to match term.
+
+    Terms up to max_ngram words are looked up directly. Longer phrases
+    require each of their overlapping max_ngram-word grams, which can
+    over-match when those pieces occur apart on separate lines.
+    """
+    tokens = tokenize(term)
+    if len(tokens) <= max_ngram:
+        return [' '.join(tokens)] if tokens else []
+    return [' '.join(tokens[i:i + max_ngram]) for i in range(len(tokens) - max_ngram + 1)]
+
+def parse_query(query: str) -> Tuple:
+    """
+    Parse a boolean skill query into a tree.
+
+    Operators are upper-case AND, OR and NOT, with parentheses for
+    grouping; NOT binds tightest and AND before OR. Words between
+    operators form one phrase, so "Health Cloud AND NOT Apex" searches for
+    the phrase "health cloud". Quotes make a phrase explicit.
+
+    Returns:
+        Nested tuples: ('term', text), ('not', node), ('and', a, b) or ('or', a, b)
+
+    Raises:
+        ValueError: If the query is empty or malformed
+    """
+    tokens = QUERY_TOKEN_PATTERN.findall(query)
+    position = 0
+
+    def peek() -> Optional[str]:
+        return tokens[position] if position < len(tokens) else None
+
+    def take() -> str:
+        nonlocal position
+        position += 1
+        return tokens[position - 1]
+
+    def parse_or():
+        node = parse_and()
+        while peek() == 'OR':
+            take()
+            node = ('or', node, parse_and())
+        return node
+
+    def parse_and():
+        node = parse_unary()
+        while peek() == 'AND':
+            take()
+            node = ('and', node, parse_unary())
+        return node
+
+    def parse_unary():
+        token = peek()
+        if token is None:
+            raise ValueError("Query ended where a skill was expected")
+        if token == 'NOT':
+            take()
+            return ('not', parse_unary())
+        if token == '(':
+            take()
+            node = parse_or()
+            if peek() != ')':
+                raise ValueError("Missing closing parenthesis")
+            take()
+            return node
+        if token == ')' or token in OPERATORS:
+            raise ValueError(f"Unexpected {token!r}")
+
+        words = []
+        while peek() is not None and peek() not in OPERATORS and peek() not in ('(', ')'):
+            word = take()
+            words.append(word[1:-1] if word.startswith('"') else word)
+        return ('term', ' '.join(words))
+
+    node = parse_or()
+    if peek() is not None:
+        raise ValueError(f"Unexpected {peek()!r}")
+    return node
+
+class CandidateCorpus:
+    """
+    Persistent store of parsed resumes with an inverted n-gram index, in SQLite.
+
+    Every stored resume keeps its raw text and sections, and each 1..n-word
+    sequence in its text gets a posting. Boolean skill queries are compiled
+    to INTERSECT / UNION / EXCEPT over postings, so searching never re-parses
+    or scans resume text. Resumes are deduplicated by content hash.
+    """
+
+    def __init__(self, db_path: Union[str, Path], max_ngram: int = 2):
+        """
+        Args:
+            db_path: SQLite database file, created if missing
+            max_ngram: Longest word sequence indexed; changing it requires
+                rebuilding an existing database
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(exist_ok=True, parents=True)
+        self.max_ngram = max_ngram
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS resumes (
+                    id INTEGER PRIMARY KEY,
+                    content_hash TEXT NOT NULL UNIQUE,
+                    filename TEXT,
+                    candidate_name TEXT,
+                    raw_text TEXT NOT NULL,
+                    sections TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS postings (
+                    gram TEXT NOT NULL,
+                    resume_id INTEGER NOT NULL,
+                    PRIMARY KEY (gram, resume_id)
+                ) WITHOUT ROWID
+            ''')
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # A connection per call keeps the corpus safe to use from any thread
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA synchronous=NORMAL')
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        """Hash identifying an uploaded file, used to skip duplicates."""
+        return hashlib.sha256(content).hexdigest()
+
+    def add(self,
+            content_hash: str,
+            parsed_resume: Dict[str, Any],
+            candidate_name: Optional[str] = None,
+            filename: Optional[str] = None) -> int:
+        """
+        Store a parsed resume and index its text.
+
+        Args:
+            content_hash: content_hash() of the uploaded bytes
+            parsed_resume: Parser output with 'raw_text' and 'sections'
+            candidate_name: Name extracted by the transformer, if known
+            filename: Original filename of the upload
+
+        Returns:
+            The resume id; an already stored file keeps its existing id
+        """
+        return self.add_many([(content_hash, parsed_resume, candidate_name, filename)])[0]
+
+    def add_many(self, entries: Iterable[Tuple[str, Dict[str, Any], Optional[str], Optional[str]]]) -> List[int]:
+        """
+        Store several resumes in one transaction, which is much faster in bulk.
+
+        Args:
+            entries: (content_hash, parsed_resume, candidate_name, filename)
+                tuples, as for add()
+
+        Returns:
+            The resume id of each entry, in order
+        """
+        resume_ids = []
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                for content_hash, parsed_resume, candidate_name, filename in entries:
+                    row = conn.execute('SELECT id FROM resumes WHERE content_hash = ?', (content_hash,)).fetchone()
+                    if row is not None:
+                        resume_ids.append(row['id'])
+                        continue
+
+                    raw_text = parsed_resume['raw_text']
+                    resume_id = conn.execute(
+                        'INSERT INTO resumes (content_hash, filename, candidate_name, raw_text, sections, created_at) '
+                        'VALUES (?, ?, ?, ?, ?, ?)',
+                        (content_hash, filename, candidate_name, raw_text, json.dumps(parsed_resume['sections']), time.time())
+                    ).lastrowid
+                    conn.executemany(
+                        'INSERT INTO postings (gram, resume_id) VALUES (?, ?)',
+                        ((gram, resume_id) for gram in index_grams(raw_text, self.max_ngram))
+                    )
+                    resume_ids.append(resume_id)
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        return resume_ids
+
+    def get(self, resume_id: int) -> Optional[Dict[str, Any]]:
+        """Return a stored resume with its raw text and sections, or None."""
+        with self._connect() as conn:
+            row = conn.execute('SELECT * FROM resumes WHERE id = ?', (resume_id,)).fetchone()
+        if row is None:
+            return None
+        resume = dict(row)
+        resume['sections'] = json.loads(resume['sections'])
+        return resume
+
+    def count(self) -> int:
+        with self._connect() as conn:
+            return conn.execute('SELECT COUNT(*) FROM resumes').fetchone()[0]
+
+    def _compile(self, node: Tuple, params: List[str]) -> str:
+        """Compile a query tree into a SELECT of matching resume ids."""
+        kind = node[0]
+        if kind == 'term':
+            grams = term_grams(node[1], self.max_ngram)
+            if not grams:
+                return 'SELECT resume_id FROM postings WHERE 0'
+            params.extend(grams)
+            return ' INTERSECT '.join('SELECT resume_id FROM postings WHERE gram = ?' for _ in grams)
+        if kind == 'not':
+            return f'SELECT id AS resume_id FROM resumes EXCEPT SELECT resume_id FROM ({self._compile(node[1], params)})'
+        if kind == 'and' and node[2][0] == 'not':
+            # "A AND NOT B" is a difference; no need to complement B first
+            left = self._compile(node[1], params)
+            right = self._compile(node[2][1], params)
+            return f'SELECT resume_id FROM ({left}) EXCEPT SELECT resume_id FROM ({right})'
+
+        operator = 'INTERSECT' if kind == 'and' else 'UNION'
+        left = self._compile(node[1], params)
+        right = self._compile(node[2], params)
+        return f'SELECT resume_id FROM ({left}) {operator} SELECT resume_id FROM ({right})'
+
+    def search(self, query: str, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
+        """
+        Find stored resumes matching a boolean skill query.
+
+        Args:
+            query: e.g. 'Apex AND CPQ AND NOT NetSuite'; see parse_query
+            limit: Maximum results to return
+            offset: Results to skip, for paging
+
+        Returns:
+            Dict with the 'total' match count and 'results': id, filename,
+            candidate_name and created_at of each match, oldest first
+
+        Raises:
+            ValueError: If the query is malformed
+        """
+        params = []
+        matching = self._compile(parse_query(query), params)
+
+        with self._connect() as conn:
+            total = conn.execute(f'SELECT COUNT(*) FROM ({matching})', params).fetchone()[0]
+            rows = conn.execute(
+                f'SELECT id, filename, candidate_name, created_at FROM resumes '
+                f'WHERE id IN ({matching}) ORDER BY id LIMIT ? OFFSET ?',
+                params + [limit, offset]
+            ).fetchall()
+        return {'total': total, 'results': [dict(row) for row in rows]}
@@ -0,0 +1,287 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+import hashlib
+import json
+import sqlite3
+import time
+import zlib
+
+import numpy as np
+
+from .corpus import tokenize
+
+# Words per shingle; a small edit such as a new date only changes the
+# shingles that overlap it
+SHINGLE_SIZE = 3
+
+# Candidates looked up per query, below SQLite's bound-variable limit
+# (999 before 3.32)
+_LOOKUP_BATCH = 500
+
+# Universal hashing modulo a Mersenne prime; below 2**31 so a * x fits in 64 bits
+_PRIME = (1 << 31) - 1
+
+def canonical_text(text: str) -> str:
+    """
+    Sort the comma-separated items of every line.
+
+    A resend with its skills list reordered then shingles like the
+    original; lines without commas are unchanged.
+    """
+    return '\n'.join(', '.join(sorted(item.strip() for item in line.split(','))) for line in text.split('\n'))
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> List[int]:
+    """
+    Hash every distinct run of size consecutive words in canonical_text(text).
+
+    Tokens are lowercased and stripped of punctuation and layout, so the
+    same words extracted with different line breaks shingle identically.
+    """
+    tokens = tokenize(canonical_text(text))
+    if len(tokens) < size:
+        grams = {' '.join(tokens)} if tokens else set()
+    else:
+        grams = {' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+    return [zlib.crc32(gram.encode('utf-8')) % _PRIME for gram in grams]
+
+# Missing a duplicate costs a full pipeline run, while a false candidate
+# only costs one signature comparison, so misses weigh more
+FALSE_NEGATIVE_WEIGHT = 0.9
+
+def lsh_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Choose (bands, rows per band) for an LSH index over num_perm hashes.
+
+    Picks the split whose candidate probability curve, 1 - (1 - s**r)**b,
+    best separates similarities above and below threshold: the weighted
+    sum of the false positive area below it and the false negative area
+    above it is minimal.
+    """
+    below = np.linspace(0, threshold, 101)
+    above = np.linspace(threshold, 1, 101)
+    best, best_error = (1, num_perm), float('inf')
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        false_positive = np.trapz(1 - (1 - below ** rows) ** bands, below)
+        false_negative = np.trapz((1 - above ** rows) ** bands, above)
+        error = (1 - FALSE_NEGATIVE_WEIGHT) * false_positive + FALSE_NEGATIVE_WEIGHT * false_negative
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+class NearDuplicateIndex:
+    """
+    MinHash signatures of resume text in a persistent LSH index, in SQLite.
+
+    A signature holds, for each of num_perm hash functions, the smallest
+    hash over the document's word shingles; the fraction of positions two
+    signatures agree on estimates the Jaccard similarity of their shingle
+    sets. Signatures are split into bands and each band is indexed by its
+    hash, so finding near-duplicates only compares against documents that
+    share a band bucket instead of every stored document.
+
+    Documents are keyed by the hash of the uploaded bytes. Pipeline
+    results (the transformed candidate data and score for one job spec)
+    can be stored alongside for result_ttl_seconds and reused for later
+    near-duplicates.
+    """
+
+    def __init__(self,
+                 db_path: Union[str, Path],
+                 threshold: float = 0.9,
+                 num_perm: int = 128,
+                 seed: int = 1,
+                 result_ttl_seconds: int = 0):
+        """
+        Args:
+            db_path: SQLite database file, created if missing
+            threshold: Estimated Jaccard similarity from which two resumes
+                count as near-duplicates
+            num_perm: Hash functions per signature; changing it (or seed)
+                requires rebuilding an existing database
+            seed: Seed for the hash function coefficients
+            result_ttl_seconds: How long put_result keeps a result; 0
+                stores none
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(exist_ok=True, parents=True)
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = lsh_bands(threshold, num_perm)
+        self.result_ttl_seconds = result_ttl_seconds
+
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, _PRIME, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, _PRIME, size=num_perm).astype(np.uint64)
+
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS signatures (
+                    content_hash TEXT PRIMARY KEY,
+                    signature BLOB NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS buckets (
+                    band INTEGER NOT NULL,
+                    bucket INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    PRIMARY KEY (band, bucket, content_hash)
+                ) WITHOUT ROWID
+            ''')
+            # Results are a cache; a table from before they expired is dropped
+            columns = [row['name'] for row in conn.execute('PRAGMA table_info(results)')]
+            if columns and 'created_at' not in columns:
+                conn.execute('DROP TABLE results')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS results (
+                    content_hash TEXT NOT NULL,
+                    variant TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (content_hash, variant)
+                ) WITHOUT ROWID
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS results_created_at ON results (created_at)')
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # A connection per call keeps the index safe to use from any thread
+        # or pipeline worker process
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute('PRAGMA synchronous=NORMAL')
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash signature of text, or None if it has no words."""
+        hashes = np.array(shingles(text), dtype=np.uint64)
+        if not len(hashes):
+            return None
+        # One row per hash function, one column per shingle
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def _buckets(self, signature: np.ndarray) -> List[Tuple[int, int]]:
+        buckets = []
+        for band in range(self.bands):
+            digest = hashlib.blake2b(signature[band * self.rows:(band + 1) * self.rows].tobytes(), digest_size=8).digest()
+            buckets.append((band, int.from_bytes(digest, 'big', signed=True)))
+        return buckets
+
+    def find(self, signature: np.ndarray) -> Optional[Dict[str, Any]]:
+        """
+        Find the stored document most similar to signature.
+
+        Call it before add() for the same document; a byte-identical
+        resend of an earlier upload then matches that upload.
+
+        Args:
+            signature: Signature of the document to look up
+
+        Returns:
+            Dict with its 'content_hash' and estimated 'similarity', or
+            None if nothing reaches the threshold. Ties go to the document
+            stored first.
+        """
+        with self._connect() as conn:
+            candidates = set()
+            for band, bucket in self._buckets(signature):
+                candidates.update(
+                    row[0] for row in conn.execute(
+                        'SELECT content_hash FROM buckets WHERE band = ? AND bucket = ?', (band, bucket)
+                    )
+                )
+            if not candidates:
+                return None
+            candidates = list(candidates)
+            rows = []
+            for start in range(0, len(candidates), _LOOKUP_BATCH):
+                batch = candidates[start:start + _LOOKUP_BATCH]
+                rows.extend(conn.execute(
+                    f"SELECT content_hash, signature, created_at FROM signatures "
+                    f"WHERE content_hash IN ({','.join('?' * len(batch))})",
+                    batch
+                ))
+
+        best = None
+        for row in sorted(rows, key=lambda row: row['created_at']):
+            similarity = float(np.mean(np.frombuffer(row['signature'], dtype=np.uint32) == signature))
+            if similarity >= self.threshold and (best is None or similarity > best['similarity']):
+                best = {'content_hash': row['content_hash'], 'similarity': similarity}
+        return best
+
+    def add(self, content_hash: str, signature: np.ndarray) -> bool:
+        """
+        Index a document's signature.
+
+        Returns:
+            False if the document was already indexed
+        """
+        with self._connect() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                inserted = conn.execute(
+                    'INSERT OR IGNORE INTO signatures (content_hash, signature, created_at) VALUES (?, ?, ?)',
+                    (content_hash, signature.tobytes(), time.time())
+                ).rowcount
+                if inserted:
+                    conn.executemany(
+                        'INSERT OR IGNORE INTO buckets (band, bucket, content_hash) VALUES (?, ?, ?)',
+                        [(band, bucket, content_hash) for band, bucket in self._buckets(signature)]
+                    )
+                conn.execute('COMMIT')
+            except Exception:
+                conn.execute('ROLLBACK')
+                raise
+        return bool(inserted)
+
+    @property
+    def stores_results(self) -> bool:
+        return self.result_ttl_seconds > 0
+
+    def get_result(self, content_hash: str, variant: str) -> Optional[Dict[str, Any]]:
+        """Return the unexpired result stored for a document and variant, or None."""
+        if not self.stores_results:
+            return None
+        with self._connect() as conn:
+            row = conn.execute(
+                'SELECT result FROM results WHERE content_hash = ? AND variant = ? AND created_at >= ?',
+                (content_hash, variant, time.time() - self.result_ttl_seconds)
+            ).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def put_result(self, content_hash: str, variant: str, result: Dict[str, Any]):
+        """
+        Store a JSON-serializable pipeline result for a document.
+
+        Results expire after result_ttl_seconds and are purged by later
+        calls; with a TTL of 0 nothing is stored.
+
+        Args:
+            content_hash: Key the document was added under
+            variant: What the result depends on besides the document,
+                such as the job profile it was scored against
+            result: The result to store
+        """
+        if not self.stores_results:
+            return
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('DELETE FROM results WHERE created_at < ?', (now - self.result_ttl_seconds,))
+            conn.execute(
+                'INSERT OR REPLACE INTO results (content_hash, variant, result, created_at) VALUES (?, ?, ?, ?)',
+                (content_hash, variant, json.dumps(result), now)
+            )
+
+    def count(self) -> int:
+        with self._connect() as conn:
+            return conn.execute('SELECT COUNT(*) FROM signatures').fetchone()[0]
@@ -0,0 +1,278 @@
+from contextlib import contextmanager
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+import sqlite3
+import threading
+
+import numpy as np
+
+from src.processors.job_profile import JobProfile
+from src.processors.skill_matcher import EDUCATION_KEYWORDS
+from src.processors.skill_taxonomy import default_taxonomy
+from src.processors.term_matcher import TermMatcher
+from .corpus import CandidateCorpus
+
+# Column handed out for a term before any resume is stored
+_NO_HITS = np.zeros(0, dtype=bool)
+
+class SkillMatrix:
+    """
+    Per-term hit bitsets over a CandidateCorpus, for vectorized ranking.
+
+    Each term owns a column: one bit per stored resume, in id order, set
+    when SkillMatcher would find the term in that resume. A column is
+    computed with one TermMatcher scan the first time its term is ranked,
+    extended to cover resumes added since, and persisted as packed bits in
+    the corpus database. Ranking a job spec is then a handful of NumPy
+    column sums with the same 60/20/10/10 weighting as match_skills.
+
+    Columns follow the default skill taxonomy like match_skills does;
+    persisted columns computed under a different taxonomy are dropped.
+    """
+
+    def __init__(self, corpus: CandidateCorpus):
+        self.corpus = corpus
+        self._lock = threading.Lock()
+
+        # Resume ids in id order; row i of every column belongs to _ids[i]
+        self._ids = np.empty(0, dtype=np.int64)
+        # Lowercased term -> bool column, possibly shorter than _ids
+        self._columns: Dict[str, np.ndarray] = {}
+
+        with self._connect() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS term_hits (
+                    term TEXT PRIMARY KEY,
+                    covered INTEGER NOT NULL,
+                    bits BLOB NOT NULL
+                )
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS term_hits_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            ''')
+
+            taxonomy = default_taxonomy()
+            fingerprint = taxonomy.fingerprint if taxonomy is not None else ''
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute("SELECT value FROM term_hits_meta WHERE key = 'taxonomy'").fetchone()
+            if row is None or row[0] != fingerprint:
+                conn.execute('DELETE FROM term_hits')
+                conn.execute(
+                    "INSERT OR REPLACE INTO term_hits_meta (key, value) VALUES ('taxonomy', ?)", (fingerprint,)
+                )
+            conn.execute('COMMIT')
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.corpus.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _refresh_ids(self, conn: sqlite3.Connection):
+        """Append ids of resumes stored since the last refresh."""
+        last_id = int(self._ids[-1]) if len(self._ids) else 0
+        new_ids = [row[0] for row in conn.execute('SELECT id FROM resumes WHERE id > ? ORDER BY id', (last_id,))]
+        if new_ids:
+            self._ids = np.concatenate([self._ids, np.array(new_ids, dtype=np.int64)])
+
+    def _load_columns(self, conn: sqlite3.Connection, terms: List[str]):
+        """Load persisted columns for terms not yet in memory."""
+        unknown = [term for term in terms if term not in self._columns]
+        for start in range(0, len(unknown), 500):
+            chunk = unknown[start:start + 500]
+            rows = conn.execute(
+                f"SELECT term, covered, bits FROM term_hits WHERE term IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            for row in rows:
+                # Another process may have extended it past our ids; trim
+                covered = min(row['covered'], len(self._ids))
+                self._columns[row['term']] = np.unpackbits(
+                    np.frombuffer(row['bits'], dtype=np.uint8), count=covered
+                ).astype(bool)
+
+    def _extend_columns(self, conn: sqlite3.Connection, terms: List[str]) -> List[str]:
+        """
+        Scan the resumes each column does not cover yet and persist the result.
+
+        Returns:
+            The terms that needed scanning
+        """
+        stale = [term for term in terms if len(self._columns.get(term, ())) < len(self._ids)]
+        if not stale:
+            return stale
+
+        # One scan from the least covered column onwards finds every term.
+        # Terms match one of their aliases literally, so resumes that do
+        # not even contain one as a substring skip the regex, which is most
+        # of them for an edit that adds a term or two.
+        start = min(len(self._columns.get(term, ())) for term in stale)
+        matcher = TermMatcher(stale, default_taxonomy())
+        aliases = matcher.expansions
+        new_hits = {term: np.zeros(len(self._ids) - start, dtype=bool) for term in stale}
+        rows = conn.execute('SELECT raw_text FROM resumes WHERE id >= ? ORDER BY id', (int(self._ids[start]),))
+        for offset, row in enumerate(rows):
+            if offset >= len(self._ids) - start:
+                break  # Stored after _refresh_ids; covered next time
+            text = row[0].lower()
+            present = {term for term in stale if any(alias in text for alias in aliases[term])}
+            if not present:
+                continue
+            found = matcher.find(text, stop_when=present)
+            for term in stale:
+                if term in found:
+                    new_hits[term][offset] = True
+
+        conn.execute('BEGIN IMMEDIATE')
+        for term in stale:
+            covered = len(self._columns.get(term, ()))
+            column = np.concatenate([self._columns.get(term, np.zeros(0, dtype=bool)), new_hits[term][covered - start:]])
+            self._columns[term] = column
+            conn.execute(
+                'INSERT OR REPLACE INTO term_hits (term, covered, bits) VALUES (?, ?, ?)',
+                (term, len(column), np.packbits(column).tobytes())
+            )
+        conn.execute('COMMIT')
+        return stale
+
+    def _gather(self, terms: Iterable[str]) -> Tuple[np.ndarray, Dict[str, np.ndarray], List[str]]:
+        terms = list(dict.fromkeys(term.lower() for term in terms))
+        with self._lock:
+            with self._connect() as conn:
+                self._refresh_ids(conn)
+                self._load_columns(conn, terms)
+                scanned = self._extend_columns(conn, terms)
+            # _ids is replaced, never mutated, so this is a consistent snapshot
+            # A term is only missing when no resume is stored yet
+            return self._ids, {term: self._columns.get(term, _NO_HITS) for term in terms}, scanned
+
+    def _score(self, job_profile: JobProfile) -> Tuple[np.ndarray, Dict[str, np.ndarray], Dict[str, np.ndarray], List[str]]:
+        ids, columns, scanned = self._gather(job_profile.terms + EDUCATION_KEYWORDS)
+        rows = len(ids)
+
+        def category(terms, weight):
+            if not terms:
+                return np.zeros(rows)
+            # Duplicate terms count once per listing, as in match_skills
+            hits = np.sum([columns[term.lower()] for term in terms], axis=0, dtype=np.int64)
+            return hits / len(terms) * weight
+
+        scores = {
+            'must_have': category(job_profile.must_have_skills, 60),
+            'nice_to_have': category(job_profile.nice_to_have_skills, 20),
+            'industry': category(job_profile.industry_experience, 10),
+            'education': np.any([columns[keyword] for keyword in EDUCATION_KEYWORDS], axis=0) * 10
+        }
+        scores['total'] = scores['must_have'] + scores['nice_to_have'] + scores['industry'] + scores['education']
+        return ids, columns, scores, scanned
+
+    def top_k(self, job_profile: JobProfile, k: int = 50, min_score: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Return the k best-scoring stored resumes for a job profile.
+
+        Ties are broken by resume id, oldest first.
+
+        Args:
+            job_profile: Job spec to rank against
+            k: Number of candidates to return
+            min_score: Drop candidates whose total score is below this
+
+        Returns:
+            Ranked dicts with resume_id, candidate_name, filename and the
+            same score breakdown /process-resume reports
+        """
+        ids, columns, scores, _ = self._score(job_profile)
+        return self._rank(job_profile, ids, columns, scores, k, min_score)
+
+    def rescore(self,
+                previous: JobProfile,
+                job_profile: JobProfile,
+                k: int = 50,
+                min_score: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Re-rank the corpus after a job spec was edited.
+
+        Hits are memoized per (resume, term) in the term columns, so only
+        terms the matrix has never seen are scanned for; every score is then
+        recomputed from the cached bitsets.
+
+        Args:
+            previous: The spec before the edit
+            job_profile: The edited spec
+
+        Returns:
+            Dict with the added_terms and removed_terms of the edit, the
+            scanned_terms that had to be evaluated, the number of
+            changed_candidates whose total score moved, and the new ranked
+            candidates as returned by top_k
+        """
+        previous_terms = set(term.lower() for term in previous.terms)
+        new_terms = set(term.lower() for term in job_profile.terms)
+
+        # The previous spec is scored first: ids only grow, so the edited
+        # spec's scores cover every resume the previous ones do, and
+        # resumes stored in between count as changed
+        previous_ids, _, previous_scores, previous_scanned = self._score(previous)
+        ids, columns, scores, scanned = self._score(job_profile)
+        rows = len(previous_ids)
+        changed = int(np.count_nonzero(scores['total'][:rows] != previous_scores['total'])) + len(ids) - rows
+
+        return {
+            'added_terms': sorted(new_terms - previous_terms),
+            'removed_terms': sorted(previous_terms - new_terms),
+            'scanned_terms': list(dict.fromkeys(previous_scanned + scanned)),
+            'changed_candidates': changed,
+            'candidates': self._rank(job_profile, ids, columns, scores, k, min_score)
+        }
+
+    def _rank(self,
+              job_profile: JobProfile,
+              ids: np.ndarray,
+              columns: Dict[str, np.ndarray],
+              scores: Dict[str, np.ndarray],
+              k: int,
+              min_score: Optional[float]) -> List[Dict[str, Any]]:
+        total = scores['total']
+        candidates = np.arange(len(total)) if min_score is None else np.flatnonzero(total >= min_score)
+        if k <= 0 or not len(candidates):
+            return []
+        if k < len(candidates):
+            # Partition out the k best, then keep the oldest of the resumes
+            # tied with the k-th score so ties still go by id
+            candidate_totals = total[candidates]
+            threshold = candidate_totals[np.argpartition(-candidate_totals, k - 1)[k - 1]]
+            above = candidates[candidate_totals > threshold]
+            tied = candidates[candidate_totals == threshold][:k - len(above)]
+            candidates = np.concatenate([above, tied])
+        best = candidates[np.lexsort((candidates, -total[candidates]))].tolist()
+
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT id, candidate_name, filename FROM resumes WHERE id IN ({','.join('?' * len(best))})",
+                [int(ids[row]) for row in best]
+            )
+            details = {row['id']: row for row in rows}
+
+        ranked = []
+        for rank, row in enumerate(best, 1):
+            resume = details[int(ids[row])]
+            ranked.append({
+                'rank': rank,
+                'resume_id': resume['id'],
+                'candidate_name': resume['candidate_name'],
+                'filename': resume['filename'],
+                'total_score': float(total[row]),
+                'must_have_score': float(scores['must_have'][row]),
+                'nice_to_have_score': float(scores['nice_to_have'][row]),
+                'industry_score': float(scores['industry'][row]),
+                'education_score': int(scores['education'][row]),
+                'missing_must_have': [
+                    skill for skill in job_profile.must_have_skills if not columns[skill.lower()][row]
+                ]
+            })
+        return ranked
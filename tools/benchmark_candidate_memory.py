@@ -0,0 +1,84 @@
+from pathlib import Path
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from synthetic_corpus import make_resume_lines, SKILLS
+from src.parsers.section_segmenter import DEFAULT_SEGMENTER
+from src.processors.job_profile import JobProfile
+from src.processors.resume_model import ParsedResume
+from src.processors.resume_transformer import CandidateRecord, transform_parsed_resume
+
+def make_parsed_resumes(count: int, seed: int):
+    """Parser-shaped dicts for count distinct synthetic resumes."""
+    rng = random.Random(seed)
+    resumes = []
+    for i in range(count):
+        lines = make_resume_lines(random.Random(seed + i), rng.choice(['short', 'medium', 'long']))
+        resumes.append({'raw_text': '\n'.join(lines), 'sections': DEFAULT_SEGMENTER.segment(lines, strip_lines=True)})
+    return resumes
+
+def measure(build, count: int):
+    """Bytes per candidate allocated by build(), and the objects it built."""
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return allocated / count, objects
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory per held candidate: nested dicts against slotted records.")
+    parser.add_argument('-n', '--count', type=int, default=10000, help="Candidates held in memory")
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    parsed = make_parsed_resumes(args.count, args.seed)
+    profile = JobProfile(SKILLS[:5], SKILLS[5:9], ['healthcare'])
+    matches = [profile.match(resume['raw_text']) for resume in parsed]
+    text_bytes = sum(
+        sys.getsizeof(resume['raw_text']) + sum(sys.getsizeof(text) for text in resume['sections'].values())
+        for resume in parsed
+    ) / args.count
+
+    # Everything below is measured on top of the extracted text, which
+    # every representation shares
+    results = []
+    dict_parsed, _ = measure(lambda: [{'raw_text': r['raw_text'], 'sections': dict(r['sections'])} for r in parsed], args.count)
+    slot_parsed, _ = measure(lambda: [ParsedResume.from_dict(r) for r in parsed], args.count)
+    results.append(('parsed resume', dict_parsed, slot_parsed))
+
+    dict_candidate, candidate_dicts = measure(
+        lambda: [transform_parsed_resume(r, m) for r, m in zip(parsed, matches)], args.count
+    )
+    slot_candidate, _ = measure(lambda: [
+        (record.skill_assessment, record.experience, record.education, record.skills)
+        for record in (CandidateRecord.from_parsed(r, m) for r, m in zip(parsed, matches))
+    ], args.count)
+    results.append(('candidate data', dict_candidate, slot_candidate))
+
+    # What ranking many candidates holds: the parse plus its candidate data,
+    # against a record that extracts its candidate data on demand
+    slot_record, records = measure(lambda: [CandidateRecord.from_parsed(r, m) for r, m in zip(parsed, matches)], args.count)
+    results.append(('held for ranking', dict_parsed + dict_candidate, slot_record))
+
+    print(f"{args.count} candidates, {text_bytes:.0f} bytes of extracted text each (shared, not counted)\n")
+    print(f"{'bytes per candidate':<20} {'dicts':>9} {'slotted':>9} {'saved':>7}")
+    for name, dicts, slotted in results:
+        print(f"{name:<20} {dicts:>9.0f} {slotted:>9.0f} {1 - slotted / dicts:>7.0%}")
+
+    start = time.perf_counter()
+    rendered = [record.to_dict() for record in records]
+    to_dict_us = (time.perf_counter() - start) / args.count * 1e6
+    identical = rendered == candidate_dicts
+    print(f"\nto_dict(): {to_dict_us:.1f} us per candidate, identical to transform_parsed_resume: {'yes' if identical else 'NO'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+from pathlib import Path
+import argparse
+import random
+import sys
+import tempfile
+import time
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from synthetic_corpus import make_resume_lines, SKILLS
+from src.processors.job_profile import JobProfile
+from src.processors.skill_matcher import SkillMatcher
+from src.storage.corpus import CandidateCorpus
+from src.storage.skill_matrix import SkillMatrix
+
+BATCH_SIZE = 500
+
+def build_corpus(path: Path, count: int) -> CandidateCorpus:
+    corpus = CandidateCorpus(path)
+    for batch_start in range(corpus.count(), count, BATCH_SIZE):
+        corpus.add_many(
+            (f"synthetic-{i}", {'raw_text': '\n'.join(make_resume_lines(random.Random(i), 'medium')), 'sections': {}}, f"Candidate {i}", None)
+            for i in range(batch_start, min(batch_start + BATCH_SIZE, count))
+        )
+    return corpus
+
+def loop_top_k(corpus: CandidateCorpus, profile: JobProfile, k: int, min_score):
+    """Baseline: match_skills on every stored resume, then sort."""
+    matcher = SkillMatcher()
+    scored = []
+    with corpus._connect() as conn:
+        for row in conn.execute('SELECT id, raw_text FROM resumes ORDER BY id'):
+            result = matcher.match_skills(row['raw_text'], list(profile.must_have_skills),
+                                          list(profile.nice_to_have_skills), list(profile.industry_experience))
+            if min_score is None or result['total_score'] >= min_score:
+                scored.append((result['total_score'], row['id']))
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    return scored[:k]
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare vectorized corpus ranking against a match_skills loop.")
+    parser.add_argument('-n', '--count', type=int, default=5000, help="Synthetic resumes in the corpus")
+    parser.add_argument('-k', type=int, default=50)
+    parser.add_argument('--min-score', type=float)
+    parser.add_argument('--db', type=Path, help="Reuse or create the corpus here instead of a temp file")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    profiles = [
+        JobProfile(rng.sample(SKILLS, 5), rng.sample(SKILLS, 4), rng.sample(['healthcare', 'fintech', 'retail'], 1))
+        for _ in range(5)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = build_corpus(args.db or Path(tmp) / "corpus.sqlite3", args.count)
+        matrix = SkillMatrix(corpus)
+        print(f"{corpus.count()} resumes, top {args.k}\n")
+        print(f"{'profile':<9} {'loop ms':>9} {'cold ms':>9} {'warm ms':>9} {'identical':>10}")
+        for number, profile in enumerate(profiles, 1):
+            start = time.perf_counter()
+            expected = loop_top_k(corpus, profile, args.k, args.min_score)
+            loop_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            matrix.top_k(profile, args.k, args.min_score)
+            cold_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            ranked = matrix.top_k(profile, args.k, args.min_score)
+            warm_ms = (time.perf_counter() - start) * 1000
+
+            identical = [(r['total_score'], r['resume_id']) for r in ranked] == expected
+            print(f"{number:<9} {loop_ms:>9.1f} {cold_ms:>9.1f} {warm_ms:>9.2f} {'yes' if identical else 'NO':>10}")
+
+if __name__ == "__main__":
+    main()
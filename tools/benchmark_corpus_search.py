@@ -0,0 +1,80 @@
+from pathlib import Path
+import argparse
+import random
+import sys
+import tempfile
+import time
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from synthetic_corpus import make_resume_lines
+from src.processors.skill_matcher import compile_terms
+from src.storage.corpus import CandidateCorpus, parse_query
+
+BATCH_SIZE = 500
+
+QUERIES = [
+    'Apex AND CPQ AND NOT NetSuite',
+    'Health Cloud AND (LWC OR Aura)',
+    'Kubernetes AND Docker AND NOT AWS',
+    '"Release Management" OR MuleSoft',
+    'NOT Salesforce'
+]
+
+def scan_matches(node, found):
+    """Evaluate a parsed query against the terms a TermMatcher found."""
+    kind = node[0]
+    if kind == 'term':
+        return node[1].lower() in found
+    if kind == 'not':
+        return not scan_matches(node[1], found)
+    if kind == 'and':
+        return scan_matches(node[1], found) and scan_matches(node[2], found)
+    return scan_matches(node[1], found) or scan_matches(node[2], found)
+
+def query_terms(node):
+    if node[0] == 'term':
+        return [node[1]]
+    return [term for child in node[1:] for term in query_terms(child)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare indexed corpus search against scanning every resume.")
+    parser.add_argument('-n', '--count', type=int, default=5000, help="Synthetic resumes to store")
+    parser.add_argument('--db', type=Path, help="Reuse or create the corpus here instead of a temp file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = CandidateCorpus(args.db or Path(tmp) / "corpus.sqlite3")
+        texts = ['\n'.join(make_resume_lines(random.Random(i), 'medium')) for i in range(args.count)]
+        start = time.perf_counter()
+        resume_ids = []
+        for batch_start in range(0, args.count, BATCH_SIZE):
+            resume_ids += corpus.add_many(
+                (f"synthetic-{i}", {'raw_text': texts[i], 'sections': {}}, None, None)
+                for i in range(batch_start, min(batch_start + BATCH_SIZE, args.count))
+            )
+        texts = dict(zip(resume_ids, texts))
+        elapsed = time.perf_counter() - start
+        print(f"Stored {corpus.count()} resumes ({args.count / elapsed:.0f}/s)\n")
+
+        print(f"{'query':<36} {'matches':>8} {'index ms':>9} {'scan ms':>9} {'agree':>6}")
+        for query in QUERIES:
+            start = time.perf_counter()
+            result = corpus.search(query, limit=args.count)
+            index_ms = (time.perf_counter() - start) * 1000
+
+            # Baseline: lowercase and regex-scan every stored resume
+            tree = parse_query(query)
+            matcher = compile_terms(tuple(query_terms(tree)))
+            start = time.perf_counter()
+            scanned = {rid for rid, text in texts.items() if scan_matches(tree, matcher.find(text.lower()))}
+            scan_ms = (time.perf_counter() - start) * 1000
+
+            indexed = {row['id'] for row in result['results']}
+            print(f"{query:<36} {result['total']:>8} {index_ms:>9.1f} {scan_ms:>9.1f} "
+                  f"{'yes' if indexed == scanned else 'NO':>6}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+from pathlib import Path
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from synthetic_corpus import generate_corpus
+from src.parsers.parser_factory import DOCX_BACKENDS
+
+def measure(parser_class, contents, repeat):
+    """Return (median ms per document, max peak KiB) for one backend."""
+    latencies = []
+    for _ in range(repeat):
+        for content in contents:
+            start = time.perf_counter()
+            parser_class(content).parse()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    peak = 0
+    for content in contents:
+        tracemalloc.start()
+        parser_class(content).parse()
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return statistics.median(latencies), peak / 1024
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the python-docx and streaming DOCX backends.")
+    parser.add_argument('-n', '--count', type=int, default=40, help="Synthetic resumes (half are DOCX)")
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [p for p in generate_corpus(Path(tmp), args.count) if p.suffix == '.docx']
+        contents = [path.read_bytes() for path in paths]
+
+    mismatches = sum(
+        DOCX_BACKENDS['python-docx'](c).parse() != DOCX_BACKENDS['streaming'](c).parse()
+        for c in contents
+    )
+    print(f"{len(contents)} DOCX resumes, {mismatches} with different output\n")
+
+    print(f"{'backend':<12} {'p50 ms':>8} {'peak KiB':>10}")
+    for name, parser_class in DOCX_BACKENDS.items():
+        p50, peak = measure(parser_class, contents, args.repeat)
+        print(f"{name:<12} {p50:>8.2f} {peak:>10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+from pathlib import Path
+import argparse
+import sys
+import tempfile
+import time
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from synthetic_corpus import generate_corpus, SKILLS
+from src.parsers.pdf_backends import PDF_BACKENDS
+from src.parsers.pdf_parser import PDFParser
+from src.processors.skill_matcher import SkillMatcher
+
+REFERENCE_BACKEND = "pdfplumber"
+
+def normalize(text: str) -> str:
+    """Collapse whitespace so only word-level differences count."""
+    return ' '.join(text.split())
+
+def parse_all(backend: str, contents):
+    """Parse every document, returning (results, seconds, pages)."""
+    results = []
+    pages = 0
+    start = time.perf_counter()
+    for content in contents:
+        parser = PDFParser(content, backend=backend)
+        results.append(parser.parse())
+        pages += parser.page_count
+    return results, time.perf_counter() - start, pages
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare PDF text extraction backends on the synthetic corpus.")
+    parser.add_argument('-n', '--count', type=int, default=40, help="Synthetic resumes (half are PDF)")
+    parser.add_argument('--corpus-dir', type=Path, help="Reuse or create the corpus here")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = generate_corpus(args.corpus_dir or Path(tmp), args.count)
+        contents = [path.read_bytes() for path in paths if path.suffix == '.pdf']
+
+    matcher = SkillMatcher()
+    reference, _, _ = parse_all(REFERENCE_BACKEND, contents)
+    reference_scores = [matcher.match_skills(r['raw_text'], SKILLS[:10], SKILLS[10:20], SKILLS[20:]) for r in reference]
+
+    print(f"{len(contents)} PDF resumes; equivalence is measured against {REFERENCE_BACKEND}\n")
+    print(f"{'backend':<12} {'docs/s':>8} {'pages/s':>9} {'exact':>7} {'words':>7} {'sections':>9} {'scores':>7}")
+    for name in PDF_BACKENDS:
+        try:
+            results, seconds, pages = parse_all(name, contents)
+        except ImportError as e:
+            print(f"{name:<12} unavailable: {e}")
+            continue
+
+        exact = sum(r['raw_text'] == ref['raw_text'] for r, ref in zip(results, reference))
+        words = sum(normalize(r['raw_text']) == normalize(ref['raw_text']) for r, ref in zip(results, reference))
+        sections = sum(r['sections'].keys() == ref['sections'].keys() for r, ref in zip(results, reference))
+        scores = sum(
+            matcher.match_skills(r['raw_text'], SKILLS[:10], SKILLS[10:20], SKILLS[20:]) == score
+            for r, score in zip(results, reference_scores)
+        )
+        total = len(contents)
+        print(f"{name:<12} {total / seconds:>8.1f} {pages / seconds:>9.1f} "
+              f"{exact:>3}/{total:<3} {words:>3}/{total:<3} {sections:>4}/{total:<4} {scores:>3}/{total:<3}")
+
+if __name__ == "__main__":
+    main()
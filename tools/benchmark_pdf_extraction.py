@@ -0,0 +1,58 @@
+from pathlib import Path
+import argparse
+import random
+import sys
+import tempfile
+import time
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from synthetic_corpus import make_resume_lines, write_pdf
+from src.parsers.pdf_parser import PDFParser
+
+def make_pdf(path: Path, resumes: int, seed: int = 7):
+    """Write one long PDF made of several concatenated xl resumes."""
+    rng = random.Random(seed)
+    lines = [line for _ in range(resumes) for line in make_resume_lines(rng, 'xl')]
+    write_pdf(lines, path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare sequential, streaming and page-parallel PDF extraction.")
+    parser.add_argument('pdf', type=Path, nargs='?', help="PDF to extract (defaults to a synthetic long resume)")
+    parser.add_argument('-j', '--workers', type=int, nargs='+', default=[2, 4])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.pdf
+        if path is None:
+            path = Path(tmp) / "long_resume.pdf"
+            make_pdf(path, resumes=6)
+        content = path.read_bytes()
+
+        start = time.perf_counter()
+        sequential = PDFParser(content, page_workers=1)._extract_text()
+        sequential_time = time.perf_counter() - start
+
+        first_page_parser = PDFParser(content)
+        start = time.perf_counter()
+        next(first_page_parser.iter_pages())
+        first_page_time = time.perf_counter() - start
+
+        print(f"{path.name}: {first_page_parser.page_count} pages, {len(sequential)} chars")
+        print(f"{'mode':<14} {'seconds':>8} {'speedup':>8} {'identical':>10}")
+        print(f"{'sequential':<14} {sequential_time:>8.3f} {1:>7.1f}x {'yes':>10}")
+        print(f"{'first page':<14} {first_page_time:>8.3f} {'':>8} {'':>10}")
+
+        for workers in args.workers:
+            # The first parse starts the shared page pool; later ones reuse it
+            for label in ('workers', 'warm'):
+                start = time.perf_counter()
+                parallel = PDFParser(content, page_workers=workers)._extract_text()
+                elapsed = time.perf_counter() - start
+                print(f"{f'{workers} {label}':<14} {elapsed:>8.3f} {sequential_time / elapsed:>7.1f}x "
+                      f"{'yes' if parallel == sequential else 'NO':>10}")
+
+if __name__ == "__main__":
+    main()
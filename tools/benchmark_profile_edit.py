@@ -0,0 +1,58 @@
+from pathlib import Path
+import argparse
+import sys
+import tempfile
+import time
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from benchmark_corpus_rank import build_corpus, loop_top_k
+from src.processors.job_profile import JobProfile
+from src.storage.skill_matrix import SkillMatrix
+
+BASE_PROFILE = JobProfile(['Apex', 'CPQ', 'SOQL'], ['LWC', 'Visualforce'], ['healthcare'])
+
+# Each edit applies to the profile produced by the one before
+EDITS = [
+    ('add a must-have', lambda p: JobProfile(p.must_have_skills + ('Docker',), p.nice_to_have_skills, p.industry_experience)),
+    ('add a nice-to-have', lambda p: JobProfile(p.must_have_skills, p.nice_to_have_skills + ('MuleSoft',), p.industry_experience)),
+    ('remove a must-have', lambda p: JobProfile(p.must_have_skills[1:], p.nice_to_have_skills, p.industry_experience)),
+    ('move nice to must', lambda p: JobProfile(p.must_have_skills + p.nice_to_have_skills[:1], p.nice_to_have_skills[1:], p.industry_experience)),
+    ('restore the original', lambda p: BASE_PROFILE),
+]
+
+def main():
+    parser = argparse.ArgumentParser(description="Time corpus re-ranking after job spec edits against a full rescan.")
+    parser.add_argument('-n', '--count', type=int, default=5000, help="Synthetic resumes in the corpus")
+    parser.add_argument('-k', type=int, default=50)
+    parser.add_argument('--db', type=Path, help="Reuse or create the corpus here instead of a temp file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = build_corpus(args.db or Path(tmp) / "corpus.sqlite3", args.count)
+        matrix = SkillMatrix(corpus)
+        matrix.top_k(BASE_PROFILE, args.k)
+        print(f"{corpus.count()} resumes, top {args.k}, base profile ranked once\n")
+        print(f"{'edit':<22} {'rescan ms':>10} {'edit ms':>9} {'scanned':>8} {'changed':>8} {'identical':>10}")
+
+        profile = BASE_PROFILE
+        for name, edit in EDITS:
+            edited = edit(profile)
+
+            start = time.perf_counter()
+            expected = loop_top_k(corpus, edited, args.k, None)
+            rescan_ms = (time.perf_counter() - start) * 1000
+
+            start = time.perf_counter()
+            result = matrix.rescore(profile, edited, args.k)
+            edit_ms = (time.perf_counter() - start) * 1000
+
+            identical = [(c['total_score'], c['resume_id']) for c in result['candidates']] == expected
+            print(f"{name:<22} {rescan_ms:>10.1f} {edit_ms:>9.1f} {len(result['scanned_terms']):>8} "
+                  f"{result['changed_candidates']:>8} {'yes' if identical else 'NO':>10}")
+            profile = edited
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+from pathlib import Path
+import argparse
+import random
+import sys
+import tempfile
+import time
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from synthetic_corpus import make_resume_lines, write_docx, write_pdf, SKILLS
+from src.parsers.parser_factory import get_parser
+from src.pipeline import run_screening
+from src.processors.job_profile import JobProfile
+
+# (label, spec, min_score): specs most resumes pass early, and ones they fail
+SCREENS = [
+    ('must-have, common', JobProfile(['Salesforce', 'Apex']), None),
+    ('must-have, missing', JobProfile(['Salesforce', 'COBOL']), None),
+    ('score >= 70', JobProfile(['Salesforce', 'Apex'], ['SOQL', 'Java', 'Python']), 70.0),
+]
+
+def full_match(content: bytes, job_profile: JobProfile):
+    """What screening replaces: parse everything, then match."""
+    parsed = get_parser(content).parse()
+    return job_profile.match(parsed['raw_text'])
+
+def main():
+    parser = argparse.ArgumentParser(description="Screening with early termination against a full parse and match.")
+    parser.add_argument('-n', '--count', type=int, default=8, help="Resumes per format")
+    parser.add_argument('--lines-per-page', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        documents = {'pdf': [], 'docx': []}
+        for i in range(args.count):
+            lines = make_resume_lines(random.Random(args.seed + i), 'xl')
+            # Skills listed last, as many resumes do, so early pages hold less
+            lines.append('Skills: ' + ', '.join(random.Random(i).sample(SKILLS, 8)))
+            pdf_path, docx_path = Path(tmp) / f"{i}.pdf", Path(tmp) / f"{i}.docx"
+            write_pdf(lines, pdf_path, lines_per_page=args.lines_per_page)
+            write_docx(lines, docx_path)
+            for file_type, path in (('pdf', pdf_path), ('docx', docx_path)):
+                content = path.read_bytes()
+                # Pages or paragraphs in the document
+                units = sum(1 for _ in get_parser(content).iter_text())
+                documents[file_type].append((content, units))
+
+        print(f"{'format':<6} {'screen':<20} {'full ms':>8} {'screen ms':>10} {'units read':>11} {'passed':>7} {'agree':>6}")
+        for file_type, contents in documents.items():
+            for label, job_profile, min_score in SCREENS:
+                full_seconds = screen_seconds = 0.0
+                read = total = passed = agree = 0
+                for content, units in contents:
+                    start = time.perf_counter()
+                    expected = full_match(content, job_profile)
+                    full_seconds += time.perf_counter() - start
+
+                    start = time.perf_counter()
+                    response, _ = run_screening(content, None, job_profile, min_score)
+                    screen_seconds += time.perf_counter() - start
+
+                    if min_score is None:
+                        should_pass = not expected['must_have']['missing']
+                    else:
+                        should_pass = expected['total_score'] >= min_score
+                    # A screening that read everything reports the full result
+                    complete = not response['stopped_early']
+                    same = response['passed'] == should_pass and (
+                        not complete or response['skill_assessment']['total_score'] == expected['total_score']
+                    )
+                    read += response['stopped_at']['read']
+                    total += units
+                    passed += response['passed']
+                    agree += same
+                count = len(contents)
+                print(f"{file_type:<6} {label:<20} {full_seconds / count * 1000:>8.1f} {screen_seconds / count * 1000:>10.1f} "
+                      f"{read / total:>11.0%} {passed:>3}/{count:<3} {agree:>3}/{count}")
+
+if __name__ == "__main__":
+    main()
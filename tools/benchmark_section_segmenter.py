@@ -0,0 +1,71 @@
+from pathlib import Path
+import random
+import re
+import sys
+import time
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from synthetic_corpus import make_resume_lines
+from src.parsers.section_segmenter import SectionSegmenter
+
+LEGACY_SECTION_PATTERNS = {
+    'summary': r'(?i)(SUMMARY|PROFESSIONAL\s+SUMMARY|PROFILE|OBJECTIVE)',
+    'experience': r'(?i)(EXPERIENCE|WORK\s+EXPERIENCE|PROFESSIONAL\s+EXPERIENCE|EMPLOYMENT)',
+    'education': r'(?i)(EDUCATION|ACADEMIC|QUALIFICATIONS)',
+    'skills': r'(?i)(SKILLS|TECHNICAL\s+SKILLS|CORE\s+COMPETENCIES|COMPETENCIES)',
+    'certifications': r'(?i)(CERTIFICATIONS|CERTIFICATES|ACCREDITATIONS)',
+    'projects': r'(?i)(PROJECTS|KEY\s+PROJECTS)',
+    'references': r'(?i)(REFERENCES)',
+    'languages': r'(?i)(LANGUAGES|LANGUAGE\s+PROFICIENCY)',
+    'awards': r'(?i)(AWARDS|HONORS|ACHIEVEMENTS)'
+}
+
+def legacy_identify_sections(lines):
+    """The per-line loop PDFParser._identify_sections used to run."""
+    sections = {}
+    current_section = 'header'
+    section_text = []
+    for line in lines:
+        matched_section = None
+        for section, pattern in LEGACY_SECTION_PATTERNS.items():
+            if re.search(pattern, line):
+                matched_section = section
+                break
+        if matched_section:
+            if section_text:
+                sections[current_section] = '\n'.join(section_text)
+            current_section = matched_section
+            section_text = []
+        else:
+            section_text.append(line)
+    if section_text:
+        sections[current_section] = '\n'.join(section_text)
+    return sections
+
+def time_per_line(func, lines, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(lines)
+    return (time.perf_counter() - start) / repeat / len(lines) * 1e9
+
+def main():
+    segmenter = SectionSegmenter()
+    print(f"{'lines':>7} {'legacy ns/line':>15} {'segmenter ns/line':>18} {'speedup':>8} {'headers legacy/new':>19}")
+    for resumes in (1, 5, 20):
+        rng = random.Random(resumes)
+        # Concatenate xl resumes to get long, multi-page documents
+        lines = [line for _ in range(resumes) for line in make_resume_lines(rng, 'xl')]
+        legacy = time_per_line(legacy_identify_sections, lines, 5)
+        new = time_per_line(segmenter.segment, lines, 5)
+        legacy_headers = sum(
+            any(re.search(p, line) for p in LEGACY_SECTION_PATTERNS.values()) for line in lines
+        )
+        new_headers = sum(segmenter.classify(line) is not None for line in lines)
+        print(f"{len(lines):>7} {legacy:>15.0f} {new:>18.0f} {legacy / new:>7.1f}x "
+              f"{legacy_headers:>9}/{new_headers}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+from pathlib import Path
+import random
+import re
+import sys
+import time
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.processors.skill_matcher import SkillMatcher, compile_terms
+
+VOCABULARY = [
+    'salesforce', 'apex', 'cpq', 'soql', 'sosl', 'lwc', 'aura', 'visualforce',
+    'javascript', 'java', 'python', 'c++', 'c#', '.net', 'node.js', 'react',
+    'angular', 'sql', 'postgresql', 'mysql', 'netsuite', 'mulesoft', 'dell boomi',
+    'health cloud', 'sales cloud', 'service cloud', 'experience cloud', 'jira',
+    'confluence', 'agile', 'scrum', 'kanban', 'aws', 'azure', 'gcp', 'docker',
+    'kubernetes', 'terraform', 'rest', 'soap', 'graphql', 'healthcare', 'saas',
+    'fintech', 'insurance', 'retail', 'release management', 'ci/cd', 'git',
+]
+
+def legacy_match_skills(resume_text, must_have_skills, nice_to_have_skills=None, industry_experience=None):
+    """The per-term regex loop that SkillMatcher.match_skills used to run."""
+    nice_to_have_skills = nice_to_have_skills or []
+    industry_experience = industry_experience or []
+    resume_text = resume_text.lower()
+    
+    def found(term):
+        return re.search(r'\b' + re.escape(term.lower()) + r'\b', resume_text) is not None
+    
+    must_have_matches = []
+    must_have_missing = []
+    for skill in must_have_skills:
+        (must_have_matches if found(skill) else must_have_missing).append(skill)
+    nice_to_have_matches = [s for s in nice_to_have_skills if found(s)]
+    industry_matches = [s for s in industry_experience if found(s)]
+    has_education = any(re.search(p, resume_text) for p in [
+        r'\b(bachelor|master|phd|doctorate|degree|diploma|mba)\b',
+        r'\buniversity\b',
+        r'\bcollege\b'
+    ])
+    must_have_score = (len(must_have_matches) / len(must_have_skills)) * 60 if must_have_skills else 0
+    nice_to_have_score = (len(nice_to_have_matches) / len(nice_to_have_skills)) * 20 if nice_to_have_skills else 0
+    industry_score = (len(industry_matches) / len(industry_experience)) * 10 if industry_experience else 0
+    education_score = 10 if has_education else 0
+    return {
+        'must_have': {'matches': must_have_matches, 'missing': must_have_missing, 'score': must_have_score},
+        'nice_to_have': {'matches': nice_to_have_matches, 'score': nice_to_have_score},
+        'industry': {'matches': industry_matches, 'score': industry_score},
+        'education': {'present': has_education, 'score': education_score},
+        'total_score': must_have_score + nice_to_have_score + industry_score + education_score
+    }
+
+def make_terms(rng, count):
+    """Build a term list mixing real skills with synthetic ones."""
+    terms = list(VOCABULARY)
+    while len(terms) < count:
+        terms.append(f"{rng.choice(VOCABULARY)} {rng.choice(['platform', 'framework', 'api', 'suite', 'cloud'])} {len(terms)}")
+    rng.shuffle(terms)
+    return terms[:count]
+
+def make_resume(rng, words=3000):
+    """Build a resume-sized blob of text that mentions some of the vocabulary."""
+    filler = ['developed', 'managed', 'team', 'integration', 'solution', 'clients', 'university',
+              'delivered', 'project', 'built', 'and', 'the', 'with', 'for', '-', '•', '2019', '(2021)']
+    tokens = [rng.choice(VOCABULARY).upper() if rng.random() < 0.05 else rng.choice(filler) for _ in range(words)]
+    return ' '.join(tokens).replace(' - ', '\n- ')
+
+def check_equivalence(rng, rounds=300):
+    """Compare SkillMatcher against the legacy loop on randomized inputs."""
+    matcher = SkillMatcher()
+    for _ in range(rounds):
+        terms = make_terms(rng, rng.randint(1, 80)) + rng.sample(['', 'C', 'Java', 'SQL Server', 'R&D', 'e'], 2)
+        text = make_resume(rng, words=rng.randint(0, 400))
+        split_a, split_b = sorted(rng.sample(range(len(terms) + 1), 2))
+        args = (text, terms[:split_a], terms[split_a:split_b], terms[split_b:])
+        assert matcher.match_skills(*args) == legacy_match_skills(*args), args
+    print(f"Equivalence check passed on {rounds} randomized cases")
+
+def time_call(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def main():
+    rng = random.Random(42)
+    check_equivalence(rng)
+    
+    resume = make_resume(rng)
+    matcher = SkillMatcher()
+    print(f"\nResume text: {len(resume)} chars")
+    print(f"{'terms':>6} {'legacy ms':>10} {'compiled ms':>12} {'warm ms':>9} {'speedup':>8}")
+    for count in (10, 30, 60, 100, 150, 300):
+        terms = make_terms(rng, count)
+        third = len(terms) // 3
+        args = (resume, terms[:third], terms[third:2 * third], terms[2 * third:])
+        repeat = 20
+        
+        legacy = time_call(lambda: legacy_match_skills(*args), repeat)
+        
+        def cold():
+            compile_terms.cache_clear()
+            matcher.match_skills(*args)
+        compiled = time_call(cold, repeat)
+        warm = time_call(lambda: matcher.match_skills(*args), repeat)
+        
+        print(f"{count:>6} {legacy:>10.2f} {compiled:>12.2f} {warm:>9.2f} {legacy / warm:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
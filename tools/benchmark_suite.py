@@ -0,0 +1,182 @@
+from pathlib import Path
+from typing import Callable, Dict, List
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from docx import Document
+
+from synthetic_corpus import DEFAULT_CORPUS_DIR, generate_corpus, SKILLS
+from src.parsers.parser_factory import get_parser
+from src.parsers.pdf_parser import PDFParser
+from src.processors.skill_matcher import SkillMatcher
+from src.processors.resume_transformer import transform_parsed_resume
+from src.formatters.dynamic_resume_formatter import DynamicResumeFormatter
+
+DEFAULT_BASELINE = Path(__file__).parent / "benchmark_baseline.json"
+TERM_COUNTS = (10, 60, 150)
+
+def make_terms(count: int) -> List[str]:
+    """Deterministic job-spec terms: real skills padded with synthetic ones."""
+    terms = list(SKILLS)
+    while len(terms) < count:
+        terms.append(f"{SKILLS[len(terms) % len(SKILLS)]} platform {len(terms)}")
+    return terms[:count]
+
+def extract(parser):
+    """The extraction half of parser.parse(): raw text (PDF) or paragraphs (DOCX)."""
+    if isinstance(parser, PDFParser):
+        return parser._extract_text()
+    return [para.text for para in Document(parser._open_source()).paragraphs]
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+def run_stage(calls: List[Callable[[], object]], repeat: int) -> Dict[str, float]:
+    """
+    Time one pipeline stage over every document in the corpus.
+
+    Latencies are measured without tracemalloc; peak memory is measured
+    in a separate pass so tracing overhead does not skew the timings.
+    """
+    latencies = []
+    for _ in range(repeat):
+        for call in calls:
+            start = time.perf_counter()
+            call()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    peak = 0
+    for call in calls:
+        tracemalloc.start()
+        call()
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    total_seconds = sum(latencies) / 1000
+    return {
+        'docs_per_sec': len(latencies) / total_seconds if total_seconds else float('inf'),
+        'p50_ms': statistics.median(latencies),
+        'p95_ms': percentile(latencies, 95),
+        'p99_ms': percentile(latencies, 99),
+        'peak_kib': peak / 1024
+    }
+
+def run_suite(paths: List[Path], repeat: int) -> Dict[str, Dict[str, float]]:
+    """Run every stage against the corpus and return metrics keyed by stage name."""
+    contents = [path.read_bytes() for path in paths]
+    pdfs = [content for content in contents if get_parser(content).__class__ is PDFParser]
+    docxs = [content for content in contents if get_parser(content).__class__ is not PDFParser]
+
+    # Inputs for the later stages, computed once up front
+    extracted = {id(content): extract(get_parser(content)) for content in contents}
+    parsed = [get_parser(content).parse() for content in contents]
+
+    results = {}
+    results['extract_pdf'] = run_stage([lambda c=c: extract(get_parser(c)) for c in pdfs], repeat)
+    results['extract_docx'] = run_stage([lambda c=c: extract(get_parser(c)) for c in docxs], repeat)
+    results['identify_sections'] = run_stage([
+        lambda c=c: get_parser(c)._identify_sections(extracted[id(c)]) for c in contents
+    ], repeat)
+
+    matcher = SkillMatcher()
+    for count in TERM_COUNTS:
+        terms = make_terms(count)
+        third = count // 3
+        spec = (terms[:third], terms[third:2 * third], terms[2 * third:])
+        results[f'match_skills_{count}'] = run_stage([
+            lambda p=p: matcher.match_skills(p['raw_text'], *spec) for p in parsed
+        ], repeat)
+
+    spec_terms = make_terms(60)
+    skill_matches = [matcher.match_skills(p['raw_text'], spec_terms[:20], spec_terms[20:40], spec_terms[40:]) for p in parsed]
+    results['transform'] = run_stage([
+        lambda p=p, m=m: transform_parsed_resume(p, m) for p, m in zip(parsed, skill_matches)
+    ], repeat)
+
+    try:
+        formatter = DynamicResumeFormatter()
+    except FileNotFoundError as e:
+        print(f"Skipping format_resume: {e}", file=sys.stderr)
+    else:
+        candidates = [transform_parsed_resume(p, m) for p, m in zip(parsed, skill_matches)]
+        results['format_resume'] = run_stage([
+            lambda c=c: formatter.render_to_bytes(c) for c in candidates
+        ], repeat)
+
+    return results
+
+def compare(results: Dict[str, Dict[str, float]],
+            baseline: Dict[str, Dict[str, float]],
+            threshold: float,
+            min_delta_ms: float = 0.5) -> List[str]:
+    """
+    Compare p50 latency and peak memory against a stored baseline.
+
+    Latency changes smaller than min_delta_ms are ignored, since relative
+    noise on sub-millisecond stages is large.
+
+    Returns:
+        Descriptions of every metric that regressed by more than threshold
+    """
+    regressions = []
+    for stage, metrics in results.items():
+        if stage not in baseline:
+            continue
+        for key in ('p50_ms', 'peak_kib'):
+            before, after = baseline[stage][key], metrics[key]
+            if key == 'p50_ms' and after - before < min_delta_ms:
+                continue
+            if before and (after - before) / before > threshold:
+                regressions.append(f"{stage} {key}: {before:.2f} -> {after:.2f} (+{(after - before) / before:.0%})")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every pipeline stage on a synthetic corpus.")
+    parser.add_argument('--corpus-dir', type=Path, default=DEFAULT_CORPUS_DIR)
+    parser.add_argument('-n', '--count', type=int, default=40, help="Number of synthetic resumes")
+    parser.add_argument('--seed', type=int, default=1234)
+    parser.add_argument('--repeat', type=int, default=3, help="Timing passes over the corpus")
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help="Store these results as the new baseline")
+    parser.add_argument('--no-baseline', action='store_true', help="Only report the results, without comparing")
+    parser.add_argument('--threshold', type=float, default=0.20, help="Allowed regression before failing (0.20 = 20%%)")
+    parser.add_argument('--min-delta-ms', type=float, default=0.5, help="Ignore latency changes smaller than this")
+    args = parser.parse_args()
+
+    # Fail before the slow run: a missing baseline would otherwise pass silently
+    if not (args.save_baseline or args.no_baseline or args.baseline.exists()):
+        parser.error(f"no baseline at {args.baseline}; create one with --save-baseline, or pass --no-baseline")
+
+    paths = generate_corpus(args.corpus_dir, args.count, args.seed)
+    results = run_suite(paths, args.repeat)
+
+    print(f"{'stage':<20} {'docs/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'peak KiB':>10}")
+    for stage, m in results.items():
+        print(f"{stage:<20} {m['docs_per_sec']:>10.1f} {m['p50_ms']:>9.3f} {m['p95_ms']:>9.3f} "
+              f"{m['p99_ms']:>9.3f} {m['peak_kib']:>10.1f}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2))
+        print(f"\nBaseline saved to {args.baseline}")
+        return
+
+    if not args.no_baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"\nRegressions beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+if __name__ == "__main__":
+    main()
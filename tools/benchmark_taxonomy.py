@@ -0,0 +1,117 @@
+from pathlib import Path
+import argparse
+import json
+import random
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from synthetic_corpus import make_resume_lines
+from src.processors.skill_taxonomy import SkillTaxonomy, compile_taxonomy
+from src.processors.term_matcher import TermMatcher
+
+def make_taxonomy(skills: int, rng: random.Random):
+    """A synthetic taxonomy of canonical skills with one to five aliases each."""
+    def word():
+        return ''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(3, 10)))
+    return {f"skill {i} {word()}": [f"{word()} {i}" for _ in range(rng.randint(1, 5))] for i in range(skills)}
+
+def with_aliases(text: str, groups, rng: random.Random) -> str:
+    """Write about half of the taxonomy skills in a resume as one of their aliases."""
+    for canonical, aliases in groups.items():
+        if aliases and rng.random() < 0.5:
+            alias = rng.choice(aliases)
+            text = re.sub(r'\b' + re.escape(canonical) + r'\b', alias, text, flags=re.IGNORECASE)
+    return text
+
+def main():
+    parser = argparse.ArgumentParser(description="Open cost of the mapped skill taxonomy and matching through its aliases.")
+    parser.add_argument('--skills', type=int, default=50000, help="Canonical skills in the synthetic taxonomy")
+    parser.add_argument('-n', '--count', type=int, default=500, help="Resumes to match")
+    parser.add_argument('--seed', type=int, default=11)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "taxonomy.json"
+        compiled = Path(tmp) / "taxonomy.bin"
+        big = make_taxonomy(args.skills, rng)
+        source.write_text(json.dumps(big))
+        aliases = compile_taxonomy(big, compiled)
+
+        # What a worker pays to get at the taxonomy: parsing it into dicts,
+        # against mapping the compiled file
+        tracemalloc.start()
+        start = time.perf_counter()
+        with open(source) as f:
+            loaded = json.load(f)
+        lookup = {alias.lower(): canonical for canonical, names in loaded.items() for alias in [canonical, *names]}
+        json_ms = (time.perf_counter() - start) * 1000
+        json_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del loaded, lookup
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        taxonomy = SkillTaxonomy(compiled)
+        map_ms = (time.perf_counter() - start) * 1000
+        map_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        probes = [rng.choice(list(big)) for _ in range(2000)]
+        start = time.perf_counter()
+        for term in probes:
+            taxonomy.expand(term)
+        expand_us = (time.perf_counter() - start) / len(probes) * 1e6
+        taxonomy.close()
+
+        print(f"taxonomy: {args.skills} skills, {aliases} aliases, {compiled.stat().st_size / 1024:.0f} KiB compiled")
+        print(f"{'per process':<22} {'ms':>8} {'heap KiB':>9}")
+        print(f"{'json.load + dict':<22} {json_ms:>8.1f} {json_bytes / 1024:>9.0f}")
+        print(f"{'SkillTaxonomy (mmap)':<22} {map_ms:>8.3f} {map_bytes / 1024:>9.1f}")
+        print(f"expand(): {expand_us:.1f} us per term\n")
+
+    # Matching: a spec stuffed with every variant against one term per skill
+    # normalized through the shipped taxonomy
+    default_source = Path(__file__).parent / "skill_taxonomy.json"
+    groups = json.loads(default_source.read_text())
+    resumes = [
+        with_aliases('\n'.join(make_resume_lines(random.Random(args.seed + i), 'medium')), groups, rng).lower()
+        for i in range(args.count)
+    ]
+    canonical_terms = ['javascript', 'salesforce', 'aws', 'kubernetes', 'rest', 'mulesoft', 'dell boomi', 'healthcare']
+    stuffed_terms = [alias for term in canonical_terms for alias in [term, *groups[term]]]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        compiled = Path(tmp) / "skill_taxonomy.bin"
+        compile_taxonomy(groups, compiled)
+        taxonomy = SkillTaxonomy(compiled)
+        runs = [
+            ('canonical, literal', TermMatcher(canonical_terms)),
+            ('stuffed, literal', TermMatcher(stuffed_terms)),
+            ('canonical, taxonomy', TermMatcher(canonical_terms, taxonomy)),
+        ]
+        print(f"{args.count} resumes, {len(canonical_terms)} skills ({len(stuffed_terms)} terms when stuffed)")
+        print(f"{'spec':<22} {'terms':>6} {'ms/resume':>10} {'skills found':>13}")
+        for name, matcher in runs:
+            best = float('inf')
+            for _ in range(3):
+                start = time.perf_counter()
+                found = [matcher.find(text) for text in resumes]
+                best = min(best, time.perf_counter() - start)
+            if matcher.terms == frozenset(stuffed_terms):
+                owner = {alias: term for term in canonical_terms for alias in [term, *groups[term]]}
+                hits = sum(len({owner[alias] for alias in terms}) for terms in found)
+            else:
+                hits = sum(len(terms) for terms in found)
+            print(f"{name:<22} {len(matcher.terms):>6} {best / len(resumes) * 1000:>10.3f} {hits:>13}")
+        taxonomy.close()
+
+if __name__ == "__main__":
+    main()
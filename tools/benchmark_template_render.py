@@ -0,0 +1,75 @@
+from pathlib import Path
+import io
+import statistics
+import sys
+import time
+import zipfile
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from docxtpl import DocxTemplate
+from src.formatters.dynamic_resume_formatter import DynamicResumeFormatter, render_template
+
+def sample_candidate():
+    return {
+        'name': 'Jane Doe',
+        'title': 'Senior Salesforce Developer',
+        'summary_points': ['Certified Salesforce Administrator, Developer, and Consultant'] * 4,
+        'education': [{'degree': 'Master of Computer Science', 'institution': 'Stanford University', 'year': '2015'}],
+        'certifications': ['Salesforce Certified Platform Developer II', 'AWS Certified Solutions Architect'],
+        'experience': [
+            {
+                'company': f'Company {i}',
+                'location': 'San Francisco, CA',
+                'dates': 'Jan 2022 - Present',
+                'role': 'Senior Salesforce Developer',
+                'bullets': ['Lead a team of 5 developers implementing complex CPQ solutions'] * 4
+            }
+            for i in range(5)
+        ],
+        'skills': {'Development': ['Apex', 'JavaScript', 'LWC', 'Aura', 'SOQL']}
+    }
+
+def cold_render(template_path, context):
+    """What format_resume did before: re-read and re-parse the template every time."""
+    output = io.BytesIO()
+    doc = DocxTemplate(template_path)
+    doc.render(context)
+    doc.save(output)
+    return output.getvalue()
+
+def warm_render(template_path, context):
+    output = io.BytesIO()
+    render_template(template_path, context, output)
+    return output.getvalue()
+
+def document_xml(docx_bytes):
+    with zipfile.ZipFile(io.BytesIO(docx_bytes)) as zf:
+        return zf.read('word/document.xml')
+
+def measure(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+def main():
+    template_path = DynamicResumeFormatter().template_path
+    context = {'candidate': sample_candidate(), 'current_date': '2025-01-01 00:00:00'}
+    
+    assert document_xml(cold_render(template_path, context)) == document_xml(warm_render(template_path, context)), \
+        "Cached rendering produced a different document"
+    print("Cached and uncached renders produce identical document.xml")
+    
+    repeat = 50
+    for label, func in (('cold', cold_render), ('warm', warm_render)):
+        timings = measure(lambda: func(template_path, context), repeat)
+        print(f"{label:>5}: median {statistics.median(timings):.2f} ms, "
+              f"p95 {sorted(timings)[int(repeat * 0.95) - 1]:.2f} ms over {repeat} renders")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+from pathlib import Path
+import argparse
+import random
+import sys
+import tempfile
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from synthetic_corpus import make_resume_lines, write_pdf
+from src.parsers.pdf_parser import PDFParser
+
+# Peak traced memory allowed for a bounded-memory parse of the test document
+DEFAULT_CEILING_MIB = 16
+
+def make_long_pdf(path: Path, min_pages: int, seed: int = 11):
+    """Write a portfolio-sized PDF of at least min_pages pages (55 lines each)."""
+    rng = random.Random(seed)
+    lines = []
+    while len(lines) < min_pages * 55:
+        lines.extend(make_resume_lines(rng, 'xl'))
+    write_pdf(lines, path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Fail if bounded-memory PDF parsing exceeds its memory ceiling.")
+    parser.add_argument('--pages', type=int, default=120)
+    parser.add_argument('--ceiling-mib', type=float, default=DEFAULT_CEILING_MIB)
+    parser.add_argument('--compare', action='store_true', help="Also measure the unbounded mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "portfolio.pdf"
+        make_long_pdf(path, args.pages)
+
+        bounded = PDFParser(path, bounded_memory=True, track_memory=True, max_pages=0)
+        bounded.parse()
+        peak_mib = bounded.peak_memory_bytes / 2**20
+        print(f"{bounded.page_count} pages, bounded peak: {peak_mib:.1f} MiB (ceiling {args.ceiling_mib} MiB)")
+
+        if args.compare:
+            unbounded = PDFParser(path, bounded_memory=False, track_memory=True, max_pages=0)
+            unbounded.parse()
+            print(f"{unbounded.page_count} pages, unbounded peak: {unbounded.peak_memory_bytes / 2**20:.1f} MiB")
+
+    if peak_mib > args.ceiling_mib:
+        print("Memory ceiling exceeded", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+from pathlib import Path
+import sys
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src.parsers.section_segmenter import SectionSegmenter
+
+# (line, section it starts, or None for body text)
+CASES = [
+    ('Experience', 'experience'),
+    ('WORK EXPERIENCE:', 'experience'),
+    ('WORKEXPERIENCE', 'experience'),
+    ('Technical Skills', 'skills'),
+    ('Skills & Certifications', 'skills'),
+    ('Skills, Certifications & Awards', 'skills'),
+    ('Technical Skills / Tools', 'skills'),
+    ('Education and Training', 'education'),
+    ('EDUCATION & CERTIFICATIONS:', 'education'),
+    ('Summary -', 'summary'),
+    # Body lines that start with a header word
+    ('Skills and experience with Java', None),
+    ('Experience, Salesforce admin', None),
+    ('Experience with Salesforce CPQ', None),
+    ('Education and Training in Java', None),
+    ('Skills: Apex, SOQL, LWC', None),
+    ('Led the experience redesign', None),
+]
+
+def main():
+    segmenter = SectionSegmenter()
+    failures = 0
+    for line, expected in CASES:
+        got = segmenter.classify(line)
+        if got != expected:
+            failures += 1
+            print(f"{line!r}: expected {expected}, got {got}")
+    print(f"{len(CASES) - failures}/{len(CASES)} lines classified as expected")
+    if failures:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
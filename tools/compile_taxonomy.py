@@ -0,0 +1,41 @@
+from pathlib import Path
+import argparse
+import json
+import sys
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from src import config
+from src.processors.skill_taxonomy import SkillTaxonomy, compile_taxonomy
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile a canonical skill -> aliases JSON file into the mapped taxonomy.")
+    parser.add_argument('source', nargs='?', type=Path, default=Path(__file__).parent / "skill_taxonomy.json",
+                        help="JSON object of canonical skill -> list of aliases")
+    parser.add_argument('-o', '--output', type=Path, default=config.SKILL_TAXONOMY_PATH,
+                        help="Compiled file (default: RESUME_SKILL_TAXONOMY_PATH)")
+    parser.add_argument('--lookup', nargs='*', default=[], help="Terms to look up in the compiled file")
+    args = parser.parse_args()
+
+    with open(args.source, encoding='utf-8') as f:
+        groups = json.load(f)
+    try:
+        aliases = compile_taxonomy(groups, args.output)
+    except ValueError as e:
+        parser.error(str(e))
+
+    taxonomy = SkillTaxonomy(args.output)
+    print(f"{len(groups)} skills, {aliases} aliases -> {args.output} "
+          f"({args.output.stat().st_size} bytes, fingerprint {taxonomy.fingerprint})")
+    for term in args.lookup:
+        canonical = taxonomy.canonical(term)
+        if canonical is None:
+            print(f"  {term!r}: not in the taxonomy")
+        else:
+            print(f"  {term!r} -> {canonical!r}: {', '.join(taxonomy.expand(term))}")
+    taxonomy.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+from pathlib import Path
+from typing import List, Optional
+import argparse
+import random
+import tempfile
+
+from docx import Document
+
+# Where benchmarks keep the generated corpus between runs, outside the tree
+DEFAULT_CORPUS_DIR = Path(tempfile.gettempdir()) / "resume_bench_corpus"
+
+FIRST_NAMES = ['Jane', 'John', 'Priya', 'Wei', 'Carlos', 'Amara', 'Olga', 'Kenji', 'Fatima', 'Liam']
+LAST_NAMES = ['Doe', 'Smith', 'Patel', 'Chen', 'Garcia', 'Okafor', 'Ivanova', 'Tanaka', 'Haddad', 'Murphy']
+TITLES = ['Senior Salesforce Developer', 'Salesforce Administrator', 'CPQ Consultant',
+          'Technical Program Manager', 'Full Stack Engineer', 'Data Engineer']
+COMPANIES = ['Cloudforce Solutions', 'TechHealth Systems', 'Global SaaS Innovations', 'Acme Retail',
+             'Northwind Insurance', 'Bluewave Fintech', 'Summit Health', 'Orbit Logistics']
+LOCATIONS = ['San Francisco, CA', 'Boston, MA', 'Austin, TX', 'Chicago, IL', 'Remote']
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+SKILLS = ['Salesforce', 'Apex', 'CPQ', 'SOQL', 'SOSL', 'LWC', 'Aura', 'Visualforce', 'JavaScript',
+          'Python', 'Java', 'SQL', 'NetSuite', 'MuleSoft', 'Dell Boomi', 'Health Cloud', 'Sales Cloud',
+          'Service Cloud', 'JIRA', 'Confluence', 'Agile', 'Scrum', 'AWS', 'Azure', 'Docker',
+          'Kubernetes', 'REST', 'GraphQL', 'Git', 'Release Management']
+VERBS = ['Led', 'Built', 'Designed', 'Implemented', 'Migrated', 'Automated', 'Delivered', 'Integrated']
+OBJECTS = ['a pricing engine', 'an approval workflow', 'the data warehouse', 'a patient intake portal',
+           'the CI pipeline', 'a lead scoring model', 'customer dashboards', 'a billing integration']
+OUTCOMES = ['reducing quote time by 40%', 'for 50+ sales reps', 'saving 200 hours per quarter',
+            'across three business units', 'with 92% test coverage', 'ahead of schedule']
+DEGREES = ['Master of Computer Science, Stanford University (2015)',
+           'Bachelor of Science in Information Technology, University of California (2013)',
+           'MBA, Boston College (2018)', 'Diploma in Software Engineering, City College (2010)']
+CERTIFICATIONS = ['Salesforce Certified Platform Developer II', 'Salesforce Certified Administrator',
+                  'Salesforce Certified CPQ Specialist', 'AWS Certified Solutions Architect',
+                  'Certified Scrum Master']
+
+# Header spellings per section, so layouts vary the way real resumes do
+SECTION_HEADERS = {
+    'summary': ['PROFESSIONAL SUMMARY', 'Summary', 'PROFILE', 'Objective'],
+    'experience': ['PROFESSIONAL EXPERIENCE', 'Work Experience', 'EMPLOYMENT', 'Experience'],
+    'education': ['EDUCATION', 'Education', 'ACADEMIC QUALIFICATIONS'],
+    'skills': ['TECHNICAL SKILLS', 'Skills', 'CORE COMPETENCIES'],
+    'certifications': ['CERTIFICATIONS', 'Certificates'],
+    'projects': ['KEY PROJECTS', 'Projects'],
+    'awards': ['AWARDS', 'Honors']
+}
+
+# Number of jobs per resume for each size class; 'xl' runs to many pages
+SIZES = {'short': (1, 2), 'medium': (3, 5), 'long': (8, 14), 'xl': (25, 40)}
+
+def _bullet(rng: random.Random) -> str:
+    return f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(SKILLS)} {rng.choice(OUTCOMES)}"
+
+def make_resume_lines(rng: random.Random, size: str = 'medium') -> List[str]:
+    """
+    Build the text lines of one synthetic resume.
+
+    Args:
+        rng: Seeded random generator, so corpora are reproducible
+        size: One of SIZES, controlling the number of jobs
+
+    Returns:
+        Lines of text, with blank lines between blocks
+    """
+    lines = [f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+             f"{rng.choice(LOCATIONS)} | name{rng.randint(100, 999)}@example.com", '']
+
+    sections = ['summary', 'experience', 'education', 'skills']
+    sections += rng.sample(['certifications', 'projects', 'awards'], rng.randint(0, 3))
+    rng.shuffle(sections)
+
+    for section in sections:
+        lines.append(rng.choice(SECTION_HEADERS[section]))
+        if section == 'summary':
+            lines.append(rng.choice(TITLES))
+            lines.extend(_bullet(rng) for _ in range(rng.randint(2, 5)))
+        elif section == 'experience':
+            low, high = SIZES[size]
+            for _ in range(rng.randint(low, high)):
+                start = rng.randint(2005, 2022)
+                lines.append(f"{rng.choice(COMPANIES)}, {rng.choice(LOCATIONS)}")
+                lines.append(f"{rng.choice(MONTHS)} {start} - {rng.choice(MONTHS)} {start + rng.randint(1, 3)}")
+                lines.append(rng.choice(TITLES))
+                lines.extend(_bullet(rng) for _ in range(rng.randint(3, 8)))
+                lines.append('')
+        elif section == 'education':
+            lines.extend(rng.sample(DEGREES, rng.randint(1, 2)))
+        elif section == 'skills':
+            if rng.random() < 0.5:
+                for category in ('Development:', 'Platforms:'):
+                    lines.append(category)
+                    lines.append(', '.join(rng.sample(SKILLS, rng.randint(4, 8))))
+            else:
+                lines.append(', '.join(rng.sample(SKILLS, rng.randint(6, 12))))
+        elif section == 'certifications':
+            lines.extend(rng.sample(CERTIFICATIONS, rng.randint(1, 3)))
+        elif section == 'projects':
+            lines.extend(_bullet(rng) for _ in range(rng.randint(2, 4)))
+        elif section == 'awards':
+            lines.append(f"President's Club {rng.randint(2010, 2023)}")
+        lines.append('')
+
+    return lines
+
+def _pdf_escape(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+def write_pdf(lines: List[str], path: Path, lines_per_page: int = 55):
+    """Write lines as a plain-text PDF using the built-in Helvetica font."""
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    objects = []
+    font_id = 3
+    page_ids = []
+    for page_lines in pages:
+        stream = ['BT', '/F1 10 Tf', '14 TL', '50 760 Td']
+        for line in page_lines:
+            stream.append(f"({_pdf_escape(line)}) Tj T*")
+        stream.append('ET')
+        content = '\n'.join(stream).encode('latin-1', 'replace')
+        content_id = 4 + 2 * len(page_ids)
+        page_id = content_id + 1
+        page_ids.append(page_id)
+        objects.append((content_id, b'<< /Length %d >>\nstream\n' % len(content) + content + b'\nendstream'))
+        objects.append((page_id, (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {content_id} 0 R >>"
+        ).encode()))
+
+    kids = ' '.join(f"{page_id} 0 R" for page_id in page_ids)
+    objects.append((1, b'<< /Type /Catalog /Pages 2 0 R >>'))
+    objects.append((2, f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()))
+    objects.append((font_id, b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>'))
+    objects.sort()
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = {}
+    for obj_id, body in objects:
+        offsets[obj_id] = len(out)
+        out += b'%d 0 obj\n' % obj_id + body + b'\nendobj\n'
+    xref_offset = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    for obj_id, _ in objects:
+        out += b'%010d 00000 n \n' % offsets[obj_id]
+    out += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref_offset)
+    path.write_bytes(bytes(out))
+
+def write_docx(lines: List[str], path: Path):
+    """Write lines as paragraphs of a .docx document."""
+    doc = Document()
+    for line in lines:
+        doc.add_paragraph(line)
+    doc.save(path)
+
+def generate_corpus(out_dir: Path, count: int = 40, seed: int = 1234, sizes: Optional[List[str]] = None) -> List[Path]:
+    """
+    Generate a reproducible corpus of PDF and DOCX resumes.
+
+    Files are only written if missing, so repeated runs reuse the corpus.
+
+    Args:
+        out_dir: Directory to write the corpus into
+        count: Number of resumes; alternates between PDF and DOCX
+        seed: Seed for the random generator
+        sizes: Size classes to cycle through (defaults to all of SIZES)
+
+    Returns:
+        Paths of the generated files
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(exist_ok=True, parents=True)
+    sizes = sizes or list(SIZES)
+
+    paths = []
+    for i in range(count):
+        size = sizes[i % len(sizes)]
+        extension = 'pdf' if i % 2 == 0 else 'docx'
+        path = out_dir / f"resume_{seed}_{i:04d}_{size}.{extension}"
+        if not path.exists():
+            lines = make_resume_lines(random.Random(seed * 100003 + i), size)
+            if extension == 'pdf':
+                write_pdf(lines, path)
+            else:
+                write_docx(lines, path)
+        paths.append(path)
+    return paths
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic resume corpus.")
+    parser.add_argument('out_dir', type=Path)
+    parser.add_argument('-n', '--count', type=int, default=40)
+    parser.add_argument('--seed', type=int, default=1234)
+    args = parser.parse_args()
+
+    paths = generate_corpus(args.out_dir, args.count, args.seed)
+    print(f"Generated {len(paths)} resumes in {args.out_dir}")
+
+if __name__ == "__main__":
+    main()